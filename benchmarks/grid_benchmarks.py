@@ -0,0 +1,159 @@
+"""Time the enrichment of the grid data frames of the USA TAMU and HIFLD models and
+the application of a change table adding many elements to the USA grid. Run on two
+revisions to compare them::
+
+    python benchmarks/grid_benchmarks.py --repeat 5 --n-elements 2000
+"""
+import argparse
+import copy
+import timeit
+
+import numpy as np
+
+from powersimdata.input.change_table import ChangeTable
+from powersimdata.input.converter.helpers import (
+    add_coord_to_grid_data_frames,
+    add_interconnect_to_grid_data_frames,
+    add_zone_to_grid_data_frames,
+)
+from powersimdata.input.grid import Grid
+from powersimdata.input.transform_grid import (
+    TransformGrid,
+    voltage_to_x_per_distance,
+)
+from powersimdata.network.hifld.model import HIFLD
+from powersimdata.network.usa_tamu.model import TAMU
+
+_models = {"usa_tamu": TAMU, "hifld": HIFLD}
+
+
+def _best_of(func, setup, repeat):
+    """Time a function.
+
+    :param callable func: function taking the output of ``setup``.
+    :param callable setup: function called before each run, not timed.
+    :param int repeat: number of runs.
+    :return: (*float*) -- shortest run time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = timeit.default_timer()
+        func(arg)
+        times.append(timeit.default_timer() - start)
+    return min(times)
+
+
+def _get_stripped_grid(grid):
+    """Copy a network and remove the columns added by the converter helpers.
+
+    :param powersimdata.input.abstract_grid.AbstractGrid grid: network built from CSV
+        files.
+    :return: (*powersimdata.input.abstract_grid.AbstractGrid*) -- network copy.
+    """
+    grid = copy.deepcopy(grid)
+    added = {
+        "bus": ["lat", "lon", "interconnect"],
+        "plant": ["lat", "lon", "zone_id", "zone_name", "interconnect"],
+        "branch": [
+            "from_lat",
+            "from_lon",
+            "to_lat",
+            "to_lon",
+            "from_zone_id",
+            "to_zone_id",
+            "from_zone_name",
+            "to_zone_name",
+            "interconnect",
+        ],
+        "dcline": ["from_interconnect", "to_interconnect"],
+    }
+    for table, columns in added.items():
+        df = getattr(grid, table)
+        setattr(grid, table, df.drop(columns=[c for c in columns if c in df]))
+    for key in ("before", "after"):
+        df = grid.gencost[key]
+        grid.gencost[key] = df.drop(columns=[c for c in ["interconnect"] if c in df])
+    return grid
+
+
+def get_change_table(grid, n_elements):
+    """Build a change table adding buses, branches and plants, and a tenth as many
+    HVDC lines and storage units.
+
+    :param powersimdata.input.grid.Grid grid: grid.
+    :param int n_elements: number of buses, branches and plants to add.
+    :return: (*dict*) -- change table.
+    """
+    rng = np.random.default_rng(0)
+    ct = ChangeTable(grid)
+    # New lines must start from voltage levels of existing lines
+    bus = grid.bus[grid.bus.baseKV.isin(voltage_to_x_per_distance(grid))]
+    bus = bus.sample(n_elements, replace=True, random_state=0)
+    ct.add_bus(
+        [
+            {"lat": lat + 0.1, "lon": lon + 0.1, "zone_id": z, "baseKV": kv}
+            for lat, lon, z, kv in bus[["lat", "lon", "zone_id", "baseKV"]].to_numpy()
+        ]
+    )
+    new_bus_id = grid.bus.index.max() + 1 + np.arange(n_elements)
+    ct.add_branch(
+        [
+            {"from_bus_id": int(b), "to_bus_id": int(n), "capacity": 100}
+            for b, n in zip(bus.index, new_bus_id)
+        ]
+    )
+    ct.add_plant(
+        [
+            {"type": "ng", "bus_id": int(b), "Pmax": 50, "c0": 1, "c1": 2, "c2": 3}
+            for b in new_bus_id
+        ]
+    )
+    n_other = max(1, n_elements // 10)
+    pairs = rng.choice(new_bus_id, size=(n_other, 2), replace=False)
+    ct.add_dcline(
+        [{"from_bus_id": int(f), "to_bus_id": int(t), "capacity": 10} for f, t in pairs]
+    )
+    ct.add_storage_capacity(
+        [{"bus_id": int(b), "capacity": 5} for b in new_bus_id[:n_other]]
+    )
+    return ct.ct
+
+
+def main(args=None):
+    """Run the benchmarks and print the shortest run time of each.
+
+    :param list args: command line arguments. Default to ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--n-elements", type=int, default=2000)
+    parser.add_argument("--models", nargs="+", choices=_models, default=list(_models))
+    args = parser.parse_args(args)
+
+    for model in args.models:
+        try:
+            network = _models[model]("USA")
+            network.build()
+        except FileNotFoundError as e:
+            print(f"Skipping {model}: {e}")
+            continue
+        stripped = _get_stripped_grid(network)
+        for func in (
+            add_zone_to_grid_data_frames,
+            add_coord_to_grid_data_frames,
+            add_interconnect_to_grid_data_frames,
+        ):
+            elapsed = _best_of(func, lambda: copy.deepcopy(stripped), args.repeat)
+            print(f"{model:10s}{func.__name__:40s}{elapsed * 1000:10.1f} ms")
+
+    grid = Grid("USA")
+    ct = get_change_table(grid, args.n_elements)
+    elapsed = _best_of(
+        lambda tg: tg.get_grid(), lambda: TransformGrid(grid, ct), args.repeat
+    )
+    print(f"{'usa_tamu':10s}{'TransformGrid.get_grid':40s}{elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
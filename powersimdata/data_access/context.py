@@ -18,9 +18,7 @@ class Context:
             instance
         """
         if server_setup.DEPLOYMENT_MODE == DeploymentMode.Server:
-            if make_fs is None:
-                make_fs = lambda: None  # noqa: E731
-            return SSHDataAccess(make_fs())
+            return SSHDataAccess(make_fs=make_fs)
         return LocalDataAccess()
 
     @staticmethod
@@ -1,6 +1,8 @@
 import functools
+import threading
 
 import pandas as pd
+from fs import errors
 
 
 def verify_hash(func):
@@ -36,9 +38,20 @@ class CsvStore:
     """Base class for common functionality used to manage scenario and execute
     list stored as csv files on the server
 
+    Parsed tables are cached for the lifetime of the process and shared by all the
+    instances using the same local file. Before a cached table is used, the size and
+    modification time of the remote file are compared to the ones of the last
+    download, such that the file is only downloaded again once it changed. The local
+    file is parsed again only if its size and modification time changed and its
+    checksum no longer matches.
+
     :param powersimdata.data_access.data_access.DataAccess: data access object
     """
 
+    _INDEX_COLUMNS = ()
+    _tables = {}
+    _lock = threading.Lock()
+
     def __init__(self, data_access):
         """Constructor"""
         self.data_access = data_access
@@ -49,22 +62,106 @@ class CsvStore:
 
         :return: (*pandas.DataFrame*) -- the specified table as a data frame.
         """
+        return self._get_cached_table()["table"].copy()
+
+    def _get_cached_table(self):
+        """Get the combined table along with the indexes of the columns listed in
+        ``_INDEX_COLUMNS``. The returned objects are shared and must not be modified.
+
+        :return: (*dict*) -- the table and, for each indexed column, a dictionary
+            mapping each value to the list of matching ids.
+        """
         filename = self._FILE_NAME
         orig = self._get_table(filename)
         blob = self._get_table(filename + ".2")
+        key = (self._get_key(filename), "combined")
+        with self._lock:
+            entry = self._tables.get(key)
+        if (
+            entry is not None
+            and entry["parts"][0] is orig
+            and entry["parts"][1] is blob
+        ):
+            return entry
+
         df = pd.concat([orig, blob])
-        return df[~df.index.duplicated()]
+        df = df[~df.index.duplicated()]
+        indexes = {}
+        for column in self._INDEX_COLUMNS:
+            index = indexes[column] = {}
+            if column in df.columns:
+                for i, value in zip(df.index, df[column]):
+                    index.setdefault(value, []).append(i)
+        entry = {"parts": (orig, blob), "table": df, "indexes": indexes}
+        with self._lock:
+            self._tables[key] = entry
+        return entry
+
+    def _get_key(self, filename):
+        """Get the key of a file in the cache, which identifies the local copy.
+
+        :param str filename: the file name, located at the local root
+        :return: (*object*) -- system path of the local copy if any, otherwise the
+            local filesystem and the file name.
+        """
+        local_fs = self.data_access.local_fs
+        if local_fs.hassyspath(filename):
+            return local_fs.getsyspath(filename)
+        return local_fs, filename
 
     def _get_table(self, filename):
+        """Get a table, downloading the file only if the remote copy changed since the
+        last download, and parsing it only if the local copy changed since the last
+        parse.
+
+        :param str filename: the file name, located at the local root
+        :return: (*pandas.DataFrame*) -- the table, empty if the file is not found.
+        """
+        local_fs = self.data_access.local_fs
+        key = self._get_key(filename)
+        with self._lock:
+            entry = dict(self._tables.get(key, {}))
+
         try:
-            self.data_access.copy_from(filename)
+            source = self.data_access._get_remote_source(filename)
         except:  # noqa
-            pass
+            source = None
+        if source is not None and (
+            source != entry.get("source") or not local_fs.exists(filename)
+        ):
+            try:
+                self.data_access.copy_from(filename)
+                entry["source"] = source
+            except:  # noqa
+                pass
+
         try:
-            with self.data_access.get(filename) as (f, _):
-                return _parse_csv(f)
+            info = local_fs.getinfo(filename, namespaces=["details"])
+            stat = (info.size, info.modified)
+            if stat != entry.get("stat"):
+                checksum = local_fs.hash(filename, "sha256")
+                if checksum != entry.get("checksum") or "table" not in entry:
+                    with local_fs.openbin(filename) as f:
+                        entry["table"] = _parse_csv(f)
+                entry.update(stat=stat, checksum=checksum)
+        except errors.ResourceNotFound:
+            if "stat" in entry or "table" not in entry:
+                entry = {"source": entry.get("source"), "table": pd.DataFrame()}
         except:  # noqa
-            return pd.DataFrame()
+            entry = {"table": pd.DataFrame()}
+
+        with self._lock:
+            self._tables[key] = entry
+        return entry["table"]
+
+    def invalidate(self):
+        """Drop the cached tables, such that they are downloaded and parsed again on
+        next access.
+        """
+        key = self._get_key(self._FILE_NAME)
+        with self._lock:
+            for k in (key, (key, "combined"), self._get_key(self._FILE_NAME + ".2")):
+                self._tables.pop(k, None)
 
     def commit(self, table, checksum):
         """Save to local directory and upload if needed
@@ -72,5 +169,8 @@ class CsvStore:
         :param pandas.DataFrame table: the data frame to save
         :param str checksum: the checksum prior to download
         """
-        with self.data_access.push(self._FILE_NAME, checksum) as f:
-            table.to_csv(f)
+        try:
+            with self.data_access.push(self._FILE_NAME, checksum) as f:
+                table.to_csv(f)
+        finally:
+            self.invalidate()
@@ -1,5 +1,7 @@
+import io
 import posixpath
-from contextlib import contextmanager
+from collections import Counter
+from contextlib import ExitStack, contextmanager
 from subprocess import Popen
 
 import fs
@@ -7,9 +9,16 @@ from fs import errors
 from fs.glob import Globber
 from fs.multifs import MultiFS
 from fs.path import basename, dirname
-from fs.tempfs import TempFS
 
+from powersimdata.data_access.download_cache import DownloadCache
 from powersimdata.data_access.fs_helper import get_blob_fs, get_multi_fs
+from powersimdata.data_access.listing_cache import listing_cache
+from powersimdata.data_access.transfer import (
+    CHUNK_SIZE,
+    TeeWriter,
+    download,
+    get_source,
+)
 from powersimdata.utility import server_setup
 
 
@@ -21,17 +30,102 @@ class DataAccess:
         self.join = fs.path.join
         self.local_fs = None
 
+    @property
+    def download_cache(self):
+        """Get the cache of the files downloaded to the local filesystem, if the local
+        filesystem is on disk.
+
+        :return: (:class:`powersimdata.data_access.download_cache.DownloadCache`) --
+            the cache or None.
+        """
+        if getattr(self, "_download_cache", None) is None:
+            if self.local_fs is None or not self.local_fs.hassyspath(""):
+                return None
+            self._download_cache = DownloadCache(self.local_fs)
+        return self._download_cache
+
+    def _exists(self, _fs, filepath, listing=False, cached=True):
+        """Check whether a file exists. Remote filesystems are checked against the
+        cached listing of the parent directory, see :class:`ListingCache`.
+
+        :param fs.base.FS _fs: filesystem.
+        :param str filepath: path to file
+        :param bool listing: whether to list the parent directory if its listing is
+            not cached.
+        :param bool cached: whether to use the cached listings.
+        :return: (*bool*) -- whether the file exists.
+        """
+        if _fs is self.local_fs or not cached:
+            return _fs.exists(filepath)
+        return listing_cache.exists(_fs, filepath, listing=listing)
+
+    def _which(self, filepath, remote=False, **kwargs):
+        """Find the filesystem of the data store holding a file, by descending
+        priority.
+
+        :param str filepath: path to file
+        :param bool remote: whether to exclude the local filesystem.
+        :param \\*\\*kwargs: options passed to :meth:`_exists`.
+        :return: (*tuple*) -- name and filesystem, or (None, None) if the file is not
+            found.
+        """
+        if hasattr(self.fs, "iterate_fs"):
+            filesystems = list(self.fs.iterate_fs())
+        else:
+            filesystems = [(None, self.fs)]
+        for name, _fs in filesystems:
+            if remote and _fs is self.local_fs:
+                continue
+            if self._exists(_fs, filepath, **kwargs):
+                return name, _fs
+        return None, None
+
+    def which(self, *filepaths):
+        """Find the filesystems of the data store holding several files. Directories
+        enclosing several of the files are listed at most once per filesystem, the
+        other files are checked directly.
+
+        :param str \\*filepaths: path to file(s).
+        :return: (*dict*) -- name of the filesystem holding each file, None for the
+            files that are not found.
+        """
+        counts = Counter(dirname(path) for path in filepaths)
+        return {
+            path: self._which(path, listing=counts[dirname(path)] > 1)[0]
+            for path in filepaths
+        }
+
+    def _get_remote_source(self, filepath):
+        """Get the size and modification time of a file in the data store, excluding
+        the local filesystem.
+
+        :param str filepath: path to file
+        :return: (*dict*) -- size and modification time of the file, see
+            :func:`powersimdata.data_access.transfer.get_source`, or None if the file
+            is not found.
+        """
+        _, src_fs = self._which(filepath, remote=True)
+        return None if src_fs is None else get_source(src_fs, filepath)
+
     @contextmanager
     def get(self, filepath):
-        """Copy file from remote filesystem if needed and read into memory
+        """Copy file from remote filesystem if needed and read into memory. Files
+        previously downloaded are downloaded again if they are corrupted or changed on
+        the data store, see :class:`DownloadCache`.
 
         :param str filepath: path to file
         :return: (*tuple*) -- file object and filepath to be handled by caller
         """
+        cache = self.download_cache
         if not self.local_fs.exists(filepath):
             print(f"{filepath} not found on local machine")
             from_dir, filename = dirname(filepath), basename(filepath)
             self.copy_from(filename, from_dir)
+        elif cache is not None and not cache.validate(
+            filepath, self._get_remote_source
+        ):
+            from_dir, filename = dirname(filepath), basename(filepath)
+            self.copy_from(filename, from_dir)
 
         with self.local_fs.openbin(filepath) as f:
             filepath = self.local_fs.getsyspath(filepath)
@@ -39,7 +133,9 @@ class DataAccess:
 
     @contextmanager
     def write(self, filepath, save_local=True):
-        """Write a file to data store.
+        """Write a file to data store. The content is streamed to the data store and to
+        the local filesystem at the same time, without being buffered in memory. Both
+        copies are removed if an error occurs while writing.
 
         :param str filepath: path to save data to
         :param bool save_local: whether a copy should also be saved to the local filesystem, if
@@ -48,23 +144,27 @@ class DataAccess:
         self._check_file_exists(filepath, should_exist=False)
 
         print("Writing %s" % filepath)
-        with fs.open_fs("mem://") as mem_fs:
-            mem_fs.makedirs(dirname(filepath), recreate=True)
-            with mem_fs.open(filepath, "wb") as f:
-                yield f
-            self._copy(mem_fs, self.fs, filepath)
-            if save_local:
-                self._copy(mem_fs, self.local_fs, filepath)
-
-    def _copy(self, src_fs, dst_fs, filepath):
-        """Copy file from one filesystem to another.
-
-        :param fs.base.FS src_fs: source filesystem
-        :param fs.base.FS dst_fs: destination filesystem
-        :param str filepath: path to file
-        """
-        dst_fs.makedirs(dirname(filepath), recreate=True)
-        fs.copy.copy_file(src_fs, filepath, dst_fs, filepath)
+        listing_cache.invalidate(filepath)
+        targets = [self.fs]
+        if save_local and getattr(self.fs, "write_fs", self.fs) is not self.local_fs:
+            targets.append(self.local_fs)
+        try:
+            with ExitStack() as stack:
+                files = []
+                for _fs in targets:
+                    _fs.makedirs(dirname(filepath), recreate=True)
+                    files.append(stack.enter_context(_fs.openbin(filepath, "w")))
+                with io.BufferedWriter(TeeWriter(files), CHUNK_SIZE) as f:
+                    yield f
+        except BaseException:
+            for _fs in targets:
+                try:
+                    _fs.remove(filepath)
+                except errors.FSError:
+                    pass
+            raise
+        finally:
+            listing_cache.invalidate(filepath)
 
     def copy_from(self, file_name, from_dir=None):
         """Copy a file from data store to userspace.
@@ -76,13 +176,15 @@ class DataAccess:
         from_path = self.join(from_dir, file_name)
         self._check_file_exists(from_path, should_exist=True)
 
-        location, _ = self.fs.which(from_path)
+        location, src_fs = self._which(from_path, remote=True)
+        if src_fs is None:
+            return
         print(f"Transferring {file_name} from {location}")
-        with TempFS() as tmp_fs:
-            self.local_fs.makedirs(from_dir, recreate=True)
-            tmp_fs.makedirs(from_dir, recreate=True)
-            fs.copy.copy_file(self.fs, from_path, tmp_fs, from_path)
-            fs.move.move_file(tmp_fs, from_path, self.local_fs, from_path)
+        self.local_fs.makedirs(from_dir, recreate=True)
+        source = download(src_fs, from_path, self.local_fs, from_path)
+        listing_cache.invalidate(from_path)
+        if self.download_cache is not None:
+            self.download_cache.add(from_path, source)
 
     def tmp_folder(self, scenario_id):
         """Get path to temporary scenario folder
@@ -112,17 +214,20 @@ class DataAccess:
                 Globber(_fs.opendir(base_dir), pattern).remove()
             except errors.ResourceNotFound:
                 print(f"Skipping {base_dir} not found on {_fs}")
+        listing_cache.invalidate()
         print("--> Done!")
         return True
 
     def _check_file_exists(self, path, should_exist=True):
-        """Check that file exists (or not) at the given path
+        """Check that file exists (or not) at the given path. Cached listings are not
+        used to check that a file does not exist, since the file may have been created
+        by another process in the meantime.
 
         :param str path: the relative path to the file
         :param bool should_exist: whether the file is expected to exist
         :raises OSError: if the expected condition is not met
         """
-        location, _ = self.fs.which(path)
+        location, _ = self._which(path, cached=should_exist)
         exists = location is not None
         if should_exist and not exists:
             remotes = [f[0] for f in self.fs.iterate_fs()]
@@ -187,27 +292,40 @@ class LocalDataAccess(DataAccess):
             with tfs.openbin(file_name, "w") as f:
                 yield f
             fs.move.move_file(tfs, file_name, self.local_fs, file_name)
+        listing_cache.invalidate(file_name)
 
 
 class SSHDataAccess(DataAccess):
-    """Interface to a remote data store, accessed via SSH."""
+    """Interface to a remote data store, accessed via SSH.
 
-    def __init__(self, _fs=None):
+    :param fs.base.FS _fs: filesystem instance, or None to use ``make_fs``.
+    :param callable make_fs: function with no argument returning a filesystem
+        instance, called on first access. Default to a MultiFS that combines the
+        server and blob containers.
+    """
+
+    _make_fs = None
+
+    def __init__(self, _fs=None, make_fs=None):
         """Constructor"""
         super().__init__()
         self.root = server_setup.DATA_ROOT_DIR
         self._fs = _fs
+        self._make_fs = make_fs
         self.local_fs = fs.open_fs(server_setup.LOCAL_DIR)
 
     @property
     def fs(self):
-        """Get or create a filesystem object, defaulting to a MultiFS that combines the
-        server and blob containers.
+        """Get or create a filesystem object. Its members are resolved from the pool
+        of filesystems, so a reopened connection is used by existing instances.
 
         :return: (*fs.base.FS*) -- filesystem instance
         """
         if self._fs is None:
-            self._fs = get_multi_fs(self.root)
+            if self._make_fs is not None:
+                self._fs = self._make_fs()
+            else:
+                self._fs = get_multi_fs(self.root)
         return self._fs
 
     def exec_command(self, command):
@@ -254,6 +372,7 @@ class SSHDataAccess(DataAccess):
                 yield f
             fs.move.move_file(tfs, file_name, self.local_fs, file_name)
             fs.copy.copy_file(self.local_fs, file_name, self.fs, backup)
+        listing_cache.invalidate(file_name)
 
         values = {
             "original": posixpath.join(self.root, file_name),
@@ -313,6 +432,7 @@ class _DataAccessTemplate(SSHDataAccess):
         with self.local_fs.openbin(file_name, "w") as f:
             yield f
         fs.move.move_file(self.local_fs, file_name, self.fs, file_name)
+        listing_cache.invalidate(file_name)
 
 
 class TempDataAccess(_DataAccessTemplate):
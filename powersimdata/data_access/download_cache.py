@@ -0,0 +1,304 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+
+import fs
+import pandas as pd
+
+from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import get_checksum
+
+
+class DownloadCache:
+    """Cache of the files downloaded from the data store to the local filesystem. An
+    entry records for each downloaded file its sha256 checksum, its size and
+    modification time and the size and modification time of the remote file it was
+    downloaded from. Each entry is stored in its own file, replaced atomically, such
+    that several processes can share the cache without losing entries. The last
+    access of a cached file is the modification time of its entry.
+
+    The cache is not content addressed: entries are keyed by the path of the
+    downloaded file, which stays a plain file at its usual location in the local
+    directory, so that readers of the local directory are not affected. The checksum
+    only validates the integrity of the local copy. The remote file is compared by
+    size and modification time rather than by checksum, since computing a checksum
+    requires reading the whole remote file.
+
+    A cached file is re-downloaded if its content no longer matches its checksum or if
+    the remote file changed. The remote file is checked at most once every ``ttl``
+    seconds. Once the cached files exceed the disk budget, the least recently used
+    ones are removed. Files written locally, rather than downloaded, are not managed
+    by the cache.
+
+    :param fs.osfs.OSFS local_fs: local filesystem.
+    :param int/str max_bytes: disk budget in bytes. Default to the
+        *DOWNLOAD_CACHE_MAX_BYTES* setting, unbounded if not set.
+    :param int/float/str ttl: number of seconds after which the remote file of a cached
+        file is checked again. Default to the *DOWNLOAD_CACHE_TTL* setting if any,
+        otherwise to one hour.
+    """
+
+    root = "cache/downloads"
+
+    def __init__(self, local_fs, max_bytes=None, ttl=None):
+        """Constructor."""
+        self.local_fs = local_fs
+        if max_bytes is None:
+            max_bytes = server_setup.DOWNLOAD_CACHE_MAX_BYTES
+        if ttl is None:
+            ttl = server_setup.DOWNLOAD_CACHE_TTL
+        self.max_bytes = None if max_bytes is None else int(max_bytes)
+        self.ttl = 3600 if ttl is None else float(ttl)
+        self._lock = threading.RLock()
+
+    def _syspath(self, path):
+        """Get the system path of a file in the local filesystem.
+
+        :param str path: path to file.
+        :return: (*str*) -- system path.
+        """
+        return self.local_fs.getsyspath(path)
+
+    def _get_entry_path(self, path):
+        """Get the path to the entry of a cached file.
+
+        :param str path: path to the cached file in the local filesystem.
+        :return: (*str*) -- path in the local filesystem.
+        """
+        digest = hashlib.sha1(path.encode()).hexdigest()
+        return f"{self.root}/entries/{digest}.json"
+
+    def _read(self, path):
+        """Read the entry of a cached file.
+
+        :param str path: path to the cached file in the local filesystem.
+        :return: (*dict*) -- entry or None if the file is not cached.
+        """
+        try:
+            with open(self._syspath(self._get_entry_path(path))) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("path") == path else None
+
+    def _write(self, entry):
+        """Write the entry of a cached file, which also records an access.
+
+        :param dict entry: entry of the cached file.
+        """
+        self.local_fs.makedirs(f"{self.root}/entries", recreate=True)
+        path = self._syspath(self._get_entry_path(entry["path"]))
+        tmp_path = f"{path}.tmp{os.getpid()}-{threading.get_ident()}"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def _touch(self, path):
+        """Record an access to a cached file.
+
+        :param str path: path to the cached file in the local filesystem.
+        """
+        try:
+            os.utime(self._syspath(self._get_entry_path(path)))
+        except OSError:
+            pass
+
+    def _load(self):
+        """Load the entries of all the cached files.
+
+        :return: (*dict*) -- entry of each cached file, keyed by path, along with its
+            last access.
+        """
+        index = {}
+        try:
+            files = list(os.scandir(self._syspath(f"{self.root}/entries")))
+        except OSError:
+            return index
+        for file in files:
+            if not file.name.endswith(".json"):
+                continue
+            try:
+                with open(file.path) as f:
+                    entry = json.load(f)
+                entry["last_access"] = file.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            index[entry["path"]] = entry
+        return index
+
+    def add(self, path, source):
+        """Add a file that was just downloaded to the cache, then enforce the budget.
+
+        :param str path: path to the downloaded file in the local filesystem.
+        :param dict source: size and modification time of the remote file, see
+            :func:`powersimdata.data_access.transfer.get_source`.
+        """
+        syspath = self._syspath(path)
+        checksum = get_checksum(syspath)
+        stat = os.stat(syspath)
+        with self._lock:
+            self._write(
+                {
+                    "path": path,
+                    "checksum": checksum,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "source": source,
+                    "checked": time.time(),
+                }
+            )
+            self.prune(keep=path)
+
+    def validate(self, path, get_source):
+        """Check whether a file in the local filesystem is up to date and record the
+        access. Files that are not managed by the cache are always up to date. The
+        entry of the file is only rewritten if it changed.
+
+        :param str path: path to file in the local filesystem.
+        :param callable get_source: function taking the path and returning the size and
+            modification time of the remote file, or None if it is not found.
+        :return: (*bool*) -- whether the local file can be used.
+        """
+        with self._lock:
+            entry = self._read(path)
+            if entry is None:
+                return True
+
+            try:
+                stat = os.stat(self._syspath(path))
+            except OSError:
+                return False
+            changed = False
+            if (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+                if get_checksum(self._syspath(path)) != entry["checksum"]:
+                    print(f"{path} does not match its checksum")
+                    return False
+                entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+                changed = True
+
+            now = time.time()
+            if now - entry["checked"] > self.ttl:
+                source = get_source(path)
+                if source is not None and source != entry["source"]:
+                    print(f"{path} changed on the data store")
+                    return False
+                entry["checked"] = now
+                changed = True
+            if changed:
+                self._write(entry)
+            else:
+                self._touch(path)
+            return True
+
+    def _remove(self, path):
+        """Remove a file and its entry from the cache.
+
+        :param str path: path to file in the local filesystem.
+        """
+        for syspath in (self._syspath(path), self._syspath(self._get_entry_path(path))):
+            try:
+                os.remove(syspath)
+            except FileNotFoundError:
+                pass
+
+    def prune(self, max_bytes=None, keep=None):
+        """Remove the least recently used files until the cache fits in the budget.
+
+        :param int max_bytes: budget in bytes. Default to the budget of the cache.
+        :param str keep: path to a file that must not be removed.
+        :return: (*list*) -- paths to the removed files.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else int(max_bytes)
+        if max_bytes is None:
+            return []
+        with self._lock:
+            index = self._load()
+            nbytes = self._get_nbytes(index)
+            removed = []
+            for path in sorted(index, key=lambda p: index[p]["last_access"]):
+                if nbytes <= max_bytes:
+                    break
+                if path != keep:
+                    self._remove(path)
+                    nbytes -= index[path]["size"]
+                    removed.append(path)
+        return removed
+
+    def clear(self):
+        """Remove all the cached files.
+
+        :return: (*list*) -- paths to the removed files.
+        """
+        return self.prune(max_bytes=0)
+
+    @staticmethod
+    def _get_nbytes(index):
+        """Get the disk space used by the cached files.
+
+        :param dict index: entry of each cached file, keyed by path.
+        :return: (*int*) -- size in bytes.
+        """
+        return sum(e["size"] for e in index.values())
+
+    def list(self):
+        """List the cached files.
+
+        :return: (*pandas.DataFrame*) -- checksum, size and last access of each cached
+            file, from least to most recently used.
+        """
+        index = self._load()
+        columns = ["checksum", "size", "last_access"]
+        table = pd.DataFrame(
+            [[index[p][c] for c in columns] for p in index],
+            index=pd.Index(list(index), name="path"),
+            columns=columns,
+        )
+        table["last_access"] = pd.to_datetime(table["last_access"], unit="s")
+        return table.sort_values("last_access")
+
+    def stats(self):
+        """Return usage statistics of the cache.
+
+        :return: (*dict*) -- number of cached files, disk space used and budget in
+            bytes.
+        """
+        index = self._load()
+        return {
+            "entries": len(index),
+            "nbytes": self._get_nbytes(index),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def main(args=None):
+    """Inspect or prune the download cache of the local data directory.
+
+    :param list args: command line arguments. Default to ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m powersimdata.data_access.download_cache",
+        description=main.__doc__.splitlines()[0],
+    )
+    parser.add_argument("command", choices=["list", "stats", "prune", "clear"])
+    parser.add_argument("--max-bytes", type=int, help="budget used by prune")
+    args = parser.parse_args(args)
+
+    cache = DownloadCache(fs.open_fs(server_setup.LOCAL_DIR))
+    if args.command == "list":
+        print(cache.list().to_string())
+    elif args.command == "stats":
+        print(cache.stats())
+    else:
+        if args.command == "clear":
+            removed = cache.clear()
+        else:
+            removed = cache.prune(max_bytes=args.max_bytes)
+        for path in removed:
+            print(f"Removed {path}")
+
+
+if __name__ == "__main__":
+    main()
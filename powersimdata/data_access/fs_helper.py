@@ -1,7 +1,9 @@
 import logging
+import threading
 
 import fs
 from fs.multifs import MultiFS
+from fs.wrapfs import WrapFS
 
 from powersimdata.data_access.ssh_fs import WrapSSHFS
 from powersimdata.utility import server_setup
@@ -10,19 +12,123 @@ logger = logging.getLogger("azure.core.pipeline.policies.http_logging_policy")
 logger.setLevel(logging.WARNING)
 
 
+class FSPool:
+    """Process wide pool of filesystems, such that connections are opened once and
+    shared by all the data access objects. A pooled filesystem is reopened if it was
+    closed or if its health check fails. Failed connections are not cached, the next
+    request attempts to open the filesystem again.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._pool = {}
+        self._lock = threading.RLock()
+
+    def get(self, key, open_fs, is_healthy=None):
+        """Get a filesystem from the pool, opening it if needed.
+
+        :param tuple key: identifier of the filesystem, e.g. (host, user, container).
+        :param callable open_fs: function with no argument opening the filesystem.
+        :param callable is_healthy: function taking the filesystem and returning
+            whether it can still be used. Default to checking that it is not closed.
+        :return: (*fs.base.FS*) -- filesystem instance
+        """
+        with self._lock:
+            _fs = self._pool.get(key)
+            if _fs is not None and not _fs.isclosed():
+                if is_healthy is None or is_healthy(_fs):
+                    return _fs
+                print(f"Reconnecting to {key[0]}")
+            self._pool.pop(key, None)
+            _fs = open_fs()
+            self._pool[key] = _fs
+            return _fs
+
+    def clear(self):
+        """Close and remove all the filesystems."""
+        with self._lock:
+            for _fs in self._pool.values():
+                try:
+                    _fs.close()
+                except Exception:  # noqa
+                    pass
+            self._pool.clear()
+
+
+fs_pool = FSPool()
+
+
+class PooledFS(WrapFS):
+    """Filesystem delegating to a pooled filesystem which is resolved on each call, so
+    that a connection reopened by the pool is picked up by existing instances. Closing
+    it leaves the pooled filesystem open.
+
+    :param callable get_fs: function with no argument returning the filesystem from
+        the pool.
+    """
+
+    def __init__(self, get_fs):
+        """Constructor."""
+        self._get_fs = get_fs
+        super().__init__(get_fs())
+
+    def delegate_fs(self):
+        """Get the pooled filesystem.
+
+        :return: (*fs.base.FS*) -- filesystem instance
+        """
+        self._wrap_fs = self._get_fs()
+        return self._wrap_fs
+
+    def delegate_path(self, path):
+        """Get the pooled filesystem and the path to use on it.
+
+        :param str path: path on this filesystem.
+        :return: (*tuple*) -- filesystem instance and path
+        """
+        return self.delegate_fs(), path
+
+    def close(self):
+        """Close this filesystem, without closing the pooled one."""
+        self._closed = True
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.delegate_fs(), name)
+
+
+def _is_ssh_connected(ssh_fs):
+    """Check that the transport of a ssh filesystem is active.
+
+    :param fs.base.FS ssh_fs: ssh filesystem, either a SSHFS or a
+        :class:`powersimdata.data_access.ssh_fs.WrapSSHFS` instance.
+    :return: (*bool*) -- whether the connection is alive.
+    """
+    if isinstance(ssh_fs, PooledFS):
+        ssh_fs = ssh_fs.delegate_fs()
+    client = ssh_fs.client if isinstance(ssh_fs, WrapSSHFS) else ssh_fs._client
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
+
+
 def get_blob_fs(container):
-    """Create fs for the given blob storage container
+    """Get fs for the given blob storage container, from the pool of filesystems
 
     :param str container: the container name
     :return: (*fs.base.FS*) -- filesystem instance
     """
     account = "esmi"
     sas_token = server_setup.get_blob_credential()
-    return fs.open_fs(f"azblobv2://{account}:{sas_token}@{container}")
+    return fs_pool.get(
+        ("azblobv2", account, container, sas_token),
+        lambda: fs.open_fs(f"azblobv2://{account}:{sas_token}@{container}"),
+    )
 
 
 def get_ssh_fs(root=""):
-    """Create fs for the given directory on the server
+    """Get fs for the given directory on the server. The underlying connection is
+    taken from the pool of filesystems.
 
     :param str root: root direcory on server
     :return: (*fs.base.FS*) -- filesystem instance
@@ -30,23 +136,32 @@ def get_ssh_fs(root=""):
     host = server_setup.SERVER_ADDRESS
     port = server_setup.SERVER_SSH_PORT
     username = server_setup.get_server_user()
-    base_fs = fs.open_fs(f"ssh://{username}@{host}:{port}")
-    return WrapSSHFS(base_fs, root)
+
+    def _open_fs():
+        base_fs = fs_pool.get(
+            ("ssh", host, port, username),
+            lambda: fs.open_fs(f"ssh://{username}@{host}:{port}"),
+            _is_ssh_connected,
+        )
+        return WrapSSHFS(base_fs, root)
+
+    return fs_pool.get(("ssh", host, port, username, root), _open_fs, _is_ssh_connected)
 
 
 def get_multi_fs(root):
     """Create filesystem combining the server (if connected) with profile and scenario
     containers in blob storage. The priority is in descending order, so the server will
-    be used first if possible
+    be used first if possible. The members are resolved from the pool of filesystems
+    on each call, see :class:`PooledFS`.
 
     :param str root: root directory on server
     :return: (*fs.base.FS*) -- filesystem instance
     """
-    scenario_data = get_blob_fs("scenariodata")
-    profiles = get_blob_fs("profiles")
+    scenario_data = PooledFS(lambda: get_blob_fs("scenariodata"))
+    profiles = PooledFS(lambda: get_blob_fs("profiles"))
     mfs = MultiFS()
     try:
-        ssh_fs = get_ssh_fs(root)
+        ssh_fs = PooledFS(lambda: get_ssh_fs(root))
         mfs.add_fs("ssh_fs", ssh_fs, write=True, priority=3)
     except:  # noqa
         print("Could not connect to ssh server")
@@ -59,14 +174,15 @@ def get_multi_fs(root):
 
 def get_scenario_fs():
     """Create filesystem combining the server (if connected) with blob storage,
-    prioritizing the server if connected.
+    prioritizing the server if connected. The members are resolved from the pool of
+    filesystems on each call, see :class:`PooledFS`.
 
     :return: (*fs.base.FS*) -- filesystem instance
     """
-    scenario_data = get_blob_fs("scenariodata")
+    scenario_data = PooledFS(lambda: get_blob_fs("scenariodata"))
     mfs = MultiFS()
     try:
-        ssh_fs = get_ssh_fs(server_setup.DATA_ROOT_DIR)
+        ssh_fs = PooledFS(lambda: get_ssh_fs(server_setup.DATA_ROOT_DIR))
         mfs.add_fs("ssh_fs", ssh_fs, write=True, priority=2)
     except:  # noqa
         print("Could not connect to ssh server")
@@ -0,0 +1,97 @@
+import threading
+import time
+
+from fs import errors
+from fs.path import abspath, basename, dirname, normpath, recursepath
+
+from powersimdata.utility import server_setup
+
+
+class ListingCache:
+    """Cache of directory listings of remote filesystems. Existence checks of several
+    files of the same directory are resolved from the listing of the directory, such
+    that they cost a single round trip. Listings expire after ``ttl``
+    seconds and are dropped as soon as a file of the directory is written or removed
+    through a :class:`powersimdata.data_access.data_access.DataAccess` instance.
+
+    :param int/float/str ttl: lifetime of a listing in seconds. Default to the
+        *LISTING_CACHE_TTL* setting if any, otherwise to one minute.
+    """
+
+    def __init__(self, ttl=None):
+        """Constructor."""
+        if ttl is None:
+            ttl = server_setup.LISTING_CACHE_TTL
+        self.ttl = 60 if ttl is None else float(ttl)
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    def listdir(self, _fs, path):
+        """List the content of a directory.
+
+        :param fs.base.FS _fs: filesystem.
+        :param str path: path to directory.
+        :return: (*frozenset*) -- names of the files and directories, empty if the
+            directory does not exist.
+        """
+        names = self._get_listing(_fs, path)
+        if names is not None:
+            return names
+        try:
+            names = frozenset(_fs.listdir(path))
+        except (errors.ResourceNotFound, errors.DirectoryExpected):
+            names = frozenset()
+        with self._lock:
+            self._listings[(_fs, path)] = (time.monotonic(), names)
+        return names
+
+    def _get_listing(self, _fs, path):
+        """Get the cached listing of a directory, if it has not expired.
+
+        :param fs.base.FS _fs: filesystem.
+        :param str path: path to directory.
+        :return: (*frozenset*) -- names of the files and directories, or None.
+        """
+        with self._lock:
+            listing = self._listings.get((_fs, path))
+        if listing is not None and time.monotonic() - listing[0] < self.ttl:
+            return listing[1]
+        return None
+
+    def exists(self, _fs, path, listing=False):
+        """Check whether a file or directory exists. The check is resolved from the
+        cached listing of the parent directory if any. Otherwise, the directory is
+        listed if ``listing`` is True, or the path is checked directly.
+
+        :param fs.base.FS _fs: filesystem.
+        :param str path: path to file or directory.
+        :param bool listing: whether to list the parent directory if its listing is
+            not cached, e.g. when several files of the directory are checked.
+        :return: (*bool*) -- whether the path exists.
+        """
+        path = abspath(normpath(path))
+        if path == "/":
+            return _fs.exists(path)
+        names = self._get_listing(_fs, dirname(path))
+        if names is None:
+            if not listing:
+                return _fs.exists(path)
+            names = self.listdir(_fs, dirname(path))
+        return basename(path) in names
+
+    def invalidate(self, path=None):
+        """Drop the listings of the parent directories of a path, in all filesystems.
+
+        :param str path: path to file or directory. Default to None, which drops all
+            the listings.
+        """
+        with self._lock:
+            if path is None:
+                self._listings.clear()
+                return
+            parents = set(recursepath(dirname(abspath(normpath(path)))))
+            for key in [k for k in self._listings if k[1] in parents]:
+                del self._listings[key]
+
+
+listing_cache = ListingCache()
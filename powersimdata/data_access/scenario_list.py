@@ -9,6 +9,7 @@ class ScenarioListManager(CsvStore):
     """Storage abstraction for scenario list using a csv file."""
 
     _FILE_NAME = "ScenarioList.csv"
+    _INDEX_COLUMNS = ("name",)
 
     def get_scenario_table(self):
         """Returns scenario table from server if possible, otherwise read local
@@ -41,11 +42,13 @@ class ScenarioListManager(CsvStore):
             print(text)
             print("------------------")
 
-        table = self.get_scenario_table()
+        cached = self._get_cached_table()
+        table = cached["table"]
         try:
-            matches = table.index.isin([int(descriptor)])
+            scenario_id = int(descriptor)
+            matches = [scenario_id] if scenario_id in table.index else []
         except ValueError:
-            matches = table[table.name == descriptor].index
+            matches = cached["indexes"]["name"].get(descriptor, [])
 
         scenario = table.loc[matches, :]
         if scenario.shape[0] == 0:
@@ -1,6 +1,8 @@
 import fs as fs2
 import pytest
+from fs.info import Info
 
+from powersimdata.data_access import transfer
 from powersimdata.data_access.data_access import MemoryDataAccess, SSHDataAccess
 from powersimdata.utility import server_setup
 
@@ -58,3 +60,136 @@ def test_copy_from_multi_path(data_access):
     make_temp(data_access.fs, filepath)
     data_access.copy_from(FILE_NAME, src_path)
     _check_content(data_access.local_fs, filepath)
+
+
+def test_write(data_access):
+    with data_access.write(FILE_NAME) as f:
+        f.write(CONTENT)
+    _check_content(data_access.fs, FILE_NAME)
+    _check_content(data_access.local_fs, FILE_NAME)
+
+
+def test_write_error_removes_file(data_access):
+    with pytest.raises(ValueError):
+        with data_access.write(FILE_NAME) as f:
+            f.write(CONTENT)
+            raise ValueError
+    assert not data_access.fs.exists(FILE_NAME)
+    assert not data_access.local_fs.exists(FILE_NAME)
+
+
+def test_download_in_parts(monkeypatch):
+    monkeypatch.setattr(transfer, "PART_SIZE", 3)
+    src_fs, dst_fs = fs2.open_fs("mem://"), fs2.open_fs("mem://")
+    make_temp(src_fs, FILE_NAME)
+    transfer.download(src_fs, FILE_NAME, dst_fs, FILE_NAME, max_workers=2)
+    _check_content(dst_fs, FILE_NAME)
+    assert dst_fs.listdir("") == [FILE_NAME]
+
+
+def test_download_resumes(monkeypatch):
+    monkeypatch.setattr(transfer, "PART_SIZE", 3)
+    src_fs, dst_fs = fs2.open_fs("mem://"), fs2.open_fs("mem://")
+    make_temp(src_fs, FILE_NAME)
+    copy_range = transfer._copy_range
+
+    def fail_last_part(src_fs, src_path, start, *args):
+        if start == 6:
+            raise OSError("connection lost")
+        copy_range(src_fs, src_path, start, *args)
+
+    monkeypatch.setattr(transfer, "_copy_range", fail_last_part)
+    with pytest.raises(OSError):
+        transfer.download(src_fs, FILE_NAME, dst_fs, FILE_NAME, max_workers=1)
+    assert not dst_fs.exists(FILE_NAME)
+
+    resumed = []
+
+    def record(src_fs, src_path, start, *args):
+        resumed.append(start)
+        copy_range(src_fs, src_path, start, *args)
+
+    monkeypatch.setattr(transfer, "_copy_range", record)
+    transfer.download(src_fs, FILE_NAME, dst_fs, FILE_NAME, max_workers=1)
+    assert resumed == [6]
+    _check_content(dst_fs, FILE_NAME)
+
+
+def test_download_without_mtime_restarts(monkeypatch):
+    monkeypatch.setattr(transfer, "PART_SIZE", 3)
+    src_fs, dst_fs = fs2.open_fs("mem://"), fs2.open_fs("mem://")
+    make_temp(src_fs, FILE_NAME)
+    monkeypatch.setattr(
+        transfer, "get_source", lambda *args: {"size": len(CONTENT), "modified": None}
+    )
+    copy_range = transfer._copy_range
+    starts = []
+
+    def fail_last_part(src_fs, src_path, start, *args):
+        starts.append(start)
+        if start == 6 and len(starts) == 3:
+            raise OSError("connection lost")
+        copy_range(src_fs, src_path, start, *args)
+
+    monkeypatch.setattr(transfer, "_copy_range", fail_last_part)
+    with pytest.raises(OSError):
+        transfer.download(src_fs, FILE_NAME, dst_fs, FILE_NAME, max_workers=1)
+    transfer.download(src_fs, FILE_NAME, dst_fs, FILE_NAME, max_workers=1)
+    assert starts == [0, 3, 6, 0, 3, 6]
+    _check_content(dst_fs, FILE_NAME)
+
+
+def test_get_source_without_mtime(monkeypatch):
+    src_fs = fs2.open_fs("mem://")
+    info = Info({"basic": {"name": FILE_NAME, "is_dir": False}, "details": {"size": 7}})
+    monkeypatch.setattr(src_fs, "getinfo", lambda *args, **kwargs: info)
+    assert transfer.get_source(src_fs, FILE_NAME) == {"size": 7, "modified": None}
+
+
+def test_which_lists_each_directory_once(data_access, monkeypatch):
+    remote_fs = data_access.fs.get_fs("remotefs")
+    paths = [_join("foo", f"{i}.pkl") for i in range(5)]
+    for path in paths[:3]:
+        make_temp(remote_fs, path)
+
+    listdir = remote_fs.listdir
+    calls = []
+
+    def count_listdir(path):
+        calls.append(path)
+        return listdir(path)
+
+    monkeypatch.setattr(remote_fs, "listdir", count_listdir)
+    locations = data_access.which(*paths)
+    assert locations == {p: "remotefs" if i < 3 else None for i, p in enumerate(paths)}
+    assert len(calls) == 1
+
+    with data_access.write(paths[3]) as f:
+        f.write(CONTENT)
+    assert data_access.which(paths[3]) == {paths[3]: "remotefs"}
+    with pytest.raises(OSError):
+        data_access._check_file_exists(paths[4])
+
+
+def test_which_checks_single_path_directly(data_access, monkeypatch):
+    remote_fs = data_access.fs.get_fs("remotefs")
+    make_temp(remote_fs, _join("foo", "0.pkl"))
+
+    def fail(path):
+        raise AssertionError("directory listed")
+
+    monkeypatch.setattr(remote_fs, "listdir", fail)
+    assert data_access.which(_join("foo", "0.pkl")) == {
+        _join("foo", "0.pkl"): "remotefs"
+    }
+    assert data_access.which(_join("foo", "1.pkl")) == {_join("foo", "1.pkl"): None}
+
+
+def test_write_ignores_cached_listing(data_access):
+    remote_fs = data_access.fs.get_fs("remotefs")
+    paths = [_join("bar", f"{i}.pkl") for i in range(2)]
+    assert data_access.which(*paths) == {p: None for p in paths}
+    make_temp(remote_fs, paths[0])
+    with pytest.raises(OSError):
+        with data_access.write(paths[0]) as f:
+            f.write(CONTENT)
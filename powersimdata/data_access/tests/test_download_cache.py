@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from powersimdata.data_access.data_access import TempDataAccess
+from powersimdata.data_access.download_cache import DownloadCache
+
+CONTENT = b"content"
+
+
+@pytest.fixture
+def data_access():
+    data_access = TempDataAccess()
+    for name in ("a.pkl", "b.pkl", "c.pkl"):
+        data_access.fs.writebytes(name, CONTENT + name.encode())
+    return data_access
+
+
+def _read(data_access, path):
+    with data_access.get(path) as (f, _):
+        return f.read()
+
+
+def test_downloads_are_independent_copies(data_access):
+    data_access.fs.writebytes("d.pkl", CONTENT + b"a.pkl")
+    assert _read(data_access, "a.pkl") == CONTENT + b"a.pkl"
+    assert _read(data_access, "d.pkl") == CONTENT + b"a.pkl"
+
+    cache = data_access.download_cache
+    table = cache.list()
+    assert table.index.tolist() == ["a.pkl", "d.pkl"]
+    assert table.checksum.nunique() == 1
+    assert cache.stats()["nbytes"] == 2 * (len(CONTENT) + 5)
+    with open(data_access.local_fs.getsyspath("d.pkl"), "ab") as f:
+        f.write(b"modified")
+    assert _read(data_access, "a.pkl") == CONTENT + b"a.pkl"
+
+
+def test_entries_are_shared_between_instances(data_access):
+    other = DownloadCache(data_access.local_fs)
+    _read(data_access, "a.pkl")
+    data_access.local_fs.writebytes("x.pkl", CONTENT)
+    other.add("x.pkl", {"size": len(CONTENT), "modified": None})
+    assert data_access.download_cache.list().index.tolist() == ["a.pkl", "x.pkl"]
+    assert other.validate("a.pkl", lambda path: None)
+
+
+def test_hit_does_not_rewrite_entry(data_access):
+    _read(data_access, "a.pkl")
+    cache = data_access.download_cache
+    entry_path = data_access.local_fs.getsyspath(cache._get_entry_path("a.pkl"))
+    os.utime(entry_path, (0, 0))
+    with open(entry_path) as f:
+        content = f.read()
+    _read(data_access, "a.pkl")
+    with open(entry_path) as f:
+        assert f.read() == content
+    assert os.stat(entry_path).st_mtime > 0
+
+
+def test_corrupted_file_is_downloaded_again(data_access):
+    _read(data_access, "a.pkl")
+    os.remove(data_access.local_fs.getsyspath("a.pkl"))
+    data_access.local_fs.writebytes("a.pkl", b"corrupted")
+    assert _read(data_access, "a.pkl") == CONTENT + b"a.pkl"
+
+
+def test_remote_change_is_downloaded_after_ttl(data_access):
+    _read(data_access, "a.pkl")
+    data_access.fs.writebytes("a.pkl", b"new content")
+    assert _read(data_access, "a.pkl") == CONTENT + b"a.pkl"
+
+    data_access.download_cache.ttl = 0
+    assert _read(data_access, "a.pkl") == b"new content"
+
+
+def test_least_recently_used_files_are_evicted(data_access):
+    cache = data_access.download_cache
+    cache.max_bytes = 2 * (len(CONTENT) + 5)
+    for path in ("a.pkl", "b.pkl", "a.pkl", "c.pkl"):
+        _read(data_access, path)
+    assert cache.list().index.tolist() == ["a.pkl", "c.pkl"]
+    assert not data_access.local_fs.exists("b.pkl")
+
+    assert cache.prune(max_bytes=0) == ["a.pkl", "c.pkl"]
+    assert cache.stats()["entries"] == 0
+    assert data_access.local_fs.listdir(f"{DownloadCache.root}/entries/") == []
+
+
+def test_local_files_are_not_managed(data_access):
+    data_access.local_fs.writebytes("e.pkl", CONTENT)
+    assert _read(data_access, "e.pkl") == CONTENT
+    assert data_access.download_cache.stats()["entries"] == 0
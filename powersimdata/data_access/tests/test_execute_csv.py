@@ -6,7 +6,11 @@ import pandas as pd
 import pytest
 from numpy.testing import assert_array_equal
 
-from powersimdata.data_access.data_access import LocalDataAccess, SSHDataAccess
+from powersimdata.data_access.data_access import (
+    LocalDataAccess,
+    MemoryDataAccess,
+    SSHDataAccess,
+)
 from powersimdata.data_access.execute_list import ExecuteListManager
 from powersimdata.utility import server_setup, templates
 
@@ -101,3 +105,15 @@ def test_delete(manager):
 
     table = manager.get_execute_table()
     assert table.shape == (0, 1)
+
+
+def test_status_is_refreshed_when_file_changes():
+    data_access = MemoryDataAccess()
+    with open(os.path.join(templates.__path__[0], "ExecuteList.csv"), "rb") as f:
+        data_access.fs.writebytes("ExecuteList.csv", f.read())
+    manager = ExecuteListManager(data_access)
+    manager.add_entry(mock_row())
+    assert manager.get_status(1) == "created"
+
+    data_access.fs.writetext("ExecuteList.csv", "id,status\n1,running\n")
+    assert manager.get_status(1) == "running"
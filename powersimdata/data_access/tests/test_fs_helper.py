@@ -0,0 +1,72 @@
+import fs
+import pytest
+from fs.multifs import MultiFS
+
+from powersimdata.data_access.fs_helper import FSPool, PooledFS
+
+
+def test_pool_reuses_filesystem():
+    pool = FSPool()
+    mem_fs = pool.get(("mem",), lambda: fs.open_fs("mem://"))
+    assert pool.get(("mem",), lambda: fs.open_fs("mem://")) is mem_fs
+    assert pool.get(("other",), lambda: fs.open_fs("mem://")) is not mem_fs
+
+
+def test_pool_reopens_closed_or_unhealthy_filesystem():
+    pool = FSPool()
+    mem_fs = pool.get(("mem",), lambda: fs.open_fs("mem://"))
+    mem_fs.close()
+    reopened = pool.get(("mem",), lambda: fs.open_fs("mem://"))
+    assert reopened is not mem_fs
+
+    unhealthy = pool.get(("mem",), lambda: fs.open_fs("mem://"), lambda _: False)
+    assert unhealthy is not reopened
+
+
+def test_pool_does_not_cache_failed_connection():
+    calls = []
+
+    def open_fs():
+        calls.append(1)
+        if len(calls) < 3:
+            raise fs.errors.CreateFailed("unreachable")
+        return fs.open_fs("mem://")
+
+    pool = FSPool()
+    for _ in range(2):
+        with pytest.raises(fs.errors.CreateFailed):
+            pool.get(("ssh",), open_fs)
+    mem_fs = pool.get(("ssh",), open_fs)
+    assert len(calls) == 3
+    assert pool.get(("ssh",), open_fs) is mem_fs
+
+
+def test_pooled_fs_picks_up_reopened_filesystem():
+    pool = FSPool()
+
+    def get_fs():
+        return pool.get(("mem",), lambda: fs.open_fs("mem://"))
+
+    mfs = MultiFS()
+    mfs.add_fs("mem_fs", PooledFS(get_fs), write=True)
+    mfs.writetext("foo.txt", "foo")
+    get_fs().close()
+
+    mfs.writetext("bar.txt", "bar")
+    assert mfs.exists("bar.txt")
+    assert get_fs().exists("bar.txt")
+    assert not get_fs().exists("foo.txt")
+
+
+def test_closing_pooled_fs_leaves_pooled_filesystem_open():
+    pool = FSPool()
+
+    def get_fs():
+        return pool.get(("mem",), lambda: fs.open_fs("mem://"))
+
+    mem_fs = get_fs()
+    mfs = MultiFS()
+    mfs.add_fs("mem_fs", PooledFS(get_fs))
+    mfs.close()
+    assert not mem_fs.isclosed()
+    assert get_fs() is mem_fs
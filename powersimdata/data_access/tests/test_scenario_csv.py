@@ -6,7 +6,11 @@ import pandas as pd
 import pytest
 from numpy.testing import assert_array_equal
 
-from powersimdata.data_access.data_access import LocalDataAccess, SSHDataAccess
+from powersimdata.data_access.data_access import (
+    LocalDataAccess,
+    MemoryDataAccess,
+    SSHDataAccess,
+)
 from powersimdata.data_access.scenario_list import ScenarioListManager
 from powersimdata.utility import server_setup, templates
 
@@ -116,3 +120,42 @@ def test_delete_entry(manager):
     manager.add_entry(mock_row())
     table = manager.delete_entry(2)
     assert table.shape == (2, 17)
+
+
+@pytest.fixture
+def memory_manager():
+    data_access = MemoryDataAccess()
+    with open(os.path.join(templates.__path__[0], "ScenarioList.csv"), "rb") as f:
+        data_access.fs.writebytes("ScenarioList.csv", f.read())
+    return ScenarioListManager(data_access)
+
+
+def test_get_scenario_by_name(memory_manager):
+    for name in ("foo", "bar", "bar"):
+        memory_manager.add_entry(OrderedDict(mock_row(), name=name))
+    assert memory_manager.get_scenario("foo")["id"] == "1"
+    assert memory_manager.get_scenario("bar") is None
+    assert memory_manager.get_scenario("baz") is None
+
+
+def test_table_is_downloaded_once(memory_manager, monkeypatch):
+    memory_manager.add_entry(mock_row())
+    data_access = memory_manager.data_access
+    calls = []
+    copy_from = data_access.copy_from
+    monkeypatch.setattr(
+        data_access, "copy_from", lambda *args: calls.append(args) or copy_from(*args)
+    )
+    for _ in range(3):
+        assert memory_manager.get_scenario(1)["id"] == "1"
+    assert calls == [("ScenarioList.csv",)]
+
+    memory_manager.add_entry(mock_row())
+    assert memory_manager.get_scenario(2)["id"] == "2"
+    assert len(calls) == 2
+
+
+def test_get_table_returns_copy(memory_manager):
+    memory_manager.add_entry(mock_row())
+    memory_manager.get_scenario_table().drop(1, inplace=True)
+    assert memory_manager.get_scenario_table().shape == (1, 17)
@@ -0,0 +1,219 @@
+import io
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fs import errors
+from tqdm import tqdm
+
+from powersimdata.utility import server_setup
+
+CHUNK_SIZE = 2**22
+PART_SIZE = 2**26
+
+
+def _get_max_workers(max_workers=None):
+    """Get the number of parts transferred at the same time.
+
+    :param int max_workers: number of parts. Default to the *TRANSFER_MAX_WORKERS*
+        setting if any, otherwise to 4.
+    :return: (*int*) -- number of parts.
+    """
+    if max_workers is None:
+        max_workers = server_setup.TRANSFER_MAX_WORKERS
+    return 4 if max_workers is None else int(max_workers)
+
+
+def get_source(src_fs, src_path):
+    """Get the size and modification time of a file, which identify its content.
+
+    :param fs.base.FS src_fs: source filesystem.
+    :param str src_path: path to source file.
+    :return: (*dict*) -- size and modification time of the file. The modification
+        time is None if the filesystem does not report it.
+    """
+    info = src_fs.getinfo(src_path, namespaces=["details"])
+    modified = info.modified
+    return {"size": info.size, "modified": None if modified is None else str(modified)}
+
+
+def _read_state(dst_fs, state_path):
+    """Read the state of an interrupted download.
+
+    :param fs.base.FS dst_fs: destination filesystem.
+    :param str state_path: path to the state file.
+    :return: (*dict*) -- the state or None if it is missing or unreadable.
+    """
+    try:
+        return json.loads(dst_fs.readtext(state_path))
+    except (errors.ResourceNotFound, ValueError):
+        return None
+
+
+def _copy_range(src_fs, src_path, start, length, dst, callback):
+    """Copy a range of bytes of a file, chunk by chunk. Data lake blobs are read with a
+    ranged request, other filesystems with a seek on a new file handle.
+
+    :param fs.base.FS src_fs: source filesystem.
+    :param str src_path: path to source file.
+    :param int start: position of the first byte.
+    :param int length: number of bytes.
+    :param io.IOBase dst: destination file object, positioned at ``start``.
+    :param callable callback: function called with the number of bytes copied after
+        each chunk.
+    :raises OSError: if the source file is shorter than expected.
+    """
+    client = getattr(src_fs, "client", None)
+    if hasattr(client, "get_file_client"):
+        file_client = client.get_file_client(src_fs.validatepath(src_path))
+        stream = file_client.download_file(offset=start, length=length)
+        for chunk in stream.chunks():
+            dst.write(chunk)
+            callback(len(chunk))
+        return
+
+    with src_fs.openbin(src_path) as src:
+        src.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = src.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise OSError(f"Unexpected end of file {src_path}")
+            dst.write(chunk)
+            remaining -= len(chunk)
+            callback(len(chunk))
+
+
+def download(src_fs, src_path, dst_fs, dst_path, max_workers=None):
+    """Download a file in parts of fixed size, several parts at a time. The parts are
+    written in a *.part* file next to the destination, which is renamed once the
+    download is complete. The parts already downloaded are recorded in a *.part.json*
+    file, such that an interrupted download resumes where it stopped, as long as the
+    size and modification time of the source file are unchanged. Downloads of files
+    without modification time are never resumed, since a change of their content
+    cannot be detected.
+
+    :param fs.base.FS src_fs: source filesystem.
+    :param str src_path: path to source file.
+    :param fs.base.FS dst_fs: destination filesystem.
+    :param str dst_path: path to destination file.
+    :param int max_workers: number of parts downloaded at the same time. Default to
+        the *TRANSFER_MAX_WORKERS* setting if any, otherwise to 4.
+    :return: (*dict*) -- size and modification time of the source file, see
+        :func:`get_source`.
+    """
+    part_path, state_path = f"{dst_path}.part", f"{dst_path}.part.json"
+    source = get_source(src_fs, src_path)
+    size = source["size"]
+    n_parts = -(-size // PART_SIZE)
+
+    state = _read_state(dst_fs, state_path)
+    if (
+        state is None
+        or source["modified"] is None
+        or state["source"] != source
+        or not dst_fs.exists(part_path)
+    ):
+        state = {"source": source, "done": []}
+        with dst_fs.openbin(part_path, "w") as f:
+            f.truncate(size)
+        dst_fs.writetext(state_path, json.dumps(state))
+
+    done = set(state["done"])
+    todo = [i for i in range(n_parts) if i not in done]
+    remaining = sum(min(PART_SIZE, size - i * PART_SIZE) for i in todo)
+    lock = threading.Lock()
+    bar = tqdm(
+        total=size,
+        initial=size - remaining,
+        ascii=True,
+        unit="b",
+        unit_scale=True,
+    )
+
+    def _download_part(i):
+        start = i * PART_SIZE
+        length = min(PART_SIZE, size - start)
+        with dst_fs.openbin(part_path, "r+") as dst:
+            dst.seek(start)
+            _copy_range(src_fs, src_path, start, length, dst, bar.update)
+        with lock:
+            done.add(i)
+            state["done"] = sorted(done)
+            dst_fs.writetext(state_path, json.dumps(state))
+
+    try:
+        with ThreadPoolExecutor(max_workers=_get_max_workers(max_workers)) as executor:
+            list(executor.map(_download_part, todo))
+    finally:
+        bar.close()
+
+    dst_fs.move(part_path, dst_path, overwrite=True)
+    dst_fs.remove(state_path)
+    return source
+
+
+class TeeWriter(io.RawIOBase):
+    """Write the same content to several files at once. Each file is written by its
+    own thread, such that slow destinations, e.g. a remote server, do not hold back
+    the producer or the other destinations. At most ``max_pending`` chunks are held in
+    memory for each destination.
+
+    :param list files: open file objects.
+    :param int max_pending: maximum number of chunks waiting to be written to a file.
+    """
+
+    def __init__(self, files, max_pending=16):
+        """Constructor."""
+        super().__init__()
+        self._errors = []
+        self._queues = [queue.Queue(maxsize=max_pending) for _ in files]
+        self._threads = [
+            threading.Thread(target=self._drain, args=(f, q), daemon=True)
+            for f, q in zip(files, self._queues)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _drain(self, f, q):
+        """Write chunks to a file until the end of the content is reached.
+
+        :param io.IOBase f: an open file object.
+        :param queue.Queue q: chunks to write.
+        """
+        while True:
+            data = q.get()
+            if data is None:
+                return
+            if self._errors:
+                continue
+            try:
+                f.write(data)
+            except Exception as e:
+                self._errors.append(e)
+
+    def _check(self):
+        """Raise the first error met by the writing threads, if any."""
+        if self._errors:
+            raise self._errors[0]
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._check()
+        data = bytes(data)
+        for q in self._queues:
+            q.put(data)
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        for q in self._queues:
+            q.put(None)
+        for t in self._threads:
+            t.join()
+        super().close()
+        self._check()
@@ -174,7 +174,7 @@ def add_resource_data_to_targets(input_targets, scenario, calculate_curtailment=
     capacity_groupby = plant.Pmax.groupby(groupby_cols)
     capacity_by_target_type = capacity_groupby.sum().unstack(fill_value=0)
     # Generated energy
-    pg_groupby = scenario.get_pg().sum().groupby(groupby_cols)
+    pg_groupby = scenario.get_pg(readonly=True).sum().groupby(groupby_cols)
     summed_generation = pg_groupby.sum().unstack(fill_value=0)
     # Calculate capacity factors
     possible_energy = scenario_length * capacity_by_target_type[curtailment_types]
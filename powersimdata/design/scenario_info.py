@@ -1,5 +1,9 @@
 import warnings
 
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
 from powersimdata.network.model import area_to_loadzone
 
 
@@ -14,17 +18,52 @@ def _check_state(scenario):
         raise TypeError("Scenario state must be 'analyze.'")
 
 
+def _get_cumulative_sums(frame, groups, n_groups, edges):
+    """Sum the columns of a data frame by group and time bucket, then accumulate the
+    sums over the time buckets.
+
+    :param pandas.DataFrame frame: data frame, with timestamps as index.
+    :param numpy.ndarray groups: group of each column, -1 for columns to ignore.
+    :param int n_groups: number of groups.
+    :param numpy.ndarray edges: position of the first timestamp of each bucket,
+        followed by the number of timestamps.
+    :return: (*numpy.ndarray*) -- array of shape (number of buckets + 1, number of
+        groups), where row *i* is the sum over the buckets preceding bucket *i*.
+    """
+    keep = groups >= 0
+    indicator = csr_matrix(
+        (np.ones(keep.sum()), (np.flatnonzero(keep), groups[keep])),
+        shape=(len(groups), n_groups),
+    )
+    hourly = np.asarray((indicator.T @ frame.to_numpy(dtype=float).T).T)
+    cumulative = np.zeros((len(edges), n_groups))
+    if len(edges) > 1:
+        np.cumsum(
+            np.add.reduceat(hourly, edges[:-1], axis=0), axis=0, out=cumulative[1:]
+        )
+    return cumulative
+
+
 class ScenarioInfo:
     """Gather information from previous scenarios for capacity scaling.
 
+    Generation, profile resources and demand are aggregated once, on first query, in
+    a cube of cumulative sums by time bucket, load zone and generator type. Queries
+    whose time range starts and ends on bucket boundaries are then answered from the
+    cube without going through the hourly data. Other time ranges are computed from
+    the hourly data.
+
     :param powersimdata.scenario.scenario.Scenario scenario: scenario instance
+    :param str freq: length of the time buckets of the cube, as a pandas offset alias,
+        e.g. *'H'* for hourly buckets, which answer any time range, or *'D'* or *'M'*
+        for daily or monthly buckets, which take less memory.
     :raise TypeError: if the scenario is not in 'analyze' state.
     """
 
-    def __init__(self, scenario):
+    def __init__(self, scenario, freq="H"):
         _check_state(scenario)
         self.info = scenario.info
-        self.pg = scenario.state.get_pg()
+        self.pg = scenario.state.get_pg(readonly=True)
         self.grid = scenario.state.get_grid()
         self.demand = scenario.state.get_demand()
         self.grid_model = self.grid.grid_model
@@ -32,6 +71,10 @@ class ScenarioInfo:
         wind = scenario.state.get_wind()
         hydro = scenario.state.get_hydro()
         self.profile = {"solar": solar, "wind": wind, "hydro": hydro}
+        self.freq = freq
+        self._loadzones = {}
+        self._zone_loc = {}
+        self._cube = None
 
     def area_to_loadzone(self, area, area_type=None):
         """Map the query area to a list of loadzones. For more info, see
@@ -43,7 +86,124 @@ class ScenarioInfo:
             *'state_abbr'*, *'interconnect'*
         :return: (*set*) -- set of loadzones associated to the query area
         """
-        return area_to_loadzone(self.grid_model, area, area_type)
+        key = (area, area_type)
+        if key not in self._loadzones:
+            self._loadzones[key] = area_to_loadzone(self.grid_model, area, area_type)
+        return set(self._loadzones[key])
+
+    def _get_zone_loc(self, area, area_type=None):
+        """Find the positions of the loadzones of an area in the zone axis of the cube.
+
+        :param str area: one of: *loadzone*, *state*, *state abbreviation*,
+            *interconnect*, *'all'*
+        :param str area_type: one of: *'loadzone'*, *'state'*,
+            *'state_abbr'*, *'interconnect'*
+        :return: (*numpy.ndarray*) -- positions of the loadzones of the area that are
+            in the grid.
+        """
+        key = (area, area_type)
+        if key not in self._zone_loc:
+            loadzone_set = self.area_to_loadzone(area, area_type)
+            loc = self._get_cube()["zone"].get_indexer(list(loadzone_set))
+            self._zone_loc[key] = loc[loc >= 0]
+        return self._zone_loc[key]
+
+    def _get_cube(self):
+        """Build the aggregation cube on first call.
+
+        :return: (*dict*) -- zone and type axes, bucket of each bucket boundary,
+            cumulative generation (bucket x zone x type), cumulative profile resource
+            (bucket x zone) for each resource, cumulative demand (bucket x zone) and
+            capacity (zone x type).
+        """
+        if self._cube is not None:
+            return self._cube
+
+        plant = self.grid.plant
+        zone = pd.Index(list(dict.fromkeys([*plant["zone_name"], *self.grid.zone2id])))
+        gentype = pd.Index(plant["type"].unique())
+        index = self.pg.index
+        periods = index.to_period(self.freq)
+        edges = np.concatenate(
+            [[0], np.flatnonzero(periods[1:] != periods[:-1]) + 1, [len(index)]]
+        )
+        plant_zone = pd.Series(zone.get_indexer(plant["zone_name"]), index=plant.index)
+        plant_type = pd.Series(gentype.get_indexer(plant["type"]), index=plant.index)
+        plant_group = plant_zone * len(gentype) + plant_type
+
+        def align(frame):
+            if frame.index.equals(index):
+                return frame
+            return frame.reindex(index).fillna(0)
+
+        def get_groups(columns, groups):
+            return groups.reindex(columns).fillna(-1).to_numpy(dtype=int)
+
+        pg = _get_cumulative_sums(
+            self.pg,
+            get_groups(self.pg.columns, plant_group),
+            len(zone) * len(gentype),
+            edges,
+        ).reshape(len(edges), len(zone), len(gentype))
+        profile = {}
+        for resource, frame in self.profile.items():
+            zone_of_type = plant_zone[plant["type"] == resource]
+            profile[resource] = _get_cumulative_sums(
+                align(frame),
+                get_groups(frame.columns, zone_of_type),
+                len(zone),
+                edges,
+            )
+        demand_zone = pd.Series(
+            zone.get_indexer(list(self.grid.zone2id)),
+            index=list(self.grid.zone2id.values()),
+        )
+        demand = _get_cumulative_sums(
+            align(self.demand),
+            get_groups(self.demand.columns, demand_zone),
+            len(zone),
+            edges,
+        )
+        capacity = np.bincount(
+            plant_group, weights=plant["Pmax"], minlength=len(zone) * len(gentype)
+        ).reshape(len(zone), len(gentype))
+
+        self._cube = {
+            "zone": zone,
+            "type": gentype,
+            "bucket": {e: i for i, e in enumerate(edges)},
+            "pg": pg,
+            "profile": profile,
+            "demand": demand,
+            "capacity": capacity,
+        }
+        return self._cube
+
+    def _get_buckets(self, start_i, end_i):
+        """Find the time buckets spanning a time range.
+
+        :param int start_i: position of the start timestamp.
+        :param int end_i: position of the end timestamp.
+        :return: (*tuple*) -- boundaries of the buckets in the cube, or None if the
+            time range does not start and end on bucket boundaries.
+        """
+        bucket = self._get_cube()["bucket"]
+        if start_i in bucket and end_i + 1 in bucket:
+            return bucket[start_i], bucket[end_i + 1]
+
+    def _get_plant_id(self, gentype, loadzone_set):
+        """Find the plants of a generator type in a set of loadzones.
+
+        :param str gentype: type of generator
+        :param set loadzone_set: set of loadzones.
+        :return: (*list*) -- plant ids.
+        """
+        return list(
+            self.grid.plant[
+                (self.grid.plant["type"] == gentype)
+                & (self.grid.plant["zone_name"].isin(loadzone_set))
+            ].index
+        )
 
     def _check_time_range(self, start_time, end_time):
         """Check if the start_time and end_time define a valid time range of
@@ -101,7 +261,11 @@ class ScenarioInfo:
             based on the specified parameters
         """
         loadzone_set = self.area_to_loadzone(area, area_type)
-        self._check_time_range(start_time, end_time)
+        buckets = self._get_buckets(*self._check_time_range(start_time, end_time))
+        if buckets is not None:
+            demand = self._get_cube()["demand"]
+            loc = self._get_zone_loc(area, area_type)
+            return float((demand[buckets[1], loc] - demand[buckets[0], loc]).sum())
         total_demand = (
             self.demand.loc[
                 start_time:end_time,
@@ -124,11 +288,12 @@ class ScenarioInfo:
         :return: (*float*) -- total capacity (in MW) based on the
             specified parameters
         """
-        loadzone_set = self.area_to_loadzone(area, area_type)
-        total_capacity = self.grid.plant[
-            (self.grid.plant["type"] == gentype)
-            & (self.grid.plant["zone_name"].isin(loadzone_set))
-        ]["Pmax"].sum()
+        self.area_to_loadzone(area, area_type)
+        cube = self._get_cube()
+        total_capacity = 0
+        if gentype in cube["type"]:
+            loc = self._get_zone_loc(area, area_type)
+            total_capacity = cube["capacity"][loc, cube["type"].get_loc(gentype)].sum()
         if total_capacity == 0:
             warnings.warn("No such type of generator in the area specified!")
         return float(total_capacity)
@@ -150,14 +315,13 @@ class ScenarioInfo:
             based on the specified parameters
         """
         loadzone_set = self.area_to_loadzone(area, area_type)
-        plant_id_list = list(
-            self.grid.plant[
-                (self.grid.plant["type"] == gentype)
-                & (self.grid.plant["zone_name"].isin(loadzone_set))
-            ].index
-        )
-        query_pg_df = self.pg[plant_id_list]
-        self._check_time_range(start_time, end_time)
+        buckets = self._get_buckets(*self._check_time_range(start_time, end_time))
+        cube = self._get_cube()
+        if buckets is not None and gentype in cube["type"]:
+            loc = self._get_zone_loc(area, area_type)
+            pg = cube["pg"][:, :, cube["type"].get_loc(gentype)]
+            return float((pg[buckets[1], loc] - pg[buckets[0], loc]).sum())
+        query_pg_df = self.pg[self._get_plant_id(gentype, loadzone_set)]
         total_generation = query_pg_df.loc[start_time:end_time].sum().sum()
         return float(total_generation)
 
@@ -179,16 +343,15 @@ class ScenarioInfo:
         :raise ValueError: if the resource type is invalid
         """
         loadzone_set = self.area_to_loadzone(area, area_type)
-        plant_id_list = list(
-            self.grid.plant[
-                (self.grid.plant["type"] == gentype)
-                & (self.grid.plant["zone_name"].isin(loadzone_set))
-            ].index
-        )
         if gentype not in self.profile:
             raise ValueError("Invalid resource type")
+        buckets = self._get_buckets(*self._check_time_range(start_time, end_time))
+        if buckets is not None:
+            profile = self._get_cube()["profile"][gentype]
+            loc = self._get_zone_loc(area, area_type)
+            return float((profile[buckets[1], loc] - profile[buckets[0], loc]).sum())
+        plant_id_list = self._get_plant_id(gentype, loadzone_set)
         query_profile_df = self.profile[gentype][plant_id_list]
-        self._check_time_range(start_time, end_time)
         total_resource = query_profile_df.loc[start_time:end_time].sum().sum()
         return float(total_resource)
 
@@ -115,6 +115,7 @@ class TestScenarioInfo(unittest.TestCase):
             hydro=mock_hydro,
         )
         scenario.state.grid.zone2id = {"Oregon": 202, "Arizona": 209}
+        self.scenario = scenario
         self.scenario_info = ScenarioInfo(scenario)
 
     def test_get_available_resource(self):
@@ -236,3 +237,24 @@ class TestScenarioInfo(unittest.TestCase):
         assert self.scenario_info.get_no_congest_capacity_factor(
             "hydro", "all", start_time, end_time
         ) == round(mock_hydro.sum().sum() / (220 * period_num), 4)
+
+    def test_daily_cube(self):
+        scenario_info = ScenarioInfo(self.scenario, freq="D")
+        first_day = ("2016-01-01 00:00:00", "2016-01-01 23:00:00")
+        assert scenario_info._get_buckets(0, 23) == (0, 1)
+        assert scenario_info.get_generation("ng", "Arizona", *first_day) == float(
+            mock_pg.loc[first_day[0] : first_day[1], ng_plant_id].sum().sum()
+        )
+        assert scenario_info.get_demand("Oregon", *first_day) == float(
+            mock_demand.loc[first_day[0] : first_day[1], 202].sum()
+        )
+        assert scenario_info.get_profile_resource("wind", "all", *first_day) == float(
+            mock_wind.loc[first_day[0] : first_day[1]].sum().sum()
+        )
+
+        # time range within a bucket is computed from the hourly data
+        hours = ("2016-01-01 03:00:00", "2016-01-01 05:00:00")
+        assert scenario_info._get_buckets(3, 5) is None
+        assert scenario_info.get_generation("coal", "Oregon", *hours) == float(
+            mock_pg.loc[hours[0] : hours[1], coal_plant_id].sum().sum()
+        )
@@ -291,7 +291,9 @@ def _identify_mesh_branch_upgrades(
         raise ValueError(f"cost_metric must be one of: {allowed_list}")
 
     # Get raw congestion dual values, add them
-    ref_cong_abs = ref_scenario.state.get_congu() + ref_scenario.state.get_congl()
+    congu = ref_scenario.state.get_congu(readonly=True)
+    congl = ref_scenario.state.get_congl(readonly=True)
+    ref_cong_abs = congu + congl
     all_branches = set(ref_cong_abs.columns.tolist())
     # Create validated composite allow list, and filter shadow price data frame
     composite_allow_list = _construct_composite_allow_list(
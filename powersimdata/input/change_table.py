@@ -19,6 +19,10 @@ from powersimdata.input.changes import (
 from powersimdata.input.profile_input import ProfileInput
 from powersimdata.input.transform_grid import TransformGrid
 
+# Keys of the change table whose entries are appended, in the order they are applied
+_appended_keys = ["new_bus", "new_branch", "new_dcline", "new_plant", "storage"]
+_removal_keys = ["remove_branch", "remove_bus", "remove_dcline", "remove_plant"]
+
 
 class ChangeTable:
     """Create change table for changes that need to be applied to the original grid as
@@ -135,6 +139,8 @@ class ChangeTable:
             }
         }
         self._profile_input = None
+        self._transformed = None
+        self._v2x = None
 
     def _check_resource(self, resource):
         """Checks resource.
@@ -643,7 +649,7 @@ class ChangeTable:
             if cache_key in self._new_element_caches[table]:
                 return self._new_element_caches[table][cache_key]
             else:
-                gen = TransformGrid(self.grid, self.ct).get_grid().storage["gen"]
+                gen = self._get_transformed_grid().storage["gen"]
                 self._new_element_caches[table][cache_key] = gen
                 return gen.copy()
         # For all other tables, look at change table keys for additions & deletions
@@ -673,10 +679,88 @@ class ChangeTable:
         if cache_key in self._new_element_caches[table]:
             return self._new_element_caches[table][cache_key]
         else:
-            transformed = getattr(TransformGrid(self.grid, self.ct).get_grid(), table)
+            transformed = getattr(self._get_transformed_grid(), table)
             self._new_element_caches[table][cache_key] = transformed
             return transformed.copy()
 
+    def _get_transformed_grid(self):
+        """Get the grid transformed by the change table. The last transformed grid is
+        kept along with a copy of the change table it was built from. If entries have
+        only been added to the new elements or to the removed elements since then, only
+        these entries are applied to the last transformed grid. Otherwise, the full
+        change table is applied to the original grid.
+
+        :return: (*powersimdata.input.grid.Grid*) -- the transformed grid. Its data
+            frames are read only.
+        """
+        delta = None
+        if self._transformed is not None:
+            ct, grid = self._transformed
+            delta = self._get_ct_delta(ct)
+            if delta == {}:
+                return grid
+        if delta is None:
+            tg = TransformGrid(self.grid, self.ct, readonly=True)
+        else:
+            tg = TransformGrid(grid, delta, readonly=True)
+            # Reactance of new lines is derived from the lines of the original grid
+            # scaled by zones, i.e. before any new line is added or any line is scaled
+            # by IDs. It is computed by the first transformation adding lines and
+            # reused by the following ones.
+            tg.v2x = self._v2x
+        grid = tg.get_grid()
+        self._v2x = tg.v2x
+        self._transformed = (copy.deepcopy(self.ct), grid)
+        return grid
+
+    def _get_ct_delta(self, previous):
+        """Get the entries added to the change table since a previous state, if these
+        can be applied on top of the grid transformed by the previous change table.
+
+        :param dict previous: previous state of the change table.
+        :return: (*dict*) -- change table enclosing the added entries, or None if the
+            change table has been modified otherwise.
+        """
+        if not previous.keys() <= self.ct.keys():
+            return None
+        delta = {}
+        for key, value in self.ct.items():
+            if key in _appended_keys:
+                n = len(previous.get(key, []))
+                if value[:n] != previous.get(key, []):
+                    return None
+                if len(value) > n:
+                    delta[key] = value[n:]
+            elif key in _removal_keys:
+                if not previous.get(key, set()) <= value:
+                    return None
+                if value - previous.get(key, set()):
+                    delta[key] = value - previous.get(key, set())
+            else:
+                try:
+                    if key not in previous or value != previous[key]:
+                        return None
+                except ValueError:
+                    # Values that can't be compared, e.g. data frames
+                    return None
+        # Removals are applied last and storage units are numbered after the plants
+        if any(k in delta for k in _appended_keys) and any(
+            previous.get(k) for k in _removal_keys
+        ):
+            return None
+        if "new_plant" in delta and previous.get("storage"):
+            return None
+        if "storage" in delta and previous.get("storage"):
+            return None
+        # Reactance of new lines is derived from the lines before scaling by IDs
+        if (
+            "new_branch" in delta
+            and self._v2x is None
+            and "branch_id" in previous.get("branch", {})
+        ):
+            return None
+        return delta
+
     def remove_branch(self, info):
         """Remove one or more branches.
 
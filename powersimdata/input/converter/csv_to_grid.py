@@ -1,4 +1,10 @@
+import hashlib
+import inspect
 import os
+import pickle
+import threading
+
+import pandas as pd
 
 from powersimdata.input.abstract_grid import AbstractGrid
 from powersimdata.input.converter.helpers import (
@@ -7,6 +13,20 @@ from powersimdata.input.converter.helpers import (
 )
 from powersimdata.network.constants.model import model2region
 from powersimdata.network.csv_reader import CSVReader
+from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import get_checksum
+
+_snapshot_tables = ["bus", "plant", "branch", "dcline", "sub", "bus2sub"]
+
+# Increment when the content of the grid built from CSV files changes
+_snapshot_version = 1
+
+# Code building the grid from CSV files, a snapshot is discarded when it changes
+_builder_files = [
+    __file__,
+    inspect.getfile(CSVReader),
+    inspect.getfile(add_coord_to_grid_data_frames),
+]
 
 
 class FromCSV(AbstractGrid):
@@ -25,11 +45,24 @@ class FromCSV(AbstractGrid):
             self.data_loc = data_loc
 
     def _build(self, interconnect, grid_model):
-        """Build network.
+        """Build network. The network is loaded from its snapshot in the local data
+        directory if neither the CSV files nor the code building the grid have changed
+        since the snapshot was taken. Otherwise, it is built from the CSV files and a
+        snapshot is taken.
 
         :param list interconnect: interconnect name(s).
         :param str model: the grid model.
         """
+        snapshot = Snapshot(self.data_loc, grid_model, interconnect)
+        data = snapshot.load()
+        if data is not None:
+            for name in _snapshot_tables:
+                setattr(self, name, data[name])
+            self.gencost["after"] = self.gencost["before"] = data["gencost"]
+            self.id2zone = data["id2zone"]
+            self.zone2id = {v: k for k, v in self.id2zone.items()}
+            return
+
         reader = CSVReader(self.data_loc)
         self.bus = reader.bus
         self.plant = reader.plant
@@ -46,6 +79,11 @@ class FromCSV(AbstractGrid):
         if model2region[grid_model] not in interconnect:
             self._drop_interconnect(interconnect)
 
+        data = {name: getattr(self, name) for name in _snapshot_tables}
+        data["gencost"] = self.gencost["before"]
+        data["id2zone"] = self.id2zone
+        snapshot.save(data)
+
     def _add_information(self):
         add_zone_to_grid_data_frames(self)
         add_coord_to_grid_data_frames(self)
@@ -69,3 +107,110 @@ class FromCSV(AbstractGrid):
                 )
         self.id2zone = {k: self.id2zone[k] for k in self.bus.zone_id.unique()}
         self.zone2id = {value: key for key, value in self.id2zone.items()}
+
+
+class Snapshot:
+    """Binary snapshot of a grid model built from CSV files, stored in the local data
+    directory. Each directory of CSV files has its own snapshots. A snapshot is
+    discarded as soon as the checksum of the CSV files or of the code building the
+    grid changes, or if it was saved with another snapshot format or version of
+    pandas.
+
+    :param str data_loc: path to the CSV files.
+    :param str grid_model: the grid model.
+    :param list interconnect: interconnect name(s).
+    """
+
+    def __init__(self, data_loc, grid_model, interconnect):
+        """Constructor."""
+        self.data_loc = os.path.abspath(data_loc)
+        self.files = sorted(
+            os.path.join(self.data_loc, f)
+            for f in os.listdir(self.data_loc)
+            if f.endswith(".csv")
+        )
+        digest = hashlib.sha1(self.data_loc.encode()).hexdigest()[:16]
+        self.path = os.path.join(
+            server_setup.LOCAL_DIR,
+            "cache",
+            "grid",
+            grid_model,
+            digest,
+            "_".join(sorted(interconnect)) + ".pkl",
+        )
+
+    def _get_sources(self):
+        """Get the files the grid is built from.
+
+        :return: (*list*) -- paths to the CSV files and to the code building the grid.
+        """
+        return self.files + _builder_files
+
+    def _get_stat(self):
+        """Get size and modification time of the source files.
+
+        :return: (*list*) -- size and modification time of each file.
+        """
+        stat = [os.stat(f) for f in self._get_sources()]
+        return [[s.st_size, s.st_mtime_ns] for s in stat]
+
+    def _get_version(self):
+        """Get the version of the snapshot.
+
+        :return: (*list*) -- snapshot format version, pandas version and location of
+            the CSV files.
+        """
+        return [_snapshot_version, pd.__version__, self.data_loc]
+
+    def load(self):
+        """Load snapshot.
+
+        :return: (*dict*) -- data frames and zone names of the grid or None if the
+            snapshot is missing or stale.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                snapshot = pickle.load(f)
+        except Exception:
+            return None
+
+        if snapshot.get("version") != self._get_version():
+            return None
+        stat = self._get_stat()
+        if stat == snapshot["stat"]:
+            return snapshot["data"]
+        if get_checksum(*self._get_sources()) == snapshot["checksum"]:
+            self._dump({**snapshot, "stat": stat})
+            return snapshot["data"]
+        return None
+
+    def save(self, data):
+        """Save snapshot.
+
+        :param dict data: data frames and zone names of the grid.
+        """
+        self._dump(
+            {
+                "version": self._get_version(),
+                "checksum": get_checksum(*self._get_sources()),
+                "stat": self._get_stat(),
+                "data": data,
+            }
+        )
+
+    def _dump(self, snapshot):
+        """Write snapshot to disk.
+
+        :param dict snapshot: snapshot along with its version, the checksum and the
+            size and modification time of the source files.
+        """
+        tmp_path = f"{self.path}.tmp{os.getpid()}-{threading.get_ident()}"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not save snapshot of grid: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
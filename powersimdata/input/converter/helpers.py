@@ -1,39 +1,48 @@
 import pandas as pd
 
 
+def _lookup(table, idx):
+    """Look up values of a table for a sequence of labels. If a label appears several
+    times in the index of the table, its last value is used.
+
+    :param pandas.Series/pandas.DataFrame table: lookup table.
+    :param iterable idx: labels to look up in the index of the table.
+    :return: (*numpy.ndarray*) -- values of the table for each label.
+    :raises KeyError: if some labels are not in the index of the table.
+    """
+    if not table.index.is_unique:
+        table = table[~table.index.duplicated(keep="last")]
+    loc = table.index.get_indexer(idx)
+    if (loc == -1).any():
+        raise KeyError(f"{list(pd.Index(idx)[loc == -1])} not in index")
+    return table.to_numpy()[loc]
+
+
 def add_coord_to_grid_data_frames(grid):
     """Adds longitude and latitude information to bus, plant and branch data
     frames of grid instance.
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2coord = (
-        pd.merge(grid.bus2sub[["sub_id"]], grid.sub[["lat", "lon"]], on="sub_id")
-        .set_index(grid.bus2sub.index)
-        .drop(columns="sub_id")
-        .to_dict()
-    )
-
-    def get_lat(idx):
-        return [bus2coord["lat"][i] for i in idx]
+    sub_coord = grid.sub[["lat", "lon"]]
 
-    def get_lon(idx):
-        return [bus2coord["lon"][i] for i in idx]
+    def get_coord(idx):
+        coord = _lookup(sub_coord, _lookup(grid.bus2sub.sub_id, idx))
+        return coord[:, 0], coord[:, 1]
 
-    extra_col_bus = {"lat": get_lat(grid.bus.index), "lon": get_lon(grid.bus.index)}
-    grid.bus = grid.bus.assign(**extra_col_bus)
+    lat, lon = get_coord(grid.bus.index)
+    grid.bus = grid.bus.assign(lat=lat, lon=lon)
 
-    extra_col_plant = {
-        "lat": get_lat(grid.plant.bus_id),
-        "lon": get_lon(grid.plant.bus_id),
-    }
-    grid.plant = grid.plant.assign(**extra_col_plant)
+    lat, lon = get_coord(grid.plant.bus_id)
+    grid.plant = grid.plant.assign(lat=lat, lon=lon)
 
+    from_lat, from_lon = get_coord(grid.branch.from_bus_id)
+    to_lat, to_lon = get_coord(grid.branch.to_bus_id)
     extra_col_branch = {
-        "from_lat": get_lat(grid.branch.from_bus_id),
-        "from_lon": get_lon(grid.branch.from_bus_id),
-        "to_lat": get_lat(grid.branch.to_bus_id),
-        "to_lon": get_lon(grid.branch.to_bus_id),
+        "from_lat": from_lat,
+        "from_lon": from_lon,
+        "to_lat": to_lat,
+        "to_lon": to_lon,
     }
     grid.branch = grid.branch.assign(**extra_col_branch)
 
@@ -43,25 +52,29 @@ def add_zone_to_grid_data_frames(grid):
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2zone = grid.bus.zone_id.to_dict()
+    bus2zone = grid.bus.zone_id
+    id2zone = pd.Series(grid.id2zone, dtype=object)
 
     def get_zone_id(idx):
-        return [bus2zone[i] for i in idx]
+        return _lookup(bus2zone, idx)
 
-    def get_zone_name(idx):
-        return [grid.id2zone[bus2zone[i]] for i in idx]
+    def get_zone_name(zone_id):
+        return _lookup(id2zone, zone_id)
 
+    plant_zone_id = get_zone_id(grid.plant.bus_id)
     extra_col_plant = {
-        "zone_id": get_zone_id(grid.plant.bus_id),
-        "zone_name": get_zone_name(grid.plant.bus_id),
+        "zone_id": plant_zone_id,
+        "zone_name": get_zone_name(plant_zone_id),
     }
     grid.plant = grid.plant.assign(**extra_col_plant)
 
+    from_zone_id = get_zone_id(grid.branch.from_bus_id)
+    to_zone_id = get_zone_id(grid.branch.to_bus_id)
     extra_col_branch = {
-        "from_zone_id": get_zone_id(grid.branch.from_bus_id),
-        "to_zone_id": get_zone_id(grid.branch.to_bus_id),
-        "from_zone_name": get_zone_name(grid.branch.from_bus_id),
-        "to_zone_name": get_zone_name(grid.branch.to_bus_id),
+        "from_zone_id": from_zone_id,
+        "to_zone_id": to_zone_id,
+        "from_zone_name": get_zone_name(from_zone_id),
+        "to_zone_name": get_zone_name(to_zone_id),
     }
     grid.branch = grid.branch.assign(**extra_col_branch)
 
@@ -72,10 +85,10 @@ def add_interconnect_to_grid_data_frames(grid):
 
     :param powersimdata.input.grid.Grid grid: grid instance.
     """
-    bus2interconnect = grid.bus2sub.interconnect.to_dict()
+    bus2interconnect = grid.bus2sub.interconnect
 
     def get_interconnect(idx):
-        return [bus2interconnect[i] for i in idx]
+        return _lookup(bus2interconnect, idx)
 
     extra_col_bus = {"interconnect": get_interconnect(grid.bus.index)}
     grid.bus = grid.bus.assign(**extra_col_bus)
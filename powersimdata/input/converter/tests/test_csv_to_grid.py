@@ -0,0 +1,73 @@
+import os
+
+import pandas as pd
+import pytest
+
+from powersimdata.input.converter import csv_to_grid
+from powersimdata.input.converter.csv_to_grid import Snapshot
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    data_loc = os.path.join(tmp_path, "data")
+    os.makedirs(data_loc)
+    pd.DataFrame({"zone_name": ["a", "b"]}).to_csv(os.path.join(data_loc, "zone.csv"))
+    snapshot = Snapshot(data_loc, "usa_tamu", ["Texas"])
+    snapshot.path = os.path.join(tmp_path, "cache", "Texas.pkl")
+    return snapshot
+
+
+def test_load_missing_snapshot(snapshot):
+    assert snapshot.load() is None
+
+
+def test_save_and_load(snapshot):
+    data = {"bus": pd.DataFrame({"Pd": [1.0, 2.0]}), "id2zone": {1: "a"}}
+    snapshot.save(data)
+    loaded = snapshot.load()
+    pd.testing.assert_frame_equal(loaded["bus"], data["bus"])
+    assert loaded["id2zone"] == data["id2zone"]
+
+
+def test_snapshot_is_discarded_when_csv_changes(snapshot):
+    snapshot.save({"id2zone": {1: "a"}})
+    pd.DataFrame({"zone_name": ["a", "c"]}).to_csv(snapshot.files[0])
+    assert snapshot.load() is None
+
+
+def test_snapshot_is_kept_when_only_mtime_changes(snapshot):
+    snapshot.save({"id2zone": {1: "a"}})
+    os.utime(snapshot.files[0], ns=(0, 0))
+    assert snapshot.load() == {"id2zone": {1: "a"}}
+    assert snapshot.load() == {"id2zone": {1: "a"}}
+
+
+def test_snapshot_is_discarded_when_version_changes(snapshot, monkeypatch):
+    snapshot.save({"id2zone": {1: "a"}})
+    monkeypatch.setattr(csv_to_grid, "_snapshot_version", -1)
+    assert snapshot.load() is None
+
+
+def test_snapshot_is_discarded_when_builder_code_changes(snapshot, monkeypatch):
+    code = os.path.join(os.path.dirname(snapshot.files[0]), "builder.py")
+    with open(code, "w") as f:
+        f.write("a = 1\n")
+    monkeypatch.setattr(csv_to_grid, "_builder_files", [code])
+    snapshot.save({"id2zone": {1: "a"}})
+    assert snapshot.load() == {"id2zone": {1: "a"}}
+    with open(code, "w") as f:
+        f.write("a = 20\n")
+    assert snapshot.load() is None
+
+
+def test_snapshot_depends_on_data_location(snapshot, tmp_path):
+    other_loc = os.path.join(tmp_path, "other", "data")
+    os.makedirs(other_loc)
+    pd.DataFrame({"zone_name": ["a", "b"]}).to_csv(os.path.join(other_loc, "zone.csv"))
+    other = Snapshot(other_loc, "usa_tamu", ["Texas"])
+    default = Snapshot(os.path.dirname(snapshot.files[0]), "usa_tamu", ["Texas"])
+    assert other.path != default.path
+
+    snapshot.save({"id2zone": {1: "a"}})
+    other.path = snapshot.path
+    assert other.load() is None
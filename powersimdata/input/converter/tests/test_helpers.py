@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from powersimdata.input.abstract_grid import AbstractGrid
+from powersimdata.input.converter.helpers import (
+    add_coord_to_grid_data_frames,
+    add_interconnect_to_grid_data_frames,
+    add_zone_to_grid_data_frames,
+)
+
+
+@pytest.fixture
+def grid():
+    grid = AbstractGrid()
+    grid.id2zone = {1: "a", 2: "b"}
+    grid.sub = pd.DataFrame(
+        {"lat": [10.0, 20.0], "lon": [-10.0, -20.0]}, index=pd.Index([5, 6])
+    )
+    grid.bus2sub = pd.DataFrame(
+        {"sub_id": [6, 5, 5], "interconnect": ["East", "West", "West"]},
+        index=pd.Index([100, 101, 102], name="bus_id"),
+    )
+    grid.bus = pd.DataFrame(
+        {"zone_id": [2, 1, 1]}, index=pd.Index([100, 101, 102], name="bus_id")
+    )
+    grid.plant = pd.DataFrame({"bus_id": [102, 100]})
+    grid.gencost["before"] = grid.gencost["after"] = pd.DataFrame({"c1": [1, 2]})
+    grid.branch = pd.DataFrame({"from_bus_id": [100, 101], "to_bus_id": [101, 102]})
+    grid.dcline = pd.DataFrame({"from_bus_id": [100], "to_bus_id": [102]})
+    return grid
+
+
+def test_add_coord(grid):
+    add_coord_to_grid_data_frames(grid)
+    assert grid.bus.lat.tolist() == [20.0, 10.0, 10.0]
+    assert grid.plant.lon.tolist() == [-10.0, -20.0]
+    assert grid.branch.from_lat.tolist() == [20.0, 10.0]
+    assert grid.branch.to_lon.tolist() == [-10.0, -10.0]
+
+
+def test_add_zone(grid):
+    add_zone_to_grid_data_frames(grid)
+    assert grid.plant.zone_id.tolist() == [1, 2]
+    assert grid.plant.zone_name.tolist() == ["a", "b"]
+    assert grid.branch.from_zone_name.tolist() == ["b", "a"]
+    assert grid.branch.to_zone_id.tolist() == [1, 1]
+
+
+def test_add_interconnect(grid):
+    add_interconnect_to_grid_data_frames(grid)
+    assert grid.bus.interconnect.tolist() == ["East", "West", "West"]
+    assert grid.plant.interconnect.tolist() == ["West", "East"]
+    assert grid.gencost["after"].interconnect.tolist() == ["West", "East"]
+    assert grid.dcline.to_interconnect.tolist() == ["West"]
+
+
+def test_duplicated_bus(grid):
+    grid.bus2sub = pd.concat([grid.bus2sub, grid.bus2sub.iloc[[0]].assign(sub_id=5)])
+    add_coord_to_grid_data_frames(grid)
+    assert grid.bus.lat.tolist() == [10.0, 10.0, 10.0]
+    assert grid.branch.from_lon.tolist() == [-10.0, -10.0]
+
+
+def test_unknown_bus(grid):
+    grid.plant.loc[0, "bus_id"] = 999
+    with pytest.raises(KeyError):
+        add_zone_to_grid_data_frames(grid)
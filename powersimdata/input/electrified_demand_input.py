@@ -1,3 +1,5 @@
+import pandas as pd
+
 from powersimdata.input.profile_input import ProfileInput
 
 
@@ -16,16 +18,22 @@ class ElectrifiedDemand(ProfileInput):
         super().__init__()
         self._file_extension = {}
 
-    def get_profile(self, grid_model, kind, profile):
+    def get_profile(self, grid_model, kind, profile, start=None, end=None, cache=True):
         """Get the specified profile
 
         :param str grid_model: the grid model
         :param str kind: the kind of electrification
         :param str profile: the filename
+        :param str start: first timestamp to load, included. Default to the first
+            timestamp of the profile.
+        :param str end: last timestamp to load, included. Default to the last timestamp
+            of the profile.
+        :param bool cache: whether to use the memory cache.
         :return: (*pandas.DataFrame*) -- profile data frame
         """
         path = f"raw/{grid_model}/{kind}/{profile}.csv"
-        return self._get_data_internal(path)
+        start, end = [None if t is None else str(pd.Timestamp(t)) for t in (start, end)]
+        return self._get_data_internal(path, cache=cache, start=start, end=end)
 
     def get_profile_version(self, grid_model, kind, end_use, tech):
         """Returns available raw profile from blob storage or local disk.
@@ -1,6 +1,6 @@
 import pickle
 
-from powersimdata.input.transform_profile import TransformProfile
+from powersimdata.input.transform_profile import TransformProfile, write_profile
 
 
 def export_grid(grid, file_path):
@@ -28,6 +28,6 @@ def export_transformed_profile(kind, scenario_info, grid, ct, file_path, slice=T
     :param bool slice: whether to slice the profiles by the Scenario's time range.
     """
     tp = TransformProfile(scenario_info, grid, ct, slice)
-    profile = tp.get_profile(kind)
     print(f"Writing scaled {kind} profile to {file_path} on local machine")
-    profile.to_csv(file_path)
+    with open(file_path, "wb") as f:
+        write_profile(tp.iter_profile(kind), f)
@@ -2,9 +2,10 @@ from powersimdata.network.constants.carrier.storage import storage
 from powersimdata.network.europe_tub.model import TUB, PyPSABase
 from powersimdata.network.hifld.model import HIFLD
 from powersimdata.network.usa_tamu.model import TAMU
+from powersimdata.utility import server_setup
 from powersimdata.utility.helpers import MemoryCache, cache_key
 
-_cache = MemoryCache()
+_cache = MemoryCache(max_bytes=server_setup.MEMORY_CACHE_MAX_BYTES)
 
 
 class Grid:
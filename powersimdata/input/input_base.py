@@ -1,6 +1,7 @@
+from powersimdata.utility import server_setup
 from powersimdata.utility.helpers import MemoryCache, cache_key
 
-_cache = MemoryCache()
+_cache = MemoryCache(max_bytes=server_setup.MEMORY_CACHE_MAX_BYTES)
 
 
 class InputBase:
@@ -32,35 +33,40 @@ class InputBase:
         """
         raise NotImplementedError
 
-    def _read(self, f, path):
+    def _read(self, f, path, **kwargs):
         """Read content from file object into data frame
 
         :param io.IOBase f: an open file object
         :param str path: the file path
+        :param \\*\\*kwargs: options passed down to the reader, defined by subclass
         :return: (*object*) -- implementation dependent
         """
         raise NotImplementedError
 
-    def get_data(self, scenario_info, field_name):
+    def get_data(self, scenario_info, field_name, readonly=False):
         """Returns data from (possibly remote) filesystem and cache
         the result in memory.
 
         :param dict scenario_info: scenario information.
         :param str field_name: defined by subclass
+        :param bool readonly: whether a read only view of the cached data is returned
+            instead of a copy. See :func:`powersimdata.utility.helpers.readonly_view`.
         :return: (*object*) -- implementation dependent
         """
         self._check_field(field_name)
         print("--> Loading %s" % field_name)
 
         filepath = self._get_file_path(scenario_info, field_name)
-        return self._get_data_internal(filepath)
+        return self._get_data_internal(filepath, readonly=readonly)
 
-    def _get_data_internal(self, filepath):
-        key = cache_key(filepath)
-        cached = _cache.get(key)
+    def _get_data_internal(self, filepath, readonly=False, cache=True, **kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        key = cache_key(filepath, **kwargs)
+        cached = _cache.get(key, readonly=readonly) if cache else None
         if cached is not None:
             return cached
         with self.data_access.get(filepath) as (f, path):
-            data = self._read(f, path)
-        _cache.put(key, data)
+            data = self._read(f, path, **kwargs)
+        if cache:
+            _cache.put(key, data)
         return data
@@ -1,12 +1,18 @@
+import hashlib
 import os
 import pickle
 
+import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
 
 from powersimdata.data_access.context import Context
 from powersimdata.data_access.fs_helper import get_scenario_fs
 from powersimdata.input.input_base import InputBase
 from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import MemoryCache, cache_key
+
+_cache = MemoryCache(max_bytes=server_setup.MEMORY_CACHE_MAX_BYTES)
 
 
 class InputData(InputBase):
@@ -56,13 +62,50 @@ class InputData(InputBase):
             pickle.dump(ct, f)
 
 
-def distribute_demand_from_zones_to_buses(zone_demand, bus):
+def get_zone_to_bus_shares(bus):
+    """Get the share of the demand of each zone allocated to each of its buses, based
+    on bus 'Pd' column. The shares are cached for each distinct set of bus IDs, zone
+    IDs and 'Pd' values.
+
+    :param pandas.DataFrame bus: table of bus data, containing at least 'zone_id' and
+        'Pd' columns.
+    :return: (*tuple*) -- sparse matrix of shares in CSR format, with one row per bus
+        and one column per zone, followed by the bus IDs (*pandas.Index*) and the zone
+        IDs (*pandas.Index*) labelling the rows and the columns of the matrix.
+    """
+    bus = bus.sort_index()
+    hashed = pd.util.hash_pandas_object(bus[["zone_id", "Pd"]], index=True)
+    digest = hashlib.sha1(hashed.to_numpy().tobytes()).hexdigest()
+    key = cache_key("zone_to_bus_shares", digest)
+    cached = _cache.get(key, readonly=True)
+    if cached is not None:
+        return cached
+
+    zone_id = bus["zone_id"].to_numpy()
+    bus_pd = bus["Pd"].to_numpy(dtype=np.float64)
+    zones, col = np.unique(zone_id, return_inverse=True)
+    zone_pd = np.bincount(col, weights=bus_pd, minlength=len(zones))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = bus_pd / zone_pd[col]
+    share[np.isnan(share)] = 0
+    shares = csr_matrix(
+        (share, (np.arange(len(bus)), col)), shape=(len(bus), len(zones))
+    )
+    shares.eliminate_zeros()
+    result = (shares, bus.index, pd.Index(zones, name="zone_id"))
+    _cache.put(key, result)
+    return result
+
+
+def distribute_demand_from_zones_to_buses(zone_demand, bus, dtype=None):
     """Decomposes zone demand to bus demand based on bus 'Pd' column.
 
     :param pandas.DataFrame zone_demand: demand by zone. Index is timestamp, columns are
         zone IDs, values are zone demand (MW).
     :param pandas.DataFrame bus: table of bus data, containing at least 'zone_id' and
         'Pd' columns.
+    :param str dtype: data type of the bus demand, e.g. *'float32'*. Default to the
+        data type of ``zone_demand``.
     :return: (*pandas.DataFrame*) -- data frame of demand. Index is timestamp, columns
         are bus IDs, values are bus demand (MW).
     :raises ValueError: if the columns of ``zone_demand`` don't match the set of zone
@@ -70,18 +113,34 @@ def distribute_demand_from_zones_to_buses(zone_demand, bus):
     """
     if set(bus["zone_id"].unique()) != set(zone_demand.columns):
         raise ValueError("zones don't match between zone_demand and bus dataframes")
-    grouped_buses = bus.groupby("zone_id")
-    bus_zone_pd = grouped_buses["Pd"].transform("sum")
-    bus_zone_share = pd.concat(
-        [pd.Series(bus["Pd"] / bus_zone_pd, name="zone_share"), bus["zone_id"]], axis=1
-    )
-    zone_bus_shares = bus_zone_share.pivot_table(
-        index="bus_id",
-        columns="zone_id",
-        values="zone_share",
-        dropna=False,
-        fill_value=0,
-    )
-    bus_demand = zone_demand.dot(zone_bus_shares.T)
+    shares, bus_id, zone_id = get_zone_to_bus_shares(bus)
+    values = zone_demand.loc[:, zone_id].to_numpy(dtype=dtype)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    bus_demand = shares.astype(values.dtype, copy=False).dot(values.T).T
+
+    return pd.DataFrame(bus_demand, index=zone_demand.index, columns=bus_id)
 
-    return bus_demand
+
+def iter_demand_from_zones_to_buses(zone_demand, bus, freq="1M", dtype=None):
+    """Decomposes zone demand to bus demand one time window at a time, such that the
+    bus demand is never fully held in memory.
+
+    :param pandas.DataFrame zone_demand: demand by zone. Index is timestamp, columns are
+        zone IDs, values are zone demand (MW).
+    :param pandas.DataFrame bus: table of bus data, containing at least 'zone_id' and
+        'Pd' columns.
+    :param str freq: length of the time windows, as a pandas offset alias, e.g. *'1M'*
+        for one month or *'7D'* for one week.
+    :param str dtype: data type of the bus demand, e.g. *'float32'*. Default to the
+        data type of ``zone_demand``.
+    :return: (*generator*) -- bus demand of consecutive time windows, see
+        :func:`distribute_demand_from_zones_to_buses`.
+    :raises ValueError: if the columns of ``zone_demand`` don't match the set of zone
+        IDs within the 'zone_id' column of ``bus``.
+    """
+    if set(bus["zone_id"].unique()) != set(zone_demand.columns):
+        raise ValueError("zones don't match between zone_demand and bus dataframes")
+    for _, window in zone_demand.groupby(pd.Grouper(freq=freq)):
+        if len(window) > 0:
+            yield distribute_demand_from_zones_to_buses(window, bus, dtype=dtype)
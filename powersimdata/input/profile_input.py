@@ -1,11 +1,15 @@
+from contextlib import contextmanager
+
 import pandas as pd
 from fs import errors
 from fs.multifs import MultiFS
 
 from powersimdata.data_access.context import Context
-from powersimdata.data_access.fs_helper import get_blob_fs
+from powersimdata.data_access.fs_helper import PooledFS, get_blob_fs
 from powersimdata.input.input_base import InputBase
+from powersimdata.input.profile_store import ProfileStore
 from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import readonly_view
 
 profile_kind = {
     "demand",
@@ -41,7 +45,7 @@ def get_profile_version(_fs, grid_model, kind):
 def _make_fs():
     mfs = MultiFS()
     writeable = server_setup.BLOB_TOKEN_RW is not None
-    mfs.add_fs("profile_fs", get_blob_fs("profiles"), write=writeable)
+    mfs.add_fs("profile_fs", PooledFS(lambda: get_blob_fs("profiles")), write=writeable)
     return mfs
 
 
@@ -52,6 +56,133 @@ class ProfileInput(InputBase):
         super().__init__()
         self._file_extension = {k: "csv" for k in profile_kind}
         self.data_access = Context.get_data_access(_make_fs)
+        self._store = ProfileStore(dtype=server_setup.PROFILE_STORE_DTYPE)
+        self._sources = None
+
+    def get_data(
+        self,
+        scenario_info,
+        field_name,
+        readonly=False,
+        columns=None,
+        start=None,
+        end=None,
+        cache=True,
+    ):
+        """Returns profile from (possibly remote) filesystem and cache the result in
+        memory. The selection of columns and time range is done by the reader, such
+        that only the requested part of the profile is held in memory.
+
+        :param dict scenario_info: scenario information.
+        :param str field_name: the kind of profile.
+        :param bool readonly: whether a read only view of the cached data is returned
+            instead of a copy.
+        :param list columns: columns of the profile to load. Default to all columns.
+        :param str start: first timestamp to load, included. Default to the first
+            timestamp of the profile.
+        :param str end: last timestamp to load, included. Default to the last timestamp
+            of the profile.
+        :param bool cache: whether to look up and store the profile in the memory
+            cache. Disable it for data loaded once, e.g. consecutive time windows.
+        :return: (*pandas.DataFrame*) -- profile data frame
+        """
+        self._check_field(field_name)
+        print("--> Loading %s" % field_name)
+
+        filepath = self._get_file_path(scenario_info, field_name)
+        if columns is not None:
+            columns = pd.Index(columns).tolist()
+        start, end = [None if t is None else str(pd.Timestamp(t)) for t in (start, end)]
+        return self._get_data_internal(
+            filepath,
+            readonly=readonly,
+            cache=cache,
+            columns=columns,
+            start=start,
+            end=end,
+        )
+
+    def _get_data_internal(self, filepath, readonly=False, cache=True, **kwargs):
+        """Returns profile. In read only mode, the profile is memory mapped from its
+        binary copy, if any, rather than cached in memory, such that processes loading
+        the same profile share the pages read from disk.
+
+        :param str filepath: path to the file.
+        :param bool readonly: whether a read only view of the profile is returned
+            instead of a copy.
+        :param bool cache: whether to use the memory cache.
+        :param \\*\\*kwargs: options passed down to the reader.
+        :return: (*pandas.DataFrame*) -- profile data frame
+        """
+        if not cache and self._sources is not None:
+            return self._get_streamed(filepath, readonly, **kwargs)
+        if readonly:
+            kwargs = {k: v for k, v in kwargs.items() if v is not None}
+            with self.data_access.get(filepath) as (_, path):
+                data = self._store.load(path, mmap=True, **kwargs)
+            if data is not None:
+                return data
+        return super()._get_data_internal(
+            filepath, readonly=readonly, cache=cache, **kwargs
+        )
+
+    @contextmanager
+    def streaming(self):
+        """Context in which profiles loaded without the memory cache, e.g. consecutive
+        time windows, are located once. The first load of a profile fetches it from
+        the data store. The following ones read its binary copy directly or, if the
+        profile cannot have a binary copy, slice the profile parsed by the first load.
+        """
+        previous = self._sources
+        if previous is None:
+            self._sources = {}
+        try:
+            yield
+        finally:
+            self._sources = previous
+
+    def _locate(self, filepath):
+        """Fetch a profile and make sure its binary copy is up to date.
+
+        :param str filepath: path to the file.
+        :return: (*str/pandas.DataFrame*) -- local path to the profile if it has an
+            up to date binary copy, otherwise the full profile.
+        """
+        with self.data_access.get(filepath) as (f, path):
+            if self._store.load(path, columns=[]) is None:
+                data = self._read(f, path)
+                if self._store.load(path, columns=[]) is None:
+                    return data
+        return path
+
+    def _get_streamed(self, filepath, readonly, columns=None, start=None, end=None):
+        """Returns part of a profile located once per streaming context, see
+        :meth:`streaming`.
+
+        :param str filepath: path to the file.
+        :param bool readonly: whether a read only view of the profile is returned
+            instead of a copy.
+        :param list columns: columns of the profile to load. Default to all columns.
+        :param str start: first timestamp to load, included.
+        :param str end: last timestamp to load, included.
+        :return: (*pandas.DataFrame*) -- profile data frame
+        """
+        if filepath not in self._sources:
+            self._sources[filepath] = self._locate(filepath)
+        source = self._sources[filepath]
+        if isinstance(source, str):
+            kwargs = {"columns": columns, "start": start, "end": end}
+            data = self._store.load(source, mmap=readonly, **kwargs)
+            if data is not None:
+                return data
+            # The binary copy went stale, fetch the profile again
+            source = self._sources[filepath] = self._locate(filepath)
+            if isinstance(source, str):
+                return self._store.load(source, mmap=readonly, **kwargs)
+        data = source.loc[start:end]
+        if columns is not None:
+            data = data[columns]
+        return readonly_view(data) if readonly else data.copy()
 
     def _get_file_path(self, scenario_info, field_name):
         """Get the path to the specified profile
@@ -68,13 +199,22 @@ class ProfileInput(InputBase):
         grid_model = scenario_info["grid_model"]
         return "/".join(["raw", grid_model, file_name])
 
-    def _read(self, f, path):
-        """Read content from file object into data frame
+    def _read(self, f, path, columns=None, start=None, end=None):
+        """Read content from file object into data frame. The profile is loaded from
+        its binary copy in the local data directory if it is up to date, otherwise the
+        csv file is parsed and the binary copy is created.
 
         :param io.IOBase f: an open file object
         :param str path: the file path
+        :param list columns: columns of the profile to load. Default to all columns.
+        :param str start: first timestamp to load, included.
+        :param str end: last timestamp to load, included.
         :return: (*pandas.DataFrame*) -- profile data frame
         """
+        data = self._store.load(path, columns=columns, start=start, end=end)
+        if data is not None:
+            return data
+
         data = pd.read_csv(f, index_col=0, parse_dates=True)
         if "demand_flexibility" in path:
             data.columns = data.columns.astype(str)
@@ -82,7 +222,10 @@ class ProfileInput(InputBase):
             data.columns = data.columns.astype(int)
         else:
             data.columns = data.columns.astype(str)
-        return data
+        self._store.save(path, data)
+        if start is not None or end is not None:
+            data = data.loc[start:end]
+        return data if columns is None else data[columns]
 
     def get_profile_version(self, grid_model, kind):
         """Returns available raw profile from blob storage or local disk.
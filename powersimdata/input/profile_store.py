@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import get_checksum
+
+
+class ProfileStore:
+    """Binary copy of raw profiles enclosed in csv files, stored in the local data
+    directory. The values are stored column by column in a NumPy array, such that a
+    subset of the columns can be read without loading the full profile. The index and
+    the columns are stored along with the checksum of the source csv file in a separate
+    metadata file. A copy is discarded as soon as the checksum of the source file
+    changes.
+
+    :param str root: directory enclosing the binary copies. Defaults to the *cache*
+        folder of the local data directory.
+    :param str dtype: data type of the stored values, e.g. *'float32'*. Defaults to the
+        data type of the profile.
+    """
+
+    def __init__(self, root=None, dtype=None):
+        """Constructor."""
+        self.root = (
+            os.path.join(server_setup.LOCAL_DIR, "cache") if root is None else root
+        )
+        self.dtype = None if dtype is None else np.dtype(dtype)
+
+    def _get_dir(self, path):
+        """Get directory enclosing the binary copy of a csv file.
+
+        :param str path: path to csv file.
+        :return: (*str*) -- path to directory.
+        """
+        path = os.path.abspath(path)
+        rel = os.path.relpath(path, os.path.abspath(server_setup.LOCAL_DIR))
+        if rel.startswith(os.pardir):
+            rel = hashlib.sha1(path.encode()).hexdigest()
+        return os.path.join(self.root, os.path.splitext(rel)[0])
+
+    def _read_metadata(self, path):
+        """Read metadata of the binary copy of a csv file if it is up to date.
+
+        :param str path: path to csv file.
+        :return: (*dict*) -- metadata or None if the binary copy is missing or stale.
+        """
+        meta_file = os.path.join(self._get_dir(path), "meta.json")
+        try:
+            with open(meta_file) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        stat = os.stat(path)
+        if (stat.st_size, stat.st_mtime_ns) == (meta["size"], meta["mtime_ns"]):
+            return meta
+        if stat.st_size == meta["size"] and get_checksum(path) == meta["checksum"]:
+            meta["mtime_ns"] = stat.st_mtime_ns
+            with open(meta_file, "w") as f:
+                json.dump(meta, f)
+            return meta
+        return None
+
+    def load(self, path, columns=None, start=None, end=None, mmap=False):
+        """Load the binary copy of a csv file. Only the requested columns and time
+        range are read from disk.
+
+        :param str path: path to csv file.
+        :param list columns: columns to load. Default to all columns.
+        :param str start: first timestamp to load, included. Default to the first
+            timestamp of the profile.
+        :param str end: last timestamp to load, included. Default to the last timestamp
+            of the profile.
+        :param bool mmap: if True, the values are memory mapped instead of being read
+            in memory. The data frame is then read only and, if the requested columns
+            are adjacent in the profile, it does not hold any copy of the data. The
+            pages read are shared by all the processes mapping the same file.
+        :return: (*pandas.DataFrame*) -- profile or None if the binary copy is missing
+            or stale.
+        :raises KeyError: if some columns are not in the profile.
+        """
+        meta = self._read_metadata(path)
+        if meta is None:
+            return None
+
+        store_dir = self._get_dir(path)
+        mapped = np.load(os.path.join(store_dir, "values.npy"), mmap_mode="r")
+        index = pd.DatetimeIndex(
+            np.load(os.path.join(store_dir, "index.npy")), name=meta["index_name"]
+        )
+        all_columns = pd.Index(meta["columns"])
+        rows = index.slice_indexer(start, end)
+        index = index[rows]
+        values = np.asarray(mapped)[:, rows]
+        if columns is None:
+            columns = all_columns
+        else:
+            columns = pd.Index(columns)
+            loc = all_columns.get_indexer(columns)
+            if (loc == -1).any():
+                raise KeyError(f"{list(columns[loc == -1])} not in profile")
+            if len(loc) > 0 and (np.diff(loc) == 1).all():
+                values = values[loc[0] : loc[-1] + 1]
+            else:
+                values = values[loc]
+        if not mmap and np.may_share_memory(values, mapped):
+            values = values.copy()
+        return pd.DataFrame(values.T, index=index, columns=columns, copy=False)
+
+    def save(self, path, data):
+        """Save binary copy of a csv file. Profiles with mixed or non numerical data
+        types or a non datetime index are not saved.
+
+        :param str path: path to csv file.
+        :param pandas.DataFrame data: profile enclosed in csv file.
+        """
+        dtypes = set(data.dtypes)
+        if (
+            len(dtypes) != 1
+            or not is_numeric_dtype(dtypes.pop())
+            or not is_datetime64_any_dtype(data.index)
+            or data.index.tz is not None
+        ):
+            return
+
+        stat = os.stat(path)
+        meta = {
+            "checksum": get_checksum(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "index_name": data.index.name,
+            "columns": data.columns.tolist(),
+        }
+        store_dir = self._get_dir(path)
+        tmp_dir = f"{store_dir}.tmp{os.getpid()}-{threading.get_ident()}"
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            values = np.ascontiguousarray(data.to_numpy(dtype=self.dtype).T)
+            np.save(os.path.join(tmp_dir, "values.npy"), values)
+            np.save(os.path.join(tmp_dir, "index.npy"), data.index.to_numpy())
+            with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+                json.dump(meta, f)
+            shutil.rmtree(store_dir, ignore_errors=True)
+            os.replace(tmp_dir, store_dir)
+        except OSError as e:
+            print(f"Could not save binary copy of {path}: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -4,6 +4,7 @@ import pytest
 from powersimdata.data_access.context import Context
 from powersimdata.input.change_table import ChangeTable
 from powersimdata.input.grid import Grid
+from powersimdata.input.transform_grid import TransformGrid
 from powersimdata.tests.mock_context import MockContext
 
 grid = Grid(["USA"])
@@ -569,3 +570,78 @@ def test_add_demand_flexibility(monkeypatch):
         },
     }
     assert ct.ct == exp_dict
+
+
+def test_incremental_transform_matches_full_transform(ct):
+    def check(tables=("bus", "sub", "bus2sub", "branch", "plant")):
+        expected = TransformGrid(grid, ct.ct).get_grid()
+        transformed = ct._get_transformed_grid()
+        for t in tables:
+            pd.testing.assert_frame_equal(getattr(transformed, t), getattr(expected, t))
+        pd.testing.assert_frame_equal(
+            transformed.storage["gen"], expected.storage["gen"]
+        )
+        return transformed
+
+    bus_id = (
+        grid.bus.query("interconnect == 'Western' and baseKV == 345").index[:2].tolist()
+    )
+    new_bus_id = int(grid.bus.index.max() + 1)
+    ct.add_bus([{"lat": 40, "lon": -110, "zone_id": 201, "baseKV": 345}])
+    first = check()
+    ct.add_branch([{"from_bus_id": bus_id[0], "to_bus_id": new_bus_id, "capacity": 10}])
+    ct.add_plant([{"type": "solar", "bus_id": new_bus_id, "Pmax": 5}])
+    ct.add_storage_capacity([{"bus_id": new_bus_id, "capacity": 1}])
+    second = check()
+    assert second is not first
+    ct.add_branch([{"from_bus_id": bus_id[1], "to_bus_id": new_bus_id, "capacity": 20}])
+    check()
+    ct.remove_branch({grid.branch.index[0]})
+    check()
+    ct.scale_plant_capacity("solar", zone_name={"Arizona": 2})
+    check()
+    assert ct._get_transformed_grid() is ct._get_transformed_grid()
+
+
+def test_incremental_transform_new_branch_after_branch_scaling(ct):
+    def check():
+        expected = TransformGrid(grid, ct.ct).get_grid()
+        transformed = ct._get_transformed_grid()
+        pd.testing.assert_frame_equal(transformed.branch, expected.branch)
+
+    bus_id = grid.bus.query("zone_id == 201 and baseKV == 345").index[:3].tolist()
+    ct.scale_branch_capacity(zone_name={"Washington": 4})
+    check()
+    ct.add_branch([{"from_bus_id": bus_id[0], "to_bus_id": bus_id[1], "capacity": 10}])
+    check()
+    ct.add_branch([{"from_bus_id": bus_id[1], "to_bus_id": bus_id[2], "capacity": 20}])
+    check()
+
+
+def test_incremental_transform_new_branch_after_branch_id_scaling(ct):
+    bus_id = grid.bus.query("zone_id == 201 and baseKV == 345").index[:2].tolist()
+    from_kv = grid.bus.loc[grid.branch.from_bus_id, "baseKV"].to_numpy()
+    to_kv = grid.bus.loc[grid.branch.to_bus_id, "baseKV"].to_numpy()
+    line = grid.branch[(from_kv == 345) & (to_kv == 345)]
+    line = line.query("branch_device_type == 'Line' and from_lat != to_lat")
+    ct.scale_branch_capacity(branch_id={line.index[0]: 4})
+    ct._get_transformed_grid()
+    ct.add_branch([{"from_bus_id": bus_id[0], "to_bus_id": bus_id[1], "capacity": 10}])
+    expected = TransformGrid(grid, ct.ct).get_grid()
+    transformed = ct._get_transformed_grid()
+    pd.testing.assert_frame_equal(transformed.branch, expected.branch)
+
+
+def test_incremental_transform_successive_storage(ct):
+    bus_id = grid.bus.query("interconnect == 'Western'").index[:2].tolist()
+    ct.add_storage_capacity([{"bus_id": bus_id[0], "capacity": 1}])
+    ct._get_transformed_grid()
+    ct.add_storage_capacity([{"bus_id": bus_id[1], "capacity": 2}])
+    expected = TransformGrid(grid, ct.ct).get_grid()
+    transformed = ct._get_transformed_grid()
+    for table in ("gen", "StorageData"):
+        pd.testing.assert_frame_equal(
+            transformed.storage[table], expected.storage[table]
+        )
+    unit_idx = transformed.storage["StorageData"]["UnitIdx"]
+    assert unit_idx.is_unique
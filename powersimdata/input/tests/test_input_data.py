@@ -1,6 +1,13 @@
+import pandas as pd
 import pytest
 
-from powersimdata.input.input_data import InputData
+from powersimdata.input.input_data import (
+    InputData,
+    _cache,
+    distribute_demand_from_zones_to_buses,
+    get_zone_to_bus_shares,
+    iter_demand_from_zones_to_buses,
+)
 
 _input_data = InputData()
 
@@ -20,3 +27,65 @@ def test_check_field():
     with pytest.raises(ValueError):
         _check_field("foo")
         _check_field("solar")
+
+
+def _get_zone_demand_and_bus():
+    bus = pd.DataFrame(
+        {"zone_id": [2, 1, 1, 2, 3], "Pd": [10.0, 1.0, 3.0, 30.0, 0.0]},
+        index=pd.Index([5, 4, 3, 2, 1], name="bus_id"),
+    )
+    zone_demand = pd.DataFrame(
+        {1: [4.0, 8.0, 12.0], 2: [40.0, 80.0, 120.0], 3: [1.0, 2.0, 3.0]},
+        index=pd.date_range("2016-01-31 23:00", periods=3, freq="H"),
+    )
+    return zone_demand, bus
+
+
+def test_distribute_demand_from_zones_to_buses():
+    zone_demand, bus = _get_zone_demand_and_bus()
+    expected = pd.DataFrame(
+        {1: [0.0] * 3, 2: [30.0, 60.0, 90.0], 3: [3.0, 6.0, 9.0], 4: [1.0, 2.0, 3.0]},
+        index=zone_demand.index,
+    )
+    expected[5] = [10.0, 20.0, 30.0]
+    expected.columns.name = "bus_id"
+
+    bus_demand = distribute_demand_from_zones_to_buses(zone_demand, bus)
+    pd.testing.assert_frame_equal(expected, bus_demand)
+
+    bus_demand = distribute_demand_from_zones_to_buses(zone_demand, bus, "float32")
+    pd.testing.assert_frame_equal(expected.astype("float32"), bus_demand)
+
+    with pytest.raises(ValueError):
+        distribute_demand_from_zones_to_buses(zone_demand.drop(columns=3), bus)
+
+
+def test_distribute_demand_from_zones_to_buses_with_string_ids():
+    zone_demand, bus = _get_zone_demand_and_bus()
+    expected = distribute_demand_from_zones_to_buses(zone_demand, bus)
+    bus.index = pd.Index([f"b{i}" for i in bus.index], name="bus_id")
+    expected.columns = pd.Index([f"b{i}" for i in expected.columns], name="bus_id")
+    bus_demand = distribute_demand_from_zones_to_buses(zone_demand, bus)
+    pd.testing.assert_frame_equal(expected, bus_demand)
+
+
+def test_get_zone_to_bus_shares_is_cached_by_content():
+    _, bus = _get_zone_demand_and_bus()
+    shares, _, _ = get_zone_to_bus_shares(bus)
+    hits = _cache.hits
+    assert (get_zone_to_bus_shares(bus.copy())[0] != shares).nnz == 0
+    assert _cache.hits == hits + 1
+    bus.loc[5, "Pd"] = 20.0
+    assert (get_zone_to_bus_shares(bus)[0] != shares).nnz == 2
+    assert _cache.hits == hits + 1
+
+
+def test_iter_demand_from_zones_to_buses():
+    zone_demand, bus = _get_zone_demand_and_bus()
+    chunks = list(iter_demand_from_zones_to_buses(zone_demand, bus))
+    assert [len(c) for c in chunks] == [1, 2]
+    pd.testing.assert_frame_equal(
+        distribute_demand_from_zones_to_buses(zone_demand, bus),
+        pd.concat(chunks),
+        check_freq=False,
+    )
@@ -1,9 +1,16 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
 from fs.tempfs import TempFS
 
+from powersimdata.data_access.data_access import TempDataAccess
 from powersimdata.input.electrified_demand_input import (
     get_profile_version as get_profile_version_elec,
 )
+from powersimdata.input.input_base import _cache
 from powersimdata.input.profile_input import ProfileInput, get_profile_version
+from powersimdata.input.profile_store import ProfileStore
 
 
 def test_get_profile_version():
@@ -40,3 +47,99 @@ def test_get_profile_version_electrification():
         )
         assert "v1" == version[0]
         assert [] == v_missing
+
+
+def test_get_data_columns_and_time_range(tmp_path):
+    index = pd.date_range("2016-01-01", periods=48, freq="H", name="UTC")
+    profile = pd.DataFrame(np.random.random((48, 4)), index=index, columns=[1, 2, 3, 4])
+    tda = TempDataAccess()
+    with tda.local_fs.makedirs("raw/usa_tamu").openbin("solar_vTest.csv", "w") as f:
+        f.write(profile.to_csv().encode())
+
+    with patch("powersimdata.input.profile_input.Context") as context:
+        context.get_data_access.return_value = tda
+        profile_input = ProfileInput()
+    profile_input._store = ProfileStore(root=str(tmp_path))
+
+    s_info = {"base_solar": "vTest", "grid_model": "usa_tamu"}
+    kwargs = {"columns": [3, 2], "start": "2016-01-02 00:00", "end": "2016-01-02 05:00"}
+    expected = profile.loc[kwargs["start"] : kwargs["end"], kwargs["columns"]]
+    for readonly in (False, True):
+        data = profile_input.get_data(s_info, "solar", readonly=readonly, **kwargs)
+        pd.testing.assert_frame_equal(data, expected, check_freq=False)
+
+
+def test_get_data_without_cache(tmp_path):
+    index = pd.date_range("2016-01-01", periods=48, freq="H", name="UTC")
+    profile = pd.DataFrame(np.random.random((48, 4)), index=index, columns=[1, 2, 3, 4])
+    tda = TempDataAccess()
+    with tda.local_fs.makedirs("raw/usa_tamu").openbin("wind_vTest.csv", "w") as f:
+        f.write(profile.to_csv().encode())
+
+    with patch("powersimdata.input.profile_input.Context") as context:
+        context.get_data_access.return_value = tda
+        profile_input = ProfileInput()
+    profile_input._store = ProfileStore(root=str(tmp_path))
+
+    s_info = {"base_wind": "vTest", "grid_model": "usa_tamu"}
+    keys = _cache.list_keys()
+    data = profile_input.get_data(s_info, "wind", end="2016-01-01 05:00", cache=False)
+    pd.testing.assert_frame_equal(data, profile.iloc[:6], check_freq=False)
+    assert _cache.list_keys() == keys
+    profile_input.get_data(s_info, "wind", end="2016-01-01 05:00")
+    assert len(_cache.list_keys()) == len(keys) + 1
+
+
+def _get_streaming_input(tmp_path, profile):
+    tda = TempDataAccess()
+    with tda.local_fs.makedirs("raw/usa_tamu").openbin("hydro_vTest.csv", "w") as f:
+        f.write(profile.to_csv().encode())
+
+    with patch("powersimdata.input.profile_input.Context") as context:
+        context.get_data_access.return_value = tda
+        profile_input = ProfileInput()
+    profile_input._store = ProfileStore(root=str(tmp_path))
+    return profile_input
+
+
+def _get_windows(profile_input, readonly):
+    s_info = {"base_hydro": "vTest", "grid_model": "usa_tamu"}
+    kwargs = {"readonly": readonly, "columns": [2, 1], "cache": False}
+    with patch.object(
+        profile_input.data_access, "get", wraps=profile_input.data_access.get
+    ) as get, patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+        with profile_input.streaming():
+            windows = [
+                profile_input.get_data(s_info, "hydro", start=start, end=end, **kwargs)
+                for start, end in (
+                    ("2016-01-01 00:00", "2016-01-01 11:00"),
+                    ("2016-01-01 12:00", "2016-01-01 23:00"),
+                    ("2016-01-02 00:00", "2016-01-02 23:00"),
+                )
+            ]
+    return windows, get.call_count, read_csv.call_count
+
+
+def test_streaming_locates_profile_once(tmp_path):
+    index = pd.date_range("2016-01-01", periods=48, freq="H", name="UTC")
+    profile = pd.DataFrame(np.random.random((48, 2)), index=index, columns=[1, 2])
+    profile_input = _get_streaming_input(tmp_path, profile)
+    for readonly in (False, True):
+        windows, n_get, n_read = _get_windows(profile_input, readonly)
+        assert n_get == 1
+        assert n_read <= 1
+        pd.testing.assert_frame_equal(
+            pd.concat(windows), profile[[2, 1]], check_freq=False
+        )
+
+
+def test_streaming_parses_profile_without_binary_copy_once(tmp_path):
+    index = pd.date_range("2016-01-01", periods=48, freq="H", name="UTC", tz="UTC")
+    profile = pd.DataFrame(np.random.random((48, 2)), index=index, columns=[1, 2])
+    profile_input = _get_streaming_input(tmp_path, profile)
+    for readonly in (False, True):
+        windows, n_get, n_read = _get_windows(profile_input, readonly)
+        assert (n_get, n_read) == (1, 1)
+        pd.testing.assert_frame_equal(
+            pd.concat(windows), profile[[2, 1]], check_freq=False
+        )
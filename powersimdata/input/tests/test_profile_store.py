@@ -0,0 +1,93 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from powersimdata.input.profile_store import ProfileStore
+
+
+def _make_profile():
+    index = pd.date_range("2016-01-01", periods=24, freq="H", name="UTC")
+    data = np.arange(24 * 3, dtype=float).reshape(24, 3)
+    return pd.DataFrame(data, index=index, columns=[101, 102, 103])
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = os.path.join(tmp_path, "solar_vTest.csv")
+    _make_profile().to_csv(path)
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(root=os.path.join(tmp_path, "cache"))
+
+
+def test_load_missing_copy(store, csv_file):
+    assert store.load(csv_file) is None
+
+
+def test_save_and_load(store, csv_file):
+    profile = _make_profile()
+    store.save(csv_file, profile)
+    pd.testing.assert_frame_equal(store.load(csv_file), profile, check_freq=False)
+
+
+def test_load_columns(store, csv_file):
+    profile = _make_profile()
+    store.save(csv_file, profile)
+    loaded = store.load(csv_file, columns=[103, 101])
+    pd.testing.assert_frame_equal(loaded, profile[[103, 101]], check_freq=False)
+    with pytest.raises(KeyError):
+        store.load(csv_file, columns=[101, 999])
+
+
+def test_load_time_range(store, csv_file):
+    profile = _make_profile()
+    store.save(csv_file, profile)
+    start, end = "2016-01-01 05:00", "2016-01-01 10:00"
+    loaded = store.load(csv_file, columns=[101], start=start, end=end)
+    pd.testing.assert_frame_equal(
+        loaded, profile.loc[start:end, [101]], check_freq=False
+    )
+
+
+def test_load_mmap(store, csv_file):
+    profile = _make_profile()
+    store.save(csv_file, profile)
+    loaded = store.load(csv_file, columns=[102, 103], mmap=True)
+    pd.testing.assert_frame_equal(loaded, profile[[102, 103]], check_freq=False)
+    assert isinstance(loaded.values.base, np.ndarray)
+    with pytest.raises(ValueError):
+        loaded.values[0, 0] = 0
+    assert loaded.loc["2016-01-01 05:00":"2016-01-01 10:00"].values.base is not None
+
+
+def test_save_with_dtype(tmp_path, csv_file):
+    store = ProfileStore(root=os.path.join(tmp_path, "cache"), dtype="float32")
+    profile = _make_profile()
+    store.save(csv_file, profile)
+    loaded = store.load(csv_file)
+    assert (loaded.dtypes == np.float32).all()
+    pd.testing.assert_frame_equal(loaded, profile.astype(np.float32), check_freq=False)
+
+
+def test_copy_is_discarded_when_source_changes(store, csv_file):
+    profile = _make_profile()
+    store.save(csv_file, profile)
+    (profile + 1).to_csv(csv_file)
+    assert store.load(csv_file) is None
+
+
+def test_copy_is_kept_when_only_mtime_changes(store, csv_file):
+    store.save(csv_file, _make_profile())
+    os.utime(csv_file, ns=(0, 0))
+    assert store.load(csv_file) is not None
+
+
+def test_non_numeric_profile_is_not_saved(store, csv_file):
+    profile = _make_profile().astype(str)
+    store.save(csv_file, profile)
+    assert store.load(csv_file) is None
@@ -52,7 +52,7 @@ def test_aggregate_demand():
 
     mock_input = MockProfileInput(grid)
     demand = mock_input.get_data(None, "demand")
-    mock_input.get_profile = lambda *args: demand
+    mock_input.get_profile = lambda *args, **kwargs: demand
 
     td = TransformDemand(grid, ct, kind)
     td._profile_data = mock_input
@@ -60,3 +60,37 @@ def test_aggregate_demand():
 
     pd.testing.assert_series_equal(0.7 * demand.loc[:, 308], result.loc[:, 308])
     pd.testing.assert_frame_equal(0.3 * demand.loc[:, :307], result.loc[:, :307])
+
+
+def test_aggregate_demand_multiple_profiles():
+    grid = Grid("Texas")
+    ct = ChangeTable(grid)
+    kind = "building"
+    zone_info = {
+        "East": {"res_cooking": {"advanced_heat_pump_v2": 0.7}},
+        "Coast": {"com_hot_water": {"standard_heat_pump_v1": 0.6}},
+    }
+    grid_info = {
+        "res_cooking": {"advanced_heat_pump_v2": 0.3},
+        "res_heating": {"standard_heat_pump_v2": 0.5},
+    }
+    ct.add_electrification(kind, {"zone": zone_info, "grid": grid_info})
+
+    mock_input = MockProfileInput(grid)
+    demand = mock_input.get_data(None, "demand")
+    mock_input.get_profile = lambda *args, **kwargs: demand
+
+    td = TransformDemand(grid, ct.ct, kind)
+    td._profile_data = mock_input
+    result = td.value()
+
+    pd.testing.assert_series_equal(2.2 * demand.loc[:, 308], result.loc[:, 308])
+    pd.testing.assert_series_equal(1.4 * demand.loc[:, 307], result.loc[:, 307])
+    pd.testing.assert_frame_equal(1.8 * demand.loc[:, :306], result.loc[:, :306])
+
+
+def test_electrified_demand_without_profiles():
+    grid = Grid("Texas")
+    ct = {"building": {"zone": {}, "grid": {}}}
+    td = TransformDemand(grid, ct, "building")
+    assert td.value() == 0
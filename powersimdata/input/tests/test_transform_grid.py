@@ -261,6 +261,27 @@ def test_scale_gen_pmin_two_types_two_zones(ct):
         )
 
 
+def test_scale_capacity_cost_and_pmin_in_same_zone(ct):
+    gen_type = "ng"
+    zone = "Arizona"
+    ct.scale_plant_capacity(gen_type, zone_name={zone: 2})
+    ct.scale_plant_cost(gen_type, zone_name={zone: 1.5})
+    ct.scale_plant_pmin(gen_type, zone_name={zone: 0.5})
+    new_grid = TransformGrid(grid, ct.ct).get_grid()
+    plant_id = get_plant_id(grid.zone2id[zone], gen_type)
+
+    old_plant, new_plant = grid.plant.loc[plant_id], new_grid.plant.loc[plant_id]
+    assert new_plant.Pmax.equals(old_plant.Pmax * 2)
+    assert new_plant.Pmin.equals(old_plant.Pmin * 2 * 0.5)
+    old_cost = grid.gencost["before"].loc[plant_id]
+    new_cost = new_grid.gencost["before"].loc[plant_id]
+    assert new_cost.c0.equals(old_cost.c0 * 2 * 1.5)
+    assert new_cost.c1.equals(old_cost.c1 * 1.5)
+    assert new_cost.c2.equals(old_cost.c2 / 2 * 1.5)
+    other = grid.plant.index.difference(plant_id)
+    assert new_grid.plant.loc[other].equals(grid.plant.loc[other])
+
+
 def test_scale_branch_one_zone(ct):
     factor = 4
     zone = "Washington"
@@ -559,6 +580,10 @@ def test_add_bus(ct):
     assert len(new_grid.bus2sub.sub_id.unique()) == len(new_grid.sub)
     # Even though we add three new buses, there are only two unique lat/lon pairs
     assert len(new_grid.sub) == prev_num_subs + 2
+    prev_max_sub = grid.sub.index.max()
+    new_sub_id = new_grid.bus2sub.sub_id.iloc[-4:].tolist()
+    assert new_sub_id[:3] == [prev_max_sub + 1, prev_max_sub + 2, prev_max_sub + 2]
+    assert new_sub_id[3] in grid.sub.index
     assert new_grid.bus.index.dtype == grid.bus.index.dtype
     assert new_grid.bus2sub.index.dtype == grid.bus2sub.index.dtype
     assert new_grid.sub.index.dtype == grid.sub.index.dtype
@@ -582,3 +607,15 @@ def test_remove_bus(ct):
     ct.ct["remove_bus"] = {2, 3}
     new_grid = TransformGrid(grid, ct.ct).get_grid()
     assert all(i not in new_grid.bus.index for i in [2, 3])
+
+
+def test_readonly_transform_matches_copy(ct):
+    ct.scale_plant_capacity("coal", zone_name={"Colorado": 2.0})
+    ct.scale_branch_capacity(zone_name={"Utah": 1.5})
+    ct.add_plant([{"type": "solar", "bus_id": 2010684, "Pmax": 150}])
+    ref_grid = copy.deepcopy(grid)
+    new_grid = TransformGrid(grid, ct.ct, readonly=True).get_grid()
+    assert new_grid == TransformGrid(grid, ct.ct).get_grid()
+    assert grid == ref_grid
+    with pytest.raises(ValueError):
+        new_grid.bus.loc[new_grid.bus.index[0], "Pd"] = 0
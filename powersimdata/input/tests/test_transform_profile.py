@@ -276,6 +276,18 @@ def test_demand_is_scaled(base_grid, raw_demand):
         )
 
 
+def test_readonly_demand_is_scaled(base_grid, raw_demand):
+    base_demand = raw_demand[base_grid.id2zone.keys()]
+    zone_id = list(base_grid.id2zone.keys())[0]
+    ct = ChangeTable(base_grid)
+    ct.scale_demand(zone_id={zone_id: 2})
+
+    tp = TransformProfile({}, base_grid, ct.ct, readonly=True)
+    transformed_profile = tp.get_profile("demand")
+    assert transformed_profile[zone_id].equals(2 * base_demand[zone_id])
+    assert raw_demand.equals(tp._profile_input.get_data({}, "demand"))
+
+
 def test_solar_is_scaled_by_zone(base_grid, raw_solar):
     ct = get_change_table_for_zone_scaling(base_grid, "solar")
     _check_plants_are_scaled(ct, base_grid, raw_solar, "solar")
@@ -408,3 +420,31 @@ def test_flexible_demand_profiles_are_trimmed(
     transformed_demand_flexibility_dn = tp.get_profile("demand_flexibility_dn")
     assert base_demand_flexibility_up.equals(transformed_demand_flexibility_up)
     assert base_demand_flexibility_dn.equals(transformed_demand_flexibility_dn)
+
+
+@pytest.mark.parametrize("kind", ["demand", "solar"])
+def test_iter_profile(base_grid, kind):
+    ct = ChangeTable(base_grid)
+    ct.scale_demand(zone_id={list(base_grid.id2zone.keys())[0]: 2})
+    tp = TransformProfile({}, base_grid, ct.ct, slice=False)
+    chunks = list(tp.iter_profile(kind, freq="6H"))
+    assert len(chunks) == 4
+    assert pd.concat(chunks).equals(tp.get_profile(kind))
+
+
+def test_iter_profile_windows_electrified_demand(base_grid, raw_demand):
+    ct = {"building": {"grid": {"res_cooking": {"advanced_heat_pump_v2": 0.5}}}}
+    ct["building"]["zone"] = {}
+    calls = []
+
+    def get_profile(grid_model, kind, profile, start=None, end=None, cache=True):
+        calls.append((start, end, cache))
+        return raw_demand.loc[start:end]
+
+    with patch("powersimdata.input.transform_demand.ElectrifiedDemand") as demand:
+        demand.return_value.get_profile.side_effect = get_profile
+        tp = TransformProfile({}, base_grid, ct, slice=False)
+        chunks = list(tp.iter_profile("demand", freq="6H"))
+        assert len(calls) == 4
+        assert all(start is not None and not cache for start, _, cache in calls)
+        pd.testing.assert_frame_equal(pd.concat(chunks), 1.5 * raw_demand)
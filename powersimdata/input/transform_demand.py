@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 from powersimdata.input.electrified_demand_input import ElectrifiedDemand
 
 
@@ -5,31 +8,45 @@ class TransformDemand:
     """Aggregate demand from electrified sources.
 
     :param powersimdata.input.grid.Grid grid: a grid object
-    :param powersimdata.input.change_table.ChangeTable: a change table object
+    :param powersimdata.input.change_table.ChangeTable/dict ct: a change table
+        object or its dictionary of changes
     :param str kind: the class of electrification, e.g. building, transportation
     """
 
     def __init__(self, grid, ct, kind):
         self.grid = grid
-        self.ct = ct.ct
+        self.ct = getattr(ct, "ct", ct)
         self.info = self.ct[kind]
         self.kind = kind
         self._profile_data = ElectrifiedDemand()
         self._set_scale_factors()
 
-    def _get_base_profile(self, profile):
+    def _get_base_profile(self, profile, start=None, end=None, cache=True):
         """Return the base profile from local or blob storage
 
+        :param str profile: the profile name, without file extension
+        :param str start: first timestamp to load. Default to the first timestamp.
+        :param str end: last timestamp to load. Default to the last timestamp.
+        :param bool cache: whether to use the memory cache.
         :return: (*pandas.DataFrame*) -- profile data frame, filtered to zones within
             the current grid
         """
         zone_id = sorted(self.grid.id2zone)
         model = self.grid.grid_model
-        demand = self._profile_data.get_profile(model, self.kind, profile).loc[
-            :, zone_id
-        ]
+        demand = self._profile_data.get_profile(
+            model, self.kind, profile, start=start, end=end, cache=cache
+        ).loc[:, zone_id]
         return demand
 
+    def streaming(self):
+        """Context in which the base profiles loaded without the memory cache are
+        located once, see
+        :meth:`powersimdata.input.profile_input.ProfileInput.streaming`.
+
+        :return: (*contextlib.AbstractContextManager*) -- context manager.
+        """
+        return self._profile_data.streaming()
+
     def _get_profile_to_zone(self):
         """Maps profile name to scale factors for each zone
 
@@ -68,6 +85,25 @@ class TransformDemand:
         self.p2z = self._get_profile_to_zone()
         self.p2g = self._get_profile_to_grid()
 
+    def _get_weights(self, profiles, zone_id):
+        """Build the matrix of scale factors applied to the profiles. Zones listed in
+        the zone scaling of a profile use their own scale factor, the other zones use
+        the grid scale factor of the profile, if any, and are left unscaled otherwise.
+
+        :param list profiles: profile names.
+        :param iterable zone_id: zone ids.
+        :return: (*numpy.ndarray*) -- array of shape (number of profiles, number of
+            zones).
+        """
+        zone_id = pd.Index(zone_id)
+        weights = np.ones((len(profiles), len(zone_id)))
+        for i, profile in enumerate(profiles):
+            weights[i] = self.p2g.get(profile, 1)
+            if profile in self.p2z:
+                zones, scale_factors = zip(*self.p2z[profile])
+                weights[i, zone_id.get_indexer(zones)] = scale_factors
+        return weights
+
     def get_profile(self, profile):
         """Get transformed profile
 
@@ -75,27 +111,30 @@ class TransformDemand:
         :return: (*pandas.DataFrame*) -- the scaled profile, filtered to the zones
             within the current grid
         """
-        p2z, p2g = self.p2z, self.p2g
         df = self._get_base_profile(profile)
-
-        if profile in p2z:
-            for zone_id, scale_factor in p2z[profile]:
-                df.loc[:, zone_id] *= scale_factor
-            exclude_zones = [_[0] for _ in p2z[profile]]
-        else:
-            exclude_zones = []
-
-        if profile in p2g:
-            scale_factor = p2g[profile]
-            df.loc[:, ~df.columns.isin(exclude_zones)] *= scale_factor
-
-        return df
-
-    def value(self):
-        """Return the combined electrified demand
-
-        :return: (*pandas.DataFrame*) -- data frame with hourly index and zone columns,
-            where the values are demand (in MWh)
+        return df * self._get_weights([profile], df.columns)[0]
+
+    def value(self, start=None, end=None, cache=True):
+        """Return the combined electrified demand. The base profiles are stacked in a
+        single array and reduced along the profile axis with the matrix of scale
+        factors.
+
+        :param str start: first timestamp. Default to the first timestamp.
+        :param str end: last timestamp. Default to the last timestamp.
+        :param bool cache: whether to cache the base profiles in memory.
+        :return: (*pandas.DataFrame/int*) -- data frame with hourly index and zone
+            columns, where the values are demand (in MWh), or 0 if no profile applies.
+        :raises ValueError: if the base profiles do not share the same index.
         """
-        profiles = set(self.p2z.keys()) | set(self.p2g.keys())
-        return sum(self.get_profile(p) for p in profiles)
+        profiles = sorted(set(self.p2z.keys()) | set(self.p2g.keys()))
+        if not profiles:
+            return 0
+        base = [self._get_base_profile(p, start, end, cache) for p in profiles]
+        index, columns = base[0].index, base[0].columns
+        if not all(b.index.equals(index) for b in base):
+            raise ValueError("electrified demand profiles must share the same index")
+
+        stacked = np.stack([b.to_numpy() for b in base])
+        weights = self._get_weights(profiles, columns)
+        values = np.einsum("ptz,pz->tz", stacked, weights)
+        return pd.DataFrame(values, index=index, columns=columns)
@@ -4,19 +4,30 @@ import numpy as np
 import pandas as pd
 
 from powersimdata.utility.distance import haversine
+from powersimdata.utility.helpers import readonly_view
 
 
 class TransformGrid:
     """Transforms grid according to operations listed in change table."""
 
-    def __init__(self, grid, ct):
+    def __init__(self, grid, ct, readonly=False):
         """Constructor
 
         :param powersimdata.input.grid.Grid grid: a Grid object.
         :param dict ct: change table.
+        :param bool readonly: if True, the data frames of the input grid are shared
+            with the transformed grid instead of being deep copied. Only the data frames
+            modified by the change table are copied, the others are read only views.
         """
-        self.grid = copy.deepcopy(grid)
-        self.ct = copy.deepcopy(ct)
+        self.readonly = readonly
+        self.v2x = None
+        self._plant_groups = None
+        if readonly:
+            self.grid = readonly_view(grid)
+            self.ct = readonly_view(ct)
+        else:
+            self.grid = copy.deepcopy(grid)
+            self.ct = copy.deepcopy(ct)
 
     def get_grid(self):
         """Returns the transformed grid.
@@ -24,19 +35,34 @@ class TransformGrid:
         :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
         """
         if bool(self.ct):
+            if self.readonly:
+                self._copy_scaled_tables()
             self._apply_change_table()
         return self.grid
 
+    def _copy_scaled_tables(self):
+        """Replace the read only views of the data frames that are scaled in place by
+        writable copies.
+        """
+        resources = self.grid.model_immutables.plants["all_resources"]
+        keys = {f"{g}{s}" for g in resources for s in ("", "_cost", "_pmin")}
+        if keys & self.ct.keys():
+            gencost = self.grid.gencost
+            aliased = gencost["after"] is gencost["before"]
+            self.grid.plant = self.grid.plant.copy()
+            gencost["before"] = gencost["before"].copy()
+            if aliased:
+                gencost["after"] = gencost["before"]
+        for table in ("branch", "dcline"):
+            if table in self.ct:
+                setattr(self.grid, table, getattr(self.grid, table).copy())
+
     def _apply_change_table(self):
         """Apply changes listed in change table to the grid."""
         # First scale by zones, so that zone factors are not applied to additions.
-        for g in self.grid.model_immutables.plants["all_resources"]:
-            if g in self.ct.keys():
-                self._scale_gen_by_zone(g)
-            if f"{g}_cost" in self.ct.keys():
-                self._scale_gencost_by_zone(g)
-            if f"{g}_pmin" in self.ct.keys():
-                self._scale_gen_pmin_by_zone(g)
+        self._scale_gen_by_zone()
+        self._scale_gencost_by_zone()
+        self._scale_gen_pmin_by_zone()
 
         if "branch" in self.ct.keys():
             self._scale_branch_by_zone()
@@ -78,22 +104,54 @@ class TransformGrid:
         if "remove_bus" in self.ct.keys():
             self._remove_bus()
 
-    def _scale_gen_by_zone(self, gen_type):
-        """Scales capacity of generators, by zone. Also scales the associated generation
-            cost curve (to maintain the same slopes at the start/end of the curve).
+    def _get_plant_groups(self):
+        """Returns the positions of the plants in each (zone, type) group. The groups
+        are computed once and reused by all the zone scaling operations.
 
-        :param str gen_type: type of generator.
+        :return: (*dict*) -- keys are (zone id, type) tuples and values are arrays of
+            positions in the plant data frame.
         """
-        if "zone_id" in self.ct[gen_type].keys():
-            for zone_id, factor in self.ct[gen_type]["zone_id"].items():
-                plant_id = (
-                    self.grid.plant.groupby(["zone_id", "type"])
-                    .get_group((zone_id, gen_type))
-                    .index.tolist()
-                )
-                self._scale_gen_capacity(plant_id, factor)
-                if gen_type in self.grid.model_immutables.plants["thermal_resources"]:
-                    self._scale_gencost_by_capacity(plant_id, factor)
+        if self._plant_groups is None:
+            self._plant_groups = self.grid.plant.groupby(["zone_id", "type"]).indices
+        return self._plant_groups
+
+    def _get_plant_zone_factor(self, suffix, resources=None):
+        """Returns the zone scaling factors of the plants for a category of change.
+
+        :param str suffix: suffix of the change table keys, i.e. *''* for capacity,
+            *'_cost'* for cost and *'_pmin'* for minimum generation.
+        :param iterable resources: generator types to consider. Defaults to all.
+        :return: (*pandas.Series*) -- scaling factor indexed by plant id, or None if no
+            zone scaling is found in the change table.
+        """
+        if resources is None:
+            resources = self.grid.model_immutables.plants["all_resources"]
+        factor = np.ones(len(self.grid.plant))
+        found = False
+        for g in resources:
+            key = f"{g}{suffix}"
+            if key in self.ct.keys() and "zone_id" in self.ct[key].keys():
+                for zone_id, f in self.ct[key]["zone_id"].items():
+                    factor[self._get_plant_groups()[(zone_id, g)]] = f
+                    found = True
+        return pd.Series(factor, index=self.grid.plant.index) if found else None
+
+    def _scale_gen_by_zone(self):
+        """Scales capacity of generators, by zone. Also scales the associated generation
+        cost curve (to maintain the same slopes at the start/end of the curve).
+        """
+        factor = self._get_plant_zone_factor("")
+        if factor is None:
+            return
+        self._scale_gen_capacity(slice(None), factor)
+
+        thermal = self.grid.model_immutables.plants["thermal_resources"]
+        factor = self._get_plant_zone_factor("", resources=thermal)
+        if factor is not None:
+            gencost = self.grid.gencost["before"]
+            factor = factor.reindex(gencost.index, fill_value=1)
+            gencost["c0"] *= factor
+            gencost["c2"] /= factor.where(factor != 0, 1)
 
     def _scale_gen_by_id(self, gen_type):
         """Scales capacity of generators by ID. Also scales the associated generation
@@ -107,20 +165,15 @@ class TransformGrid:
                 if gen_type in self.grid.model_immutables.plants["thermal_resources"]:
                     self._scale_gencost_by_capacity(plant_id, factor)
 
-    def _scale_gencost_by_zone(self, gen_type):
-        """Scales cost of generators, by zone.
-
-        :param str gen_type: type of generator.
-        """
-        cost_key = f"{gen_type}_cost"
-        if "zone_id" in self.ct[cost_key].keys():
-            for zone_id, factor in self.ct[cost_key]["zone_id"].items():
-                plant_id = (
-                    self.grid.plant.groupby(["zone_id", "type"])
-                    .get_group((zone_id, gen_type))
-                    .index.tolist()
-                )
-                self.grid.gencost["before"].loc[plant_id, ["c0", "c1", "c2"]] *= factor
+    def _scale_gencost_by_zone(self):
+        """Scales cost of generators, by zone."""
+        factor = self._get_plant_zone_factor("_cost")
+        if factor is None:
+            return
+        gencost = self.grid.gencost["before"]
+        factor = factor.reindex(gencost.index, fill_value=1)
+        for c in ["c0", "c1", "c2"]:
+            gencost[c] *= factor
 
     def _scale_gencost_by_id(self, gen_type):
         """Scales cost of generators, by ID.
@@ -132,20 +185,11 @@ class TransformGrid:
             for plant_id, factor in self.ct[cost_key]["plant_id"].items():
                 self.grid.gencost["before"].loc[plant_id, ["c0", "c1", "c2"]] *= factor
 
-    def _scale_gen_pmin_by_zone(self, gen_type):
-        """Scales minimum generation of generators, by zone.
-
-        :param str gen_type: type of generator.
-        """
-        pmin_key = f"{gen_type}_pmin"
-        if "zone_id" in self.ct[pmin_key].keys():
-            for zone_id, factor in self.ct[pmin_key]["zone_id"].items():
-                plant_id = (
-                    self.grid.plant.groupby(["zone_id", "type"])
-                    .get_group((zone_id, gen_type))
-                    .index.tolist()
-                )
-                self.grid.plant.loc[plant_id, "Pmin"] *= factor
+    def _scale_gen_pmin_by_zone(self):
+        """Scales minimum generation of generators, by zone."""
+        factor = self._get_plant_zone_factor("_pmin")
+        if factor is not None:
+            self.grid.plant["Pmin"] *= factor
 
     def _scale_gen_pmin_by_id(self, gen_type):
         """Scales minimum generation of generators, by ID.
@@ -160,8 +204,9 @@ class TransformGrid:
     def _scale_gen_capacity(self, plant_id, factor):
         """Scales capacity of plants.
 
-        :param int/list plant_id: plant identification number(s).
-        :param float factor: scaling factor.
+        :param int/list/slice plant_id: plant identification number(s).
+        :param float/pandas.Series factor: scaling factor, or factors indexed by
+            plant identification number.
         """
         self.grid.plant.loc[plant_id, "Pmax"] *= factor
         self.grid.plant.loc[plant_id, "Pmin"] *= factor
@@ -181,13 +226,12 @@ class TransformGrid:
     def _scale_branch_by_zone(self):
         """Scales capacity of AC lines, by zone, for lines entirely within that zone."""
         if "zone_id" in self.ct["branch"].keys():
-            for zone_id, factor in self.ct["branch"]["zone_id"].items():
-                branch_id = (
-                    self.grid.branch.groupby(["from_zone_id", "to_zone_id"])
-                    .get_group((zone_id, zone_id))
-                    .index.tolist()
-                )
-                self._scale_branch_capacity(branch_id, factor)
+            branch = self.grid.branch
+            groups = branch.groupby(["from_zone_id", "to_zone_id"]).indices
+            factor = np.ones(len(branch))
+            for zone_id, f in self.ct["branch"]["zone_id"].items():
+                factor[groups[(zone_id, zone_id)]] = f
+            self._scale_branch_capacity(slice(None), pd.Series(factor, branch.index))
 
     def _scale_branch_by_id(self):
         """Scales capacity of AC lines, by ID."""
@@ -198,8 +242,9 @@ class TransformGrid:
     def _scale_branch_capacity(self, branch_id, factor):
         """Scales capacity of AC lines.
 
-        :param int/list branch_id: branch identification number(s)
-        :param float factor: scaling factor
+        :param int/list/slice branch_id: branch identification number(s)
+        :param float/pandas.Series factor: scaling factor, or factors indexed by branch
+            identification number
         """
         self.grid.branch.loc[branch_id, "rateA"] *= factor
         self.grid.branch.loc[branch_id, "x"] /= factor
@@ -214,126 +259,138 @@ class TransformGrid:
 
     def _add_branch(self):
         """Adds branch(es) to the grid."""
-        v2x = voltage_to_x_per_distance(self.grid)
-        for entry in self.ct["new_branch"]:
-            new_branch = {c: 0 for c in self.grid.branch.columns}
-            from_bus_id = entry["from_bus_id"]
-            to_bus_id = entry["to_bus_id"]
-            interconnect = self.grid.bus.loc[from_bus_id].interconnect
-            from_zone_id = self.grid.bus.loc[from_bus_id].zone_id
-            to_zone_id = self.grid.bus.loc[to_bus_id].zone_id
-            from_zone_name = self.grid.id2zone[from_zone_id]
-            to_zone_name = self.grid.id2zone[to_zone_id]
-            from_lon = self.grid.bus.loc[from_bus_id].lon
-            from_lat = self.grid.bus.loc[from_bus_id].lat
-            to_lon = self.grid.bus.loc[to_bus_id].lon
-            to_lat = self.grid.bus.loc[to_bus_id].lat
-            from_basekv = v2x[self.grid.bus.loc[from_bus_id].baseKV]
-            to_basekv = v2x[self.grid.bus.loc[to_bus_id].baseKV]
-            distance = haversine((from_lat, from_lon), (to_lat, to_lon))
-            x = distance * np.mean([from_basekv, to_basekv])
-
-            new_branch["from_bus_id"] = entry["from_bus_id"]
-            new_branch["to_bus_id"] = entry["to_bus_id"]
-            new_branch["status"] = 1
-            new_branch["ratio"] = 0
-            new_branch["branch_device_type"] = "Line"
-            new_branch["rateA"] = entry["Pmax"]
-            new_branch["interconnect"] = interconnect
-            new_branch["from_zone_id"] = from_zone_id
-            new_branch["to_zone_id"] = to_zone_id
-            new_branch["from_zone_name"] = from_zone_name
-            new_branch["to_zone_name"] = to_zone_name
-            new_branch["from_lon"] = from_lon
-            new_branch["from_lat"] = from_lat
-            new_branch["to_lon"] = to_lon
-            new_branch["to_lat"] = to_lat
-            new_branch["x"] = x
-            new_index = pd.Index([self.grid.branch.index[-1] + 1], name="branch_id")
-            self.grid.branch = pd.concat(
-                [self.grid.branch, pd.DataFrame(new_branch, index=new_index)]
-            )
+        entries = self.ct["new_branch"]
+        if self.v2x is None:
+            self.v2x = voltage_to_x_per_distance(self.grid)
+        v2x = self.v2x
+        from_bus = self.grid.bus.loc[[e["from_bus_id"] for e in entries]]
+        to_bus = self.grid.bus.loc[[e["to_bus_id"] for e in entries]]
+        distance = np.array(
+            [
+                haversine(from_latlon, to_latlon)
+                for from_latlon, to_latlon in zip(
+                    from_bus[["lat", "lon"]].to_numpy(),
+                    to_bus[["lat", "lon"]].to_numpy(),
+                )
+            ]
+        )
+        x_per_distance = [
+            [v2x[v] for v in from_bus.baseKV],
+            [v2x[v] for v in to_bus.baseKV],
+        ]
+
+        new_branch = {c: 0 for c in self.grid.branch.columns}
+        new_branch["from_bus_id"] = [e["from_bus_id"] for e in entries]
+        new_branch["to_bus_id"] = [e["to_bus_id"] for e in entries]
+        new_branch["status"] = 1
+        new_branch["ratio"] = 0
+        new_branch["branch_device_type"] = "Line"
+        new_branch["rateA"] = [e["Pmax"] for e in entries]
+        new_branch["interconnect"] = from_bus.interconnect.to_numpy()
+        new_branch["from_zone_id"] = from_bus.zone_id.to_numpy()
+        new_branch["to_zone_id"] = to_bus.zone_id.to_numpy()
+        new_branch["from_zone_name"] = [self.grid.id2zone[z] for z in from_bus.zone_id]
+        new_branch["to_zone_name"] = [self.grid.id2zone[z] for z in to_bus.zone_id]
+        new_branch["from_lon"] = from_bus.lon.to_numpy()
+        new_branch["from_lat"] = from_bus.lat.to_numpy()
+        new_branch["to_lon"] = to_bus.lon.to_numpy()
+        new_branch["to_lat"] = to_bus.lat.to_numpy()
+        new_branch["x"] = distance * np.mean(x_per_distance, axis=0)
+        new_index = _get_new_index(
+            self.grid.branch.index[-1], len(entries), name="branch_id"
+        )
+        self.grid.branch = pd.concat(
+            [self.grid.branch, pd.DataFrame(new_branch, index=new_index)]
+        )
 
     def _add_bus(self):
+        """Adds bus(es) to the grid, along with their substation if there is no
+        substation at the same location.
+        """
+        entries = self.ct["new_bus"]
         bus = self.grid.bus
+        sub = self.grid.sub
         zone2interconnect = {
             k: v[0] for k, v in bus.groupby("zone_id").interconnect.unique().items()
         }
-        latlon2sub = self.grid.sub.groupby(["lat", "lon"]).groups
-        for entry in self.ct["new_bus"]:
-            # Add to the bus dataframe
-            new_bus = {c: 0 for c in bus.columns}
-            new_bus["type"] = 1
-            new_bus["Pd"] = entry["Pd"]
-            new_bus["zone_id"] = entry["zone_id"]
-            new_bus["Vm"] = 1
-            new_bus["baseKV"] = entry["baseKV"]
-            new_bus["loss_zone"] = 1
-            new_bus["Vmax"] = 1.1
-            new_bus["Vmin"] = 0.9
-            interconnect = zone2interconnect[entry["zone_id"]]
-            new_bus["interconnect"] = interconnect
+        latlon2sub = sub.groupby(["lat", "lon"]).groups
+        interconnect_sub_id = (
+            sub.groupby("interconnect").interconnect_sub_id.max().to_dict()
+        )
+        interconnect = [zone2interconnect[e["zone_id"]] for e in entries]
+
+        # Find substation of new buses, creating new substations as needed
+        sub_id = []
+        new_sub = []
+        new_sub_id = sub.index.max()
+        for entry, i in zip(entries, interconnect):
             lat, lon = entry["lat"], entry["lon"]
-            new_bus["lat"] = lat
-            new_bus["lon"] = lon
-            new_bus_index = pd.Index([self.grid.bus.index.max() + 1], name="bus_id")
-            self.grid.bus = pd.concat(
-                [self.grid.bus, pd.DataFrame(new_bus, index=new_bus_index)]
-            )
-            # Add to substation & bus2sub mapping dataframes
-            if (lat, lon) in latlon2sub:
-                # If there are multiple matching substations, arbitrarily grab the first
-                sub_id = latlon2sub[(lat, lon)][0]
-                new_row = pd.DataFrame(
-                    {"sub_id": sub_id, "interconnect": interconnect},
-                    index=new_bus_index,
-                )
-                self.grid.bus2sub = pd.concat([self.grid.bus2sub, new_row])
-            else:
-                # Create a new substation
-                sub = self.grid.sub
-                new_sub_id = sub.index.max() + 1
-                interconnect_sub = sub[sub.interconnect == interconnect]
-                new_interconnect_sub_id = interconnect_sub.interconnect_sub_id.max() + 1
-                new_row = pd.DataFrame(
-                    {"sub_id": new_sub_id, "interconnect": interconnect},
-                    index=new_bus_index,
-                )
-                self.grid.bus2sub = pd.concat([self.grid.bus2sub, new_row])
-                new_row = pd.DataFrame(
+            if (lat, lon) not in latlon2sub:
+                new_sub_id += 1
+                interconnect_sub_id[i] = interconnect_sub_id.get(i, np.nan) + 1
+                new_sub.append(
                     {
                         "name": f"NEW {new_sub_id}",
-                        "interconnect_sub_id": new_interconnect_sub_id,
+                        "interconnect_sub_id": interconnect_sub_id[i],
                         "lat": lat,
                         "lon": lon,
-                        "interconnect": interconnect,
-                    },
-                    index=[new_sub_id],
+                        "interconnect": i,
+                    }
                 )
-                self.grid.sub = pd.concat([sub, new_row])
                 latlon2sub[(lat, lon)] = [new_sub_id]
+            # If there are multiple matching substations, arbitrarily grab the first
+            sub_id.append(latlon2sub[(lat, lon)][0])
+
+        # Add to the bus dataframe
+        new_bus = {c: 0 for c in bus.columns}
+        new_bus["type"] = 1
+        new_bus["Pd"] = [e["Pd"] for e in entries]
+        new_bus["zone_id"] = [e["zone_id"] for e in entries]
+        new_bus["Vm"] = 1
+        new_bus["baseKV"] = [e["baseKV"] for e in entries]
+        new_bus["loss_zone"] = 1
+        new_bus["Vmax"] = 1.1
+        new_bus["Vmin"] = 0.9
+        new_bus["interconnect"] = interconnect
+        new_bus["lat"] = [e["lat"] for e in entries]
+        new_bus["lon"] = [e["lon"] for e in entries]
+        new_bus_index = _get_new_index(bus.index.max(), len(entries), name="bus_id")
+        self.grid.bus = pd.concat([bus, pd.DataFrame(new_bus, index=new_bus_index)])
+
+        # Add to substation & bus2sub mapping dataframes
+        new_bus2sub = pd.DataFrame(
+            {"sub_id": sub_id, "interconnect": interconnect}, index=new_bus_index
+        )
+        self.grid.bus2sub = pd.concat([self.grid.bus2sub, new_bus2sub])
+        if new_sub:
+            new_sub_index = _get_new_index(
+                sub.index.max(), len(new_sub), name=sub.index.name
+            )
+            self.grid.sub = pd.concat([sub, pd.DataFrame(new_sub, index=new_sub_index)])
 
     def _add_dcline(self):
         """Adds HVDC line(s) to the grid"""
-        for entry in self.ct["new_dcline"]:
-            new_dcline = {c: 0 for c in self.grid.dcline.columns}
-            from_bus_id = entry["from_bus_id"]
-            to_bus_id = entry["to_bus_id"]
-            from_interconnect = self.grid.bus.loc[from_bus_id].interconnect
-            to_interconnect = self.grid.bus.loc[to_bus_id].interconnect
-            new_dcline["from_bus_id"] = entry["from_bus_id"]
-            new_dcline["to_bus_id"] = entry["to_bus_id"]
-            new_dcline["status"] = 1
-            new_dcline["Pf"] = entry["Pmax"]
-            new_dcline["Pt"] = 0.98 * entry["Pmax"]
-            new_dcline["Pmin"] = entry["Pmin"]
-            new_dcline["Pmax"] = entry["Pmax"]
-            new_dcline["from_interconnect"] = from_interconnect
-            new_dcline["to_interconnect"] = to_interconnect
-            new_index = pd.Index([self.grid.dcline.index[-1] + 1], name="dcline_id")
-            self.grid.dcline = pd.concat(
-                [self.grid.dcline, pd.DataFrame(new_dcline, index=new_index)]
-            )
+        entries = self.ct["new_dcline"]
+        from_bus = self.grid.bus.loc[[e["from_bus_id"] for e in entries]]
+        to_bus = self.grid.bus.loc[[e["to_bus_id"] for e in entries]]
+        pmax = np.array([e["Pmax"] for e in entries])
+
+        new_dcline = {c: 0 for c in self.grid.dcline.columns}
+        new_dcline["from_bus_id"] = [e["from_bus_id"] for e in entries]
+        new_dcline["to_bus_id"] = [e["to_bus_id"] for e in entries]
+        new_dcline["status"] = 1
+        new_dcline["Pf"] = pmax
+        new_dcline["Pt"] = 0.98 * pmax
+        new_dcline["Pmin"] = [e["Pmin"] for e in entries]
+        new_dcline["Pmax"] = pmax
+        new_dcline["from_interconnect"] = from_bus.interconnect.to_numpy()
+        new_dcline["to_interconnect"] = to_bus.interconnect.to_numpy()
+        new_index = _get_new_index(
+            self.grid.dcline.index[-1], len(entries), name="dcline_id"
+        )
+        self.grid.dcline = pd.concat(
+            [self.grid.dcline, pd.DataFrame(new_dcline, index=new_index)]
+        )
 
     def _add_gen(self):
         """Adds generator(s) to the grid."""
@@ -342,126 +399,137 @@ class TransformGrid:
 
     def _add_plant(self):
         """Adds plant to the grid"""
-        for entry in self.ct["new_plant"]:
-            new_plant = {c: 0 for c in self.grid.plant.columns}
-            bus_id = entry["bus_id"]
-            interconnect = self.grid.bus.loc[bus_id].interconnect
-            zone_id = self.grid.bus.loc[bus_id].zone_id
-            zone_name = self.grid.id2zone[zone_id]
-            lon = self.grid.bus.loc[bus_id].lon
-            lat = self.grid.bus.loc[bus_id].lat
-
-            new_plant["bus_id"] = bus_id
-            new_plant["type"] = entry["type"]
-            new_plant["Pmin"] = entry["Pmin"]
-            new_plant["Pmax"] = entry["Pmax"]
-            new_plant["status"] = 1
-            new_plant["interconnect"] = interconnect
-            new_plant["zone_id"] = zone_id
-            new_plant["zone_name"] = zone_name
-            new_plant["lon"] = lon
-            new_plant["lat"] = lat
-            new_index = pd.Index([self.grid.plant.index[-1] + 1], name="plant_id")
-            self.grid.plant = pd.concat(
-                [self.grid.plant, pd.DataFrame(new_plant, index=new_index)]
-            )
+        entries = self.ct["new_plant"]
+        bus = self.grid.bus.loc[[e["bus_id"] for e in entries]]
+
+        new_plant = {c: 0 for c in self.grid.plant.columns}
+        new_plant["bus_id"] = [e["bus_id"] for e in entries]
+        new_plant["type"] = [e["type"] for e in entries]
+        new_plant["Pmin"] = [e["Pmin"] for e in entries]
+        new_plant["Pmax"] = [e["Pmax"] for e in entries]
+        new_plant["status"] = 1
+        new_plant["interconnect"] = bus.interconnect.to_numpy()
+        new_plant["zone_id"] = bus.zone_id.to_numpy()
+        new_plant["zone_name"] = [self.grid.id2zone[z] for z in bus.zone_id]
+        new_plant["lon"] = bus.lon.to_numpy()
+        new_plant["lat"] = bus.lat.to_numpy()
+        new_index = _get_new_index(
+            self.grid.plant.index[-1], len(entries), name="plant_id"
+        )
+        self.grid.plant = pd.concat(
+            [self.grid.plant, pd.DataFrame(new_plant, index=new_index)]
+        )
 
     def _add_gencost(self):
         """Adds generation cost curves."""
-        for entry in self.ct["new_plant"]:
-            gencost = self.grid.gencost
-            new_gencost = {c: 0 for c in gencost["before"].columns}
-            bus_id = entry["bus_id"]
-            new_gencost["type"] = 2
-            new_gencost["n"] = 3
-            new_gencost["interconnect"] = self.grid.bus.loc[bus_id].interconnect
-            if entry["type"] in self.grid.model_immutables.plants["thermal_resources"]:
-                new_gencost["c0"] = entry["c0"]
-                new_gencost["c1"] = entry["c1"]
-                new_gencost["c2"] = entry["c2"]
-            new_index = pd.Index([gencost["before"].index[-1] + 1], name="plant_id")
-            gencost["before"] = pd.concat(
-                [gencost["before"], pd.DataFrame(new_gencost, index=new_index)]
-            )
-            self.grid.gencost["after"] = gencost["before"]
+        entries = self.ct["new_plant"]
+        gencost = self.grid.gencost
+        thermal = self.grid.model_immutables.plants["thermal_resources"]
+        is_thermal = [e["type"] in thermal for e in entries]
+        bus = self.grid.bus.loc[[e["bus_id"] for e in entries]]
+
+        new_gencost = {c: 0 for c in gencost["before"].columns}
+        new_gencost["type"] = 2
+        new_gencost["n"] = 3
+        new_gencost["interconnect"] = bus.interconnect.to_numpy()
+        for c in ["c0", "c1", "c2"]:
+            new_gencost[c] = [e[c] if t else 0 for e, t in zip(entries, is_thermal)]
+        new_index = _get_new_index(
+            gencost["before"].index[-1], len(entries), name="plant_id"
+        )
+        gencost["before"] = pd.concat(
+            [gencost["before"], pd.DataFrame(new_gencost, index=new_index)]
+        )
+        self.grid.gencost["after"] = gencost["before"]
 
     def _add_storage(self):
         """Adds storage to the grid."""
         first_storage_id = self.grid.plant.index.max() + 1
-        for i, entry in enumerate(self.ct["storage"]):
-            storage_id = first_storage_id + i
-            self._add_storage_unit(entry)
-            self._add_storage_gencost()
-            self._add_storage_genfuel()
-            self._add_storage_data(storage_id, entry)
-
-    def _add_storage_unit(self, entry):
-        """Add storage unit.
-
-        :param int bus_id: bus identification number.
-        :param dict entry: storage details, containing at least "bus_id" and "capacity".
+        entries = self.ct["storage"]
+        self._add_storage_unit(entries)
+        self._add_storage_gencost(len(entries))
+        self._add_storage_genfuel(len(entries))
+        self._add_storage_data(first_storage_id, entries)
+
+    def _add_storage_unit(self, entries):
+        """Add storage units.
+
+        :param list entries: storage details, each containing at least "bus_id" and
+            "capacity".
         """
         storage = self.grid.storage
-        gen = {g: 0 for g in storage["gen"].columns}
-        gen["bus_id"] = entry["bus_id"]
-        gen["Vg"] = 1
-        gen["mBase"] = 100
-        gen["status"] = 1
-        gen["Pmax"] = entry["capacity"]
-        gen["Pmin"] = -1 * entry["capacity"]
-        gen["ramp_10"] = entry["capacity"]
-        gen["ramp_30"] = entry["capacity"]
-        gen = pd.DataFrame({k: [v] for k, v in gen.items()})
+        gen = []
+        for entry in entries:
+            unit = {g: 0 for g in storage["gen"].columns}
+            unit["bus_id"] = entry["bus_id"]
+            unit["Vg"] = 1
+            unit["mBase"] = 100
+            unit["status"] = 1
+            unit["Pmax"] = entry["capacity"]
+            unit["Pmin"] = -1 * entry["capacity"]
+            unit["ramp_10"] = entry["capacity"]
+            unit["ramp_30"] = entry["capacity"]
+            gen.append(unit)
+        gen = pd.DataFrame(gen, columns=list(gen[0]) if gen else None)
         storage["gen"] = pd.concat([storage["gen"], gen], ignore_index=True)
         # Maintain int columns after the append converts them to float
         storage["gen"] = storage["gen"].astype({"bus_id": "int", "status": "int"})
 
-    def _add_storage_gencost(self):
-        """Sets generation cost of storage unit."""
+    def _add_storage_gencost(self, n):
+        """Sets generation cost of storage units.
+
+        :param int n: number of storage units.
+        """
         storage = self.grid.storage
         gencost = {g: 0 for g in storage["gencost"].columns}
         gencost["type"] = 2
         gencost["n"] = 3
-        gencost = pd.DataFrame({k: [v] for k, v in gencost.items()})
+        gencost = pd.DataFrame({k: [v] * n for k, v in gencost.items()})
         storage["gencost"] = pd.concat([storage["gencost"], gencost], ignore_index=True)
 
-    def _add_storage_genfuel(self):
-        """Sets fuel type of storage unit."""
-        self.grid.storage["genfuel"].append("ess")
+    def _add_storage_genfuel(self, n):
+        """Sets fuel type of storage units.
+
+        :param int n: number of storage units.
+        """
+        self.grid.storage["genfuel"].extend(["ess"] * n)
 
-    def _add_storage_data(self, storage_id, entry):
+    def _add_storage_data(self, first_storage_id, entries):
         """Sets storage data.
 
-        :param int storage_id: storage identification number.
-        :param dict entry: storage details, containing at least:
-            "bus_id", "capacity".
+        :param int first_storage_id: identification number of the first storage unit.
+        :param list entries: storage details, each containing at least: "bus_id",
+            "capacity".
         """
         storage = self.grid.storage
-        data = {g: 0 for g in storage["StorageData"].columns}
-
-        capacity = entry["capacity"]
-        duration = entry["duration"]
-        min_stor = entry["min_stor"]
-        max_stor = entry["max_stor"]
-        energy_value = entry["energy_value"]
-        terminal_min = entry["terminal_min"]
-        terminal_max = entry["terminal_max"]
-
-        data["UnitIdx"] = storage_id
-        data["ExpectedTerminalStorageMax"] = capacity * duration * terminal_max
-        data["ExpectedTerminalStorageMin"] = capacity * duration * terminal_min
-        data["InitialStorage"] = capacity * duration / 2  # Start with half
-        data["InitialStorageLowerBound"] = capacity * duration / 2  # Start with half
-        data["InitialStorageUpperBound"] = capacity * duration / 2  # Start with half
-        data["InitialStorageCost"] = energy_value
-        data["TerminalStoragePrice"] = energy_value
-        data["MinStorageLevel"] = capacity * duration * min_stor
-        data["MaxStorageLevel"] = capacity * duration * max_stor
-        data["OutEff"] = entry["OutEff"]
-        data["InEff"] = entry["InEff"]
-        data["LossFactor"] = entry["LossFactor"]
-        data["rho"] = 1
-        data = pd.DataFrame({k: [v] for k, v in data.items()})
+        rows = []
+        for i, entry in enumerate(entries):
+            data = {g: 0 for g in storage["StorageData"].columns}
+
+            capacity = entry["capacity"]
+            duration = entry["duration"]
+            min_stor = entry["min_stor"]
+            max_stor = entry["max_stor"]
+            energy_value = entry["energy_value"]
+            terminal_min = entry["terminal_min"]
+            terminal_max = entry["terminal_max"]
+
+            data["UnitIdx"] = first_storage_id + i
+            data["ExpectedTerminalStorageMax"] = capacity * duration * terminal_max
+            data["ExpectedTerminalStorageMin"] = capacity * duration * terminal_min
+            data["InitialStorage"] = capacity * duration / 2  # Start with half
+            data["InitialStorageLowerBound"] = capacity * duration / 2
+            data["InitialStorageUpperBound"] = capacity * duration / 2
+            data["InitialStorageCost"] = energy_value
+            data["TerminalStoragePrice"] = energy_value
+            data["MinStorageLevel"] = capacity * duration * min_stor
+            data["MaxStorageLevel"] = capacity * duration * max_stor
+            data["OutEff"] = entry["OutEff"]
+            data["InEff"] = entry["InEff"]
+            data["LossFactor"] = entry["LossFactor"]
+            data["rho"] = 1
+            rows.append(data)
+        data = pd.DataFrame(rows, columns=list(rows[0]) if rows else None)
         storage["StorageData"] = pd.concat(
             [storage["StorageData"], data], ignore_index=True
         )
@@ -496,17 +564,32 @@ def voltage_to_x_per_distance(grid):
     :return: (*dict*) -- bus voltage to average reactance per mile.
     """
     branch = grid.branch[grid.branch.branch_device_type == "Line"]
-    distance = (
-        branch[["from_lat", "from_lon", "to_lat", "to_lon"]]
-        .apply(lambda x: haversine((x[0], x[1]), (x[2], x[3])), axis=1)
-        .values
+    distance = np.array(
+        [
+            haversine((from_lat, from_lon), (to_lat, to_lon))
+            for from_lat, from_lon, to_lat, to_lon in branch[
+                ["from_lat", "from_lon", "to_lat", "to_lon"]
+            ].to_numpy()
+        ]
     )
 
     no_zero = np.nonzero(distance)[0]
     x_per_distance = (branch.iloc[no_zero].x / distance[no_zero]).values
 
-    basekv = np.array([grid.bus.baseKV[i] for i in branch.iloc[no_zero].from_bus_id])
+    basekv = grid.bus.baseKV.loc[branch.iloc[no_zero].from_bus_id].to_numpy()
 
     v2x = {v: np.mean(x_per_distance[np.where(basekv == v)[0]]) for v in set(basekv)}
 
     return v2x
+
+
+def _get_new_index(last_id, n, name=None):
+    """Builds index of elements added to a data frame.
+
+    :param int last_id: last identification number in the data frame.
+    :param int n: number of elements to add.
+    :param str name: name of the index.
+    :return: (*pandas.Index*) -- consecutive identification numbers following the
+        last one.
+    """
+    return pd.Index(last_id + 1 + np.arange(n), name=name)
@@ -1,7 +1,11 @@
 import copy
+from contextlib import ExitStack
+
+import pandas as pd
 
 from powersimdata.input.profile_input import ProfileInput
 from powersimdata.input.transform_demand import TransformDemand
+from powersimdata.utility.helpers import readonly_view
 
 
 class TransformProfile:
@@ -9,7 +13,7 @@ class TransformProfile:
 
     _default_dates = {"start_date": "2016-01-01 00:00", "end_date": "2016-12-31 23:00"}
 
-    def __init__(self, scenario_info, grid, ct, slice=True):
+    def __init__(self, scenario_info, grid, ct, slice=True, readonly=False):
         """Constructor.
 
         :param dict scenario_info: scenario information.
@@ -17,13 +21,20 @@ class TransformProfile:
             transformed.
         :param dict ct: change table.
         :param bool slice: whether to slice the profiles by the Scenario's time range.
+        :param bool readonly: if True, the grid, the change table and the cached raw
+            profiles are accessed through read only views instead of deep copies.
         """
         self.slice = slice
+        self.readonly = readonly
         self._profile_input = ProfileInput()
         self.scenario_info = {**self._default_dates, **scenario_info}
 
-        self.ct = copy.deepcopy(ct)
-        self.grid = copy.deepcopy(grid)
+        if readonly:
+            self.ct = readonly_view(ct)
+            self.grid = readonly_view(grid)
+        else:
+            self.ct = copy.deepcopy(ct)
+            self.grid = copy.deepcopy(grid)
 
         self.scale_keys = {
             **{"demand": {"demand"}},
@@ -31,6 +42,7 @@ class TransformProfile:
         }
 
         self.n_new_plant, self.n_new_clean_plant = self._get_number_of_new_plant()
+        self._transform_demand = {}
 
     def _get_number_of_new_plant(self):
         """Return the total number of new plant and new plant with profiles.
@@ -46,10 +58,13 @@ class TransformProfile:
                     n_plant[1] += 1
         return n_plant
 
-    def _get_renewable_profile(self, resource):
+    def _get_renewable_profile(self, resource, start=None, end=None, cache=True):
         """Return the transformed profile.
 
         :param str resource: a generator type with profile.
+        :param str start: first timestamp to load. Default to the first timestamp.
+        :param str end: last timestamp to load. Default to the last timestamp.
+        :param bool cache: whether to cache the raw profile in memory.
         :return: (*pandas.DataFrame*) -- power output for generators of specified type
             with plant identification number as columns and UTC timestamp as indices.
         """
@@ -60,7 +75,15 @@ class TransformProfile:
             .index
         )
 
-        profile = self._profile_input.get_data(self.scenario_info, resource)[plant_id]
+        profile = self._profile_input.get_data(
+            self.scenario_info,
+            resource,
+            readonly=self.readonly,
+            columns=plant_id,
+            start=start,
+            end=end,
+            cache=cache,
+        )
         scaled_profile = self._scale_plant_profile(profile)
 
         if self.n_new_clean_plant > 0:
@@ -103,37 +126,57 @@ class TransformProfile:
         new_profile.columns = new_plant_ids
         return new_profile
 
-    def _get_demand_profile(self):
+    def _get_demand_profile(self, start=None, end=None, cache=True):
         """Return scaled demand profile.
 
+        :param str start: first timestamp to load. Default to the first timestamp.
+        :param str end: last timestamp to load. Default to the last timestamp.
+        :param bool cache: whether to cache the raw profile in memory.
         :return: (*pandas.DataFrame*) -- data frame of demand.
         """
         zone_id = sorted(self.grid.id2zone)
-        demand = self._profile_input.get_data(self.scenario_info, "demand").loc[
-            :, zone_id
-        ]
+        demand = self._profile_input.get_data(
+            self.scenario_info,
+            "demand",
+            readonly=self.readonly,
+            columns=zone_id,
+            start=start,
+            end=end,
+            cache=cache,
+        )
+        scaling = pd.Series(1.0, index=demand.columns)
         if bool(self.ct) and "demand" in list(self.ct.keys()):
             for key, value in self.ct["demand"]["zone_id"].items():
                 print(
                     "Multiply demand in %s (#%d) by %.2f"
                     % (self.grid.id2zone[key], key, value)
                 )
-                demand.loc[:, key] *= value
-        return demand
+                scaling[key] = value
+        return demand * scaling
 
-    def _get_demand_flexibility_profile(self, name):
+    def _get_demand_flexibility_profile(self, name, start=None, end=None, cache=True):
         """Return the appropriately pruned demand flexibility profiles. Provides support
         for profiles that might have a mixed input of zones and buses.
 
         :param string name: The type of demand flexibility profile being specified. Can
             be one of: *'demand_flexibility_up'*, *'demand_flexibility_dn'*,
             *'demand_flexibility_cost_up'*, or *'demand_flexibility_cost_dn'*.
+        :param str start: first timestamp to load. Default to the first timestamp.
+        :param str end: last timestamp to load. Default to the last timestamp.
+        :param bool cache: whether to cache the raw profile in memory.
         :return: (*pandas.DataFrame*) -- data frame of a demand flexibility profile.
         """
         # Access the specified demand flexibility profile
         flex_dem_dict = self.ct["demand_flexibility"]
         flex_dem_dict["grid_model"] = self.scenario_info["grid_model"]
-        df = self._profile_input.get_data(flex_dem_dict, name)
+        df = self._profile_input.get_data(
+            flex_dem_dict,
+            name,
+            readonly=self.readonly,
+            start=start,
+            end=end,
+            cache=cache,
+        )
 
         # Determine if the demand flexibility profile is indexed by zone, bus, or both
         area_indicator = [1 if "zone." in x else 0 for x in df.columns]
@@ -163,39 +206,53 @@ class TransformProfile:
         # Return the pruned data frame
         return df
 
-    def _get_electrified_demand(self):
+    def _get_electrified_demand(self, start=None, end=None, cache=True):
         """Return the aggregate demand profile, including base demand and electrified
         demand.
 
+        :param str start: first timestamp to load. Default to the first timestamp.
+        :param str end: last timestamp to load. Default to the last timestamp.
+        :param bool cache: whether to cache the raw profiles in memory.
         :return: (*pandas.DataFrame*) -- the full demand profile
         """
-        result = self._get_demand_profile()
-        for kind in ("building", "transportation"):
-            if kind in self.ct:
-                result += TransformDemand(self.grid, self.ct, kind).value()
+        result = self._get_demand_profile(start=start, end=end, cache=cache)
+        for td in self._get_transform_demand():
+            result = result + td.value(start, end, cache)
         return result
 
-    def _slice_df(self, df):
-        """Return dataframe, sliced by the times specified in scenario_info if and only
-        if ``self.slice`` = True.
+    def _get_transform_demand(self):
+        """Return the aggregators of electrified demand listed in the change table.
+        They are built once and reused by the following calls.
 
-        :param pandas.DataFrame df: data frame to be sliced.
-        :return: (*pandas.DataFrame*) -- sliced data frame.
+        :return: (*list*) -- list of
+            :class:`powersimdata.input.transform_demand.TransformDemand` objects.
+        """
+        for kind in ("building", "transportation"):
+            if kind in self.ct and kind not in self._transform_demand:
+                self._transform_demand[kind] = TransformDemand(self.grid, self.ct, kind)
+        return list(self._transform_demand.values())
+
+    def _get_time_range(self):
+        """Return the time range of the profiles, which is the Scenario's time range if
+        and only if ``self.slice`` = True.
+
+        :return: (*dict*) -- first and last timestamps, if any.
         """
         if not self.slice:
-            return df
-        return df.loc[self.scenario_info["start_date"] : self.scenario_info["end_date"]]
+            return {}
+        return {
+            "start": self.scenario_info["start_date"],
+            "end": self.scenario_info["end_date"],
+        }
 
-    def get_profile(self, name):
-        """Return profile.
+    def _check_profile_name(self, name):
+        """Check profile name.
 
-        :param str name: either *demand*, *'demand_flexibility_up'*,
-            *'demand_flexibility_dn'*, *'demand_flexibility_cost_up'*,
-            *'demand_flexibility_cost_dn'* or a generator type with profile.
-        :return: (*pandas.DataFrame*) -- profile.
+        :param str name: name of the profile.
         :raises ValueError: if argument not one of *'demand'*,
             *'demand_flexibility_up'*, *'demand_flexibility_dn'*,
-            *'demand_flexibility_cost_up'*, *'demand_flexibility_cost_dn'* or a generator type wit profile.
+            *'demand_flexibility_cost_up'*, *'demand_flexibility_cost_dn'* or a
+            generator type with profile.
         """
         possible = {
             "demand_flexibility_up",
@@ -208,9 +265,94 @@ class TransformProfile:
             raise ValueError(
                 f"Invalid profile kind: {name}. Choose from %s" % " | ".join(possible)
             )
-        elif name == "demand":
-            return self._slice_df(self._get_electrified_demand())
+
+    def _get_profile(self, name, start=None, end=None, cache=True):
+        """Return profile over a time range.
+
+        :param str name: name of the profile.
+        :param str start: first timestamp. Default to the first timestamp.
+        :param str end: last timestamp. Default to the last timestamp.
+        :param bool cache: whether to cache the raw profiles in memory.
+        :return: (*pandas.DataFrame*) -- profile.
+        """
+        kwargs = {"start": start, "end": end, "cache": cache}
+        if name == "demand":
+            df = self._get_electrified_demand(**kwargs)
         elif "demand_flexibility" in name:
-            return self._slice_df(self._get_demand_flexibility_profile(name))
+            df = self._get_demand_flexibility_profile(name, **kwargs)
+        else:
+            df = self._get_renewable_profile(name, **kwargs)
+        if start is None and end is None:
+            return df
+        return df.loc[start:end]
+
+    def get_profile(self, name):
+        """Return profile.
+
+        :param str name: either *demand*, *'demand_flexibility_up'*,
+            *'demand_flexibility_dn'*, *'demand_flexibility_cost_up'*,
+            *'demand_flexibility_cost_dn'* or a generator type with profile.
+        :return: (*pandas.DataFrame*) -- profile.
+        :raises ValueError: if argument not one of *'demand'*,
+            *'demand_flexibility_up'*, *'demand_flexibility_dn'*,
+            *'demand_flexibility_cost_up'*, *'demand_flexibility_cost_dn'* or a generator type wit profile.
+        """
+        self._check_profile_name(name)
+        return self._get_profile(name, **self._get_time_range())
+
+    def iter_profile(self, name, freq="1M"):
+        """Return profile one time window at a time. Only the part of the raw profiles
+        enclosed in a time window is loaded at once, and it is not kept in the memory
+        cache.
+
+        :param str name: either *demand*, *'demand_flexibility_up'*,
+            *'demand_flexibility_dn'*, *'demand_flexibility_cost_up'*,
+            *'demand_flexibility_cost_dn'* or a generator type with profile.
+        :param str freq: length of the time windows, as a pandas offset alias, e.g.
+            *'1M'* for one month or *'7D'* for one week.
+        :return: (*generator*) -- profile of consecutive time windows.
+        :raises ValueError: if argument not one of *'demand'*,
+            *'demand_flexibility_up'*, *'demand_flexibility_dn'*,
+            *'demand_flexibility_cost_up'*, *'demand_flexibility_cost_dn'* or a
+            generator type with profile.
+        """
+        self._check_profile_name(name)
+        if "demand_flexibility" in name:
+            info = {**self.ct["demand_flexibility"]}
+            info["grid_model"] = self.scenario_info["grid_model"]
         else:
-            return self._slice_df(self._get_renewable_profile(name))
+            info = self.scenario_info
+        with ExitStack() as stack:
+            # Each raw profile is located once rather than once per window
+            stack.enter_context(self._profile_input.streaming())
+            if name == "demand":
+                for td in self._get_transform_demand():
+                    stack.enter_context(td.streaming())
+            index = self._profile_input.get_data(
+                info,
+                name,
+                readonly=self.readonly,
+                columns=[],
+                cache=False,
+                **self._get_time_range(),
+            ).index
+            timestamps = pd.Series(index, index=index)
+            for _, window in timestamps.groupby(pd.Grouper(freq=freq)):
+                if len(window) > 0:
+                    yield self._get_profile(
+                        name,
+                        start=str(window.iloc[0]),
+                        end=str(window.iloc[-1]),
+                        cache=False,
+                    )
+
+
+def write_profile(chunks, f):
+    """Write profile in csv format, one time window at a time.
+
+    :param iterable chunks: profile of consecutive time windows, see
+        :meth:`TransformProfile.iter_profile`.
+    :param io.IOBase f: an open file object.
+    """
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(f, header=i == 0, date_format="%Y-%m-%d %H:%M:%S")
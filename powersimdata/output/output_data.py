@@ -1,12 +1,33 @@
+import argparse
+
 import numpy as np
 import pandas as pd
-from scipy.sparse import coo_matrix
+from scipy.sparse import csr_matrix
 
 from powersimdata.data_access.context import Context
 from powersimdata.data_access.fs_helper import get_scenario_fs
-from powersimdata.input.input_data import distribute_demand_from_zones_to_buses
+from powersimdata.input.input_data import get_zone_to_bus_shares
 from powersimdata.input.transform_profile import TransformProfile
+from powersimdata.output import output_store
 from powersimdata.utility import server_setup
+from powersimdata.utility.helpers import MemoryCache, cache_key, readonly_view
+
+_cache = MemoryCache(max_bytes=server_setup.OUTPUT_CACHE_MAX_BYTES)
+
+FIELDS = [
+    "PG",
+    "PF",
+    "PF_DCLINE",
+    "LMP",
+    "CONGU",
+    "CONGL",
+    "AVERAGED_CONG",
+    "STORAGE_PG",
+    "STORAGE_E",
+    "LOAD_SHED",
+    "LOAD_SHIFT_UP",
+    "LOAD_SHIFT_DN",
+]
 
 
 class OutputData:
@@ -16,24 +37,210 @@ class OutputData:
         """Constructor"""
         self._data_access = Context.get_data_access(get_scenario_fs)
 
-    def get_data(self, scenario_id, field_name):
-        """Returns data either from server or from local directory.
+    def get_data(
+        self,
+        scenario_id,
+        field_name,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
+        """Returns data either from server or from local directory and cache the
+        result in memory. Data saved in columnar format, see :meth:`convert`, is read
+        partially: only the months overlapping the requested time range are
+        downloaded and only the requested columns are loaded. A subset of a field
+        already cached in full is taken from the cache.
 
         :param str scenario_id: scenario id.
         :param str field_name: *'PG'*, *'PF'*, *'PF_DCLINE'*, *'LMP'*, *'CONGU'*,
             *'CONGL'*, *'AVERAGED_CONG'*, *'STORAGE_PG'*, *'STORAGE_E'*, *'LOAD_SHED'*,
             *'LOAD_SHIFT_UP'*, or *'LOAD_SHIFT_DN'*.
+        :param list columns: columns to load. Default to all columns.
+        :param str/pandas.Timestamp start: first timestamp to load, included. Default
+            to the first timestamp.
+        :param str/pandas.Timestamp end: last timestamp to load, included. Default to
+            the last timestamp.
+        :param bool readonly: whether a read only view of the cached data is returned
+            instead of a copy. See :func:`powersimdata.utility.helpers.readonly_view`.
+        :param str/numpy.dtype dtype: data type of the values, e.g. *'float32'*.
+            Default to the stored data type.
+        :param bool sparse: whether to return a data frame of sparse columns with zero
+            as fill value, see :class:`pandas.SparseDtype`. Fields stored as sparse
+            data frames are always sparse.
         :return: (*pandas.DataFrame*) -- specified field as a data frame.
         :raises FileNotFoundError: if file not found on local machine.
         :raises ValueError: if second argument is not an allowable field.
+        :raises KeyError: if some columns are not in the data frame.
         """
         _check_field(field_name)
 
         print("--> Loading %s" % field_name)
-        file_name = scenario_id + "_" + field_name + ".pkl"
-        filepath = "/".join([*server_setup.OUTPUT_DIR, file_name])
-        with self._data_access.get(filepath) as (f, _):
-            return pd.read_pickle(f)
+        dirpath = _get_path(scenario_id, field_name)
+        key = _get_key(scenario_id, field_name, columns, start, end, dtype, sparse)
+        cached = _cache.get(key, readonly=readonly)
+        if cached is not None:
+            return cached
+        full = _cache.get(_get_key(scenario_id, field_name), readonly=True)
+        if full is not None:
+            data = _convert(_select(full, columns, start, end), dtype, sparse)
+            return data if readonly else data.copy()
+
+        if self._is_columnar(dirpath):
+            data = output_store.load(
+                self._data_access, dirpath, columns, start, end, dtype, sparse
+            )
+        else:
+            with self._data_access.get(f"{dirpath}.pkl") as (f, _):
+                data = _select(pd.read_pickle(f), columns, start, end)
+            data = _convert(data, dtype, sparse)
+        # The loaded data is only reachable through the cache, callers get either a
+        # read only view or a copy of it
+        _cache.put(key, data, copy_value=False)
+        return readonly_view(data) if readonly else data.copy()
+
+    def _is_columnar(self, dirpath):
+        """Check whether an output is stored in columnar format. Files in the local
+        directory are checked first, the data store is only listed if neither the
+        columnar nor the pickle file is found locally.
+
+        :param str dirpath: path to the output, without extension.
+        :return: (*bool*) -- whether the output is stored in columnar format.
+        """
+        meta_path = f"{dirpath}/meta.json"
+        local_fs = self._data_access.local_fs
+        if local_fs.exists(meta_path):
+            return True
+        if local_fs.exists(f"{dirpath}.pkl"):
+            return False
+        return self._data_access.which(meta_path)[meta_path] is not None
+
+    def convert(self, scenario_id, field_names=None):
+        """Convert the outputs of a scenario from pickle to columnar format, see
+        :func:`powersimdata.output.output_store.save`. Fields that are missing,
+        already converted or that cannot be stored in columnar format are skipped.
+        The pickle files are kept.
+
+        :param str scenario_id: scenario id.
+        :param list field_names: fields to convert. Default to all fields.
+        :return: (*list*) -- converted fields.
+        :raises ValueError: if a field is not an allowable field.
+        """
+        field_names = FIELDS if field_names is None else field_names
+        converted = []
+        for field_name in field_names:
+            _check_field(field_name)
+            dirpath = _get_path(scenario_id, field_name)
+            pkl_path, meta_path = f"{dirpath}.pkl", f"{dirpath}/meta.json"
+            location = self._data_access.which(pkl_path, meta_path)
+            if location[pkl_path] is None or location[meta_path] is not None:
+                continue
+            with self._data_access.get(pkl_path) as (f, _):
+                data = pd.read_pickle(f)
+            if not output_store.can_store(data):
+                print(f"{field_name} cannot be stored in columnar format")
+                continue
+            output_store.save(self._data_access, dirpath, data)
+            converted.append(field_name)
+        return converted
+
+
+def clear_cache(scenario_id=None):
+    """Remove the outputs cached in memory.
+
+    :param str scenario_id: scenario id. Default to all scenarios.
+    """
+    if scenario_id is None:
+        _cache.clear()
+    else:
+        _cache.remove(cache_key(str(scenario_id)))
+
+
+def _get_path(scenario_id, field_name):
+    """Get the path to an output file, without extension.
+
+    :param str scenario_id: scenario id.
+    :param str field_name: field name.
+    :return: (*str*) -- path to the pickle file without extension, which is also the
+        path to the directory enclosing the columnar files.
+    """
+    return "/".join([*server_setup.OUTPUT_DIR, f"{scenario_id}_{field_name}"])
+
+
+def _get_key(
+    scenario_id,
+    field_name,
+    columns=None,
+    start=None,
+    end=None,
+    dtype=None,
+    sparse=False,
+):
+    """Get the cache key of a subset of an output. Keys start with the scenario id,
+    such that the entries of a scenario can be removed together.
+
+    :param str scenario_id: scenario id.
+    :param str field_name: field name.
+    :param list columns: columns.
+    :param str/pandas.Timestamp start: first timestamp.
+    :param str/pandas.Timestamp end: last timestamp.
+    :param str/numpy.dtype dtype: data type.
+    :param bool sparse: whether the output is sparse.
+    :return: (*tuple*) -- cache key.
+    """
+    return cache_key(
+        str(scenario_id),
+        field_name,
+        None if columns is None else pd.Index(columns).tolist(),
+        None if start is None else str(pd.Timestamp(start)),
+        None if end is None else str(pd.Timestamp(end)),
+        None if dtype is None else str(np.dtype(dtype)),
+        bool(sparse),
+    )
+
+
+def _convert(data, dtype=None, sparse=False):
+    """Cast the values of an output and/or make it sparse.
+
+    :param pandas.DataFrame data: output.
+    :param str/numpy.dtype dtype: data type of the values. Default to the current data
+        type.
+    :param bool sparse: whether to make the columns sparse, with zero as fill value.
+        Sparse outputs remain sparse.
+    :return: (*pandas.DataFrame*) -- converted output, or the original one if there
+        is nothing to convert.
+    """
+    current = data.dtypes.iloc[0] if data.shape[1] > 0 else np.dtype(float)
+    is_sparse = isinstance(current, pd.SparseDtype)
+    if dtype is None and (is_sparse or not sparse):
+        return data
+    subtype = current.subtype if is_sparse else current
+    subtype = subtype if dtype is None else np.dtype(dtype)
+    if is_sparse or sparse:
+        fill_value = current.fill_value if is_sparse else 0
+        return data.astype(pd.SparseDtype(subtype, fill_value))
+    return data.astype(subtype)
+
+
+def _select(data, columns=None, start=None, end=None):
+    """Select a subset of an output.
+
+    :param pandas.DataFrame data: output.
+    :param list columns: columns to select. Default to all columns.
+    :param str/pandas.Timestamp start: first timestamp, included. Default to the first
+        timestamp.
+    :param str/pandas.Timestamp end: last timestamp, included. Default to the last
+        timestamp.
+    :return: (*pandas.DataFrame*) -- subset of the output.
+    :raises KeyError: if some columns are not in the data frame.
+    """
+    if start is not None or end is not None:
+        data = data.loc[start:end]
+    if columns is not None:
+        data = data.loc[:, columns]
+    return data
 
 
 def _check_field(field_name):
@@ -46,26 +253,15 @@ def _check_field(field_name):
         *'CONGU'*, or *'CONGL'*, *'AVERAGED_CONG'*, *'STORAGE_PG'*,
         *'STORAGE_E'*, *'LOAD_SHED'*, *'LOAD_SHIFT_UP'*, or *'LOAD_SHIFT_DN'*.
     """
-    possible = [
-        "PG",
-        "PF",
-        "PF_DCLINE",
-        "LMP",
-        "CONGU",
-        "CONGL",
-        "AVERAGED_CONG",
-        "STORAGE_PG",
-        "STORAGE_E",
-        "LOAD_SHED",
-        "LOAD_SHIFT_UP",
-        "LOAD_SHIFT_DN",
-    ]
-    if field_name not in possible:
-        raise ValueError("Only %s data can be loaded" % " | ".join(possible))
+    if field_name not in FIELDS:
+        raise ValueError("Only %s data can be loaded" % " | ".join(FIELDS))
 
 
 def construct_load_shed(scenario_info, grid, ct, infeasibilities=None):
-    """Constructs load_shed dataframe from relevant scenario/grid data.
+    """Constructs load_shed dataframe from relevant scenario/grid data. The load shed
+    is computed in sparse form, from the zone demand of the hours of the infeasible
+    intervals only, which is distributed to the buses with the cached share matrix,
+    see :func:`powersimdata.input.input_data.get_zone_to_bus_shares`.
 
     :param dict scenario_info: info attribute of Scenario object.
     :param powersimdata.input.grid.Grid grid: grid to construct load_shed for.
@@ -76,29 +272,61 @@ def construct_load_shed(scenario_info, grid, ct, infeasibilities=None):
     """
     hours = pd.date_range(
         start=scenario_info["start_date"], end=scenario_info["end_date"], freq="1H"
-    ).tolist()
+    )
     buses = grid.bus.index
     if infeasibilities is None:
         print("No infeasibilities, constructing DataFrame")
-        load_shed_data = coo_matrix((len(hours), len(buses)))
-        load_shed = pd.DataFrame.sparse.from_spmatrix(load_shed_data)
+        load_shed = csr_matrix((len(hours), len(buses)))
     else:
         print("Infeasibilities, constructing DataFrame")
-        zone_demand = TransformProfile(scenario_info, grid, ct)
-        bus_demand = distribute_demand_from_zones_to_buses(zone_demand, grid.bus)
-        load_shed = np.zeros((len(hours), len(buses)))
         # Convert '24H' to 24
         interval = int(scenario_info["interval"][:-1])
-        for i, v in infeasibilities.items():
-            start = i * interval
-            end = (i + 1) * interval
-            base_demand = bus_demand.iloc[start:end, :].to_numpy()
-            shed_demand = base_demand * (v / 100)
-            load_shed[start:end, :] = shed_demand
-        load_shed = pd.DataFrame(load_shed, columns=buses, index=hours)
-        load_shed = load_shed.astype(pd.SparseDtype("float", 0))
+        start = np.fromiter(infeasibilities.keys(), dtype=int) * interval
+        rows = (start[:, None] + np.arange(interval)).ravel()
+        fraction = np.repeat(
+            np.fromiter(infeasibilities.values(), dtype=float), interval
+        )
+        keep = rows < len(hours)
+        rows, fraction = rows[keep], fraction[keep] / 100
+
+        profile = TransformProfile(scenario_info, grid, ct, readonly=True)
+        zone_demand = profile.get_profile("demand")
+        shares, bus_id, zone_id = get_zone_to_bus_shares(grid.bus)
+        shed_demand = zone_demand.loc[:, zone_id].to_numpy()[rows] * fraction[:, None]
+        # Spread the shed demand of each infeasible hour over the hours of the
+        # scenario and from the zones to the buses
+        spread = csr_matrix(
+            (np.ones(len(rows)), (rows, np.arange(len(rows)))),
+            shape=(len(hours), len(rows)),
+        )
+        load_shed = spread @ (csr_matrix(shed_demand) @ shares.T.tocsr())
+        load_shed = load_shed.tocsc()[:, bus_id.get_indexer(buses)]
+    load_shed = pd.DataFrame.sparse.from_spmatrix(load_shed)
     load_shed.index = hours
     load_shed.index.name = "UTC"
     load_shed.columns = buses
 
     return load_shed
+
+
+def main(args=None):
+    """Convert the outputs of scenarios from pickle to columnar format.
+
+    :param list args: command line arguments. Default to ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m powersimdata.output.output_data",
+        description=main.__doc__.splitlines()[0],
+    )
+    parser.add_argument("scenario_id", nargs="+")
+    parser.add_argument("--fields", nargs="+", choices=FIELDS, help="default to all")
+    args = parser.parse_args(args)
+
+    output_data = OutputData()
+    for scenario_id in args.scenario_id:
+        converted = output_data.convert(scenario_id, args.fields)
+        print(f"Scenario {scenario_id}: converted {', '.join(converted) or 'nothing'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import json
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+from scipy.sparse import csr_matrix, hstack
+
+
+def can_store(data):
+    """Check whether a data frame can be stored in columnar format, i.e. whether it
+    has a single numerical data type and a time zone naive datetime index.
+
+    :param pandas.DataFrame data: data frame.
+    :return: (*bool*) -- whether the data frame can be stored.
+    """
+    dtypes = set(data.dtypes)
+    return (
+        len(dtypes) == 1
+        and is_numeric_dtype(dtypes.pop())
+        and is_datetime64_any_dtype(data.index)
+        and data.index.tz is None
+    )
+
+
+def _get_chunks(index):
+    """Split a datetime index in chunks of one month.
+
+    :param pandas.DatetimeIndex index: sorted index.
+    :return: (*list*) -- name, first and last (excluded) row of each chunk.
+    """
+    if len(index) == 0:
+        return []
+    periods = index.to_period("M")
+    bounds = np.flatnonzero(periods[1:] != periods[:-1]) + 1
+    starts = np.concatenate([[0], bounds])
+    stops = np.concatenate([bounds, [len(index)]])
+    return [
+        {"file": f"{periods[i]}.npy", "start": int(i), "stop": int(j)}
+        for i, j in zip(starts, stops)
+    ]
+
+
+def _save_array(data_access, filepath, values):
+    """Write an array in *.npy* format to the data store.
+
+    :param powersimdata.data_access.data_access.DataAccess data_access: data access
+        object.
+    :param str filepath: path to file.
+    :param numpy.ndarray values: array.
+    """
+    with data_access.write(filepath, save_local=False) as f:
+        np.save(f, values, allow_pickle=False)
+
+
+def save(data_access, dirpath, data):
+    """Save a data frame in columnar format. The values are split in chunks of one
+    month, each stored in a *.npy* file as a 2D array (columns x timestamps), such that
+    a subset of the columns and months can be read without loading the full data
+    frame. The index is stored in a separate *.npy* file and the columns, data type and
+    chunk layout in a *meta.json* file, which is written last.
+
+    :param powersimdata.data_access.data_access.DataAccess data_access: data access
+        object.
+    :param str dirpath: path to the directory enclosing the files.
+    :param pandas.DataFrame data: data frame to save.
+    :raises ValueError: if the data frame cannot be stored, see :func:`can_store`.
+    """
+    if not can_store(data):
+        raise ValueError(
+            "Only numerical data frames with a datetime index can be saved"
+        )
+
+    dtype = data.dtypes.iloc[0]
+    sparse = isinstance(dtype, pd.SparseDtype)
+    values = data.sparse.to_dense().to_numpy() if sparse else data.to_numpy()
+    chunks = _get_chunks(data.index)
+    meta = {
+        "index_name": data.index.name,
+        "freq": data.index.freqstr,
+        "columns_name": data.columns.name,
+        "columns": data.columns.tolist(),
+        "dtype": str(values.dtype),
+        "fill_value": np.asarray(dtype.fill_value).item() if sparse else None,
+        "chunks": chunks,
+    }
+    index = data.index.asi8.view("datetime64[ns]")
+    _save_array(data_access, f"{dirpath}/index.npy", index)
+    for c in chunks:
+        chunk = np.ascontiguousarray(values[c["start"] : c["stop"]].T)
+        _save_array(data_access, f"{dirpath}/{c['file']}", chunk)
+    with data_access.write(f"{dirpath}/meta.json", save_local=False) as f:
+        f.write(json.dumps(meta).encode())
+
+
+def load(
+    data_access, dirpath, columns=None, start=None, end=None, dtype=None, sparse=False
+):
+    """Load a data frame saved in columnar format. Only the chunks overlapping the
+    requested time range are downloaded and only the requested columns are read from
+    disk. Values are cast and, if requested, sparsified chunk by chunk, such that the
+    full dense data frame is never held in memory.
+
+    :param powersimdata.data_access.data_access.DataAccess data_access: data access
+        object.
+    :param str dirpath: path to the directory enclosing the files.
+    :param list columns: columns to load. Default to all columns.
+    :param str/pandas.Timestamp start: first timestamp to load, included. Default to
+        the first timestamp.
+    :param str/pandas.Timestamp end: last timestamp to load, included. Default to the
+        last timestamp.
+    :param str/numpy.dtype dtype: data type of the values, e.g. *'float32'*. Default
+        to the stored data type.
+    :param bool sparse: whether to return a data frame of sparse columns with zero as
+        fill value. Data frames that were sparse when saved are always sparse.
+    :return: (*pandas.DataFrame*) -- data frame.
+    :raises KeyError: if some columns are not in the data frame.
+    """
+    with data_access.get(f"{dirpath}/meta.json") as (f, _):
+        meta = json.load(f)
+    with data_access.get(f"{dirpath}/index.npy") as (f, _):
+        index = pd.DatetimeIndex(np.load(f), name=meta["index_name"], freq=meta["freq"])
+
+    all_columns = pd.Index(meta["columns"], name=meta["columns_name"])
+    if columns is None:
+        columns, loc = all_columns, slice(None)
+    else:
+        columns = pd.Index(columns, name=meta["columns_name"])
+        loc = all_columns.get_indexer(columns)
+        if (loc == -1).any():
+            raise KeyError(f"{list(columns[loc == -1])} not in {dirpath}")
+
+    dtype = np.dtype(meta["dtype"] if dtype is None else dtype)
+    sparse = sparse or meta["fill_value"] == 0
+    rows = index.slice_indexer(start, end)
+    first, last = rows.start or 0, len(index) if rows.stop is None else rows.stop
+    index = index[first:last]
+    blocks = []
+    for c in meta["chunks"]:
+        if c["stop"] <= first or c["start"] >= last:
+            continue
+        with data_access.get(f"{dirpath}/{c['file']}") as (_, path):
+            chunk = np.load(path, mmap_mode="r")
+            lo, hi = (
+                max(first, c["start"]) - c["start"],
+                min(last, c["stop"]) - c["start"],
+            )
+            block = np.array(chunk[loc, lo:hi], dtype=dtype)
+            blocks.append(csr_matrix(block) if sparse else block)
+
+    if sparse:
+        if blocks:
+            values = hstack(blocks, format="csr")
+        else:
+            values = csr_matrix((len(columns), 0), dtype=dtype)
+        return pd.DataFrame.sparse.from_spmatrix(values.T, index=index, columns=columns)
+
+    if blocks:
+        values = np.concatenate(blocks, axis=1)
+    else:
+        values = np.empty((len(columns), 0), dtype=dtype)
+    data = pd.DataFrame(values.T, index=index, columns=columns, copy=False)
+    if meta["fill_value"] is not None:
+        data = data.astype(pd.SparseDtype(dtype, meta["fill_value"]))
+    return data
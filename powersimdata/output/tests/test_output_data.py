@@ -0,0 +1,197 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_index_equal
+
+from powersimdata.data_access.context import Context
+from powersimdata.data_access.data_access import TempDataAccess
+from powersimdata.input.grid import Grid
+from powersimdata.input.input_data import distribute_demand_from_zones_to_buses
+from powersimdata.output.output_data import (
+    OutputData,
+    _cache,
+    clear_cache,
+    construct_load_shed,
+)
+from powersimdata.tests.mock_profile_input import MockProfileInput
+from powersimdata.utility import server_setup
+
+
+@pytest.fixture
+def data_access(monkeypatch):
+    data_access = TempDataAccess()
+    monkeypatch.setattr(Context, "get_data_access", lambda make_fs=None: data_access)
+    yield data_access
+    _cache.clear()
+
+
+def _make_pg():
+    index = pd.date_range("2016-01-01", "2016-03-31 23:00", freq="H", name="UTC")
+    columns = pd.Index([101, 102, 103, 104], name="plant_id")
+    values = np.arange(len(index) * len(columns), dtype=float).reshape(len(index), -1)
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def _upload(data_access, field, data, scenario_id="1"):
+    file_name = f"{scenario_id}_{field}.pkl"
+    data_access.fs.makedirs("/".join(server_setup.OUTPUT_DIR), recreate=True)
+    with data_access.fs.openbin(
+        "/".join([*server_setup.OUTPUT_DIR, file_name]), "w"
+    ) as f:
+        data.to_pickle(f)
+
+
+def test_get_data_slices_pickle(data_access):
+    pg = _make_pg()
+    _upload(data_access, "PG", pg)
+    data = OutputData().get_data("1", "PG", columns=[102], start="2016-02-01")
+    assert_frame_equal(data, pg.loc["2016-02-01":, [102]])
+
+
+def test_convert_and_read_columnar(data_access):
+    pg = _make_pg()
+    _upload(data_access, "PG", pg)
+    output_data = OutputData()
+    assert output_data.convert("1", ["PG", "PF"]) == ["PG"]
+    assert output_data.convert("1", ["PG"]) == []
+
+    data = output_data.get_data(
+        "1", "PG", columns=[104, 102], start="2016-01-31 22:00", end="2016-02-01 01:00"
+    )
+    assert_frame_equal(data, pg.loc["2016-01-31 22:00":"2016-02-01 01:00", [104, 102]])
+    assert not data_access.local_fs.exists(
+        "/".join([*server_setup.OUTPUT_DIR, "1_PG", "2016-03.npy"])
+    )
+
+    assert_frame_equal(output_data.get_data("1", "PG"), pg)
+    with pytest.raises(KeyError):
+        output_data.get_data("1", "PG", columns=[999])
+
+
+def test_get_data_checks_local_files_first(data_access, monkeypatch):
+    pg = _make_pg()
+    _upload(data_access, "PG", pg)
+    output_data = OutputData()
+    output_data.get_data("1", "PG")
+    clear_cache()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("data store listed")
+
+    monkeypatch.setattr(data_access, "which", fail)
+    assert_frame_equal(output_data.get_data("1", "PG"), pg)
+
+
+def test_convert_sparse(data_access):
+    load_shed = _make_pg() * 0
+    load_shed.iloc[5, 1] = 3.0
+    load_shed = load_shed.astype(pd.SparseDtype("float", 0))
+    _upload(data_access, "LOAD_SHED", load_shed)
+    output_data = OutputData()
+    assert output_data.convert("1", ["LOAD_SHED"]) == ["LOAD_SHED"]
+    assert_frame_equal(output_data.get_data("1", "LOAD_SHED"), load_shed)
+
+
+def test_get_data_is_cached(data_access, monkeypatch):
+    pg = _make_pg()
+    _upload(data_access, "PG", pg)
+    output_data = OutputData()
+    assert_frame_equal(output_data.get_data("1", "PG"), pg)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("output read again")
+
+    monkeypatch.setattr(data_access, "get", fail)
+    data = output_data.get_data("1", "PG", readonly=True)
+    assert_frame_equal(data, pg)
+    with pytest.raises(ValueError):
+        data.iloc[0, 0] = 1
+    data = output_data.get_data("1", "PG", columns=[101], end="2016-01-02")
+    assert_frame_equal(data, pg.loc[:"2016-01-02", [101]])
+    data.iloc[0, 0] = -1
+    assert output_data.get_data("1", "PG").iloc[0, 0] == pg.iloc[0, 0]
+
+
+def test_get_data_returns_copy_of_loaded_data(data_access):
+    pg = _make_pg()
+    _upload(data_access, "PG", pg)
+    output_data = OutputData()
+    data = output_data.get_data("1", "PG")
+    data.iloc[0, 0] = -1
+    assert output_data.get_data("1", "PG", readonly=True).iloc[0, 0] == pg.iloc[0, 0]
+
+
+def test_clear_cache_of_scenario(data_access):
+    pg = _make_pg()
+    _upload(data_access, "PG", pg)
+    _upload(data_access, "PG", pg + 1, scenario_id="2")
+    output_data = OutputData()
+    data = output_data.get_data("1", "PG", readonly=True)
+    with pytest.raises(ValueError):
+        data.iloc[0, 0] = 1
+    output_data.get_data("2", "PG", columns=[101])
+    output_data.get_data(2, "PG")
+    assert _cache.stats()["entries"] == 3
+
+    clear_cache(2)
+    assert [k[0] for k in _cache.list_keys()] == ["1"]
+    assert_frame_equal(output_data.get_data("2", "PG"), pg + 1)
+    clear_cache()
+    assert _cache.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize("convert", [False, True])
+def test_get_data_dtype_and_sparse(data_access, convert):
+    congu = _make_pg() * 0
+    congu.iloc[[3, 1500], [0, 2]] = 2.5
+    _upload(data_access, "CONGU", congu)
+    output_data = OutputData()
+    if convert:
+        output_data.convert("1", ["CONGU"])
+
+    data = output_data.get_data("1", "CONGU", dtype="float32")
+    assert (data.dtypes == np.float32).all()
+    data = output_data.get_data("1", "CONGU", dtype="float32", sparse=True)
+    assert (data.dtypes == pd.SparseDtype("float32", 0)).all()
+    assert data.sparse.density == 4 / congu.size
+    assert_frame_equal(data.sparse.to_dense(), congu.astype("float32"))
+    data = output_data.get_data(
+        "1", "CONGU", columns=[103], end="2016-01-01", sparse=True
+    )
+    assert data.dtypes.iloc[0] == pd.SparseDtype("float64", 0)
+    assert data.shape == (24, 1)
+
+
+def test_construct_load_shed():
+    grid = Grid("Texas")
+    profile_input = MockProfileInput(grid, periods=96)
+    info = {
+        "start_date": "2016-01-01 00:00:00",
+        "end_date": "2016-01-04 23:00:00",
+        "interval": "24H",
+    }
+    with patch("powersimdata.input.transform_profile.ProfileInput") as mock_input:
+        mock_input.return_value = profile_input
+        load_shed = construct_load_shed(info, grid, {}, {1: 10, 3: 25})
+    assert load_shed.shape == (96, len(grid.bus))
+    assert load_shed.index.name == "UTC"
+    assert_index_equal(load_shed.columns, grid.bus.index)
+    assert (load_shed.dtypes == pd.SparseDtype("float", 0)).all()
+
+    bus_demand = distribute_demand_from_zones_to_buses(
+        profile_input.get_data({}, "demand"), grid.bus
+    )
+    expected = bus_demand * 0
+    expected.iloc[24:48] = bus_demand.iloc[24:48] * 0.1
+    expected.iloc[72:96] = bus_demand.iloc[72:96] * 0.25
+    np.testing.assert_allclose(load_shed.sparse.to_dense(), expected)
+
+
+def test_construct_load_shed_no_infeasibilities():
+    grid = Grid("Texas")
+    info = {"start_date": "2016-01-01 00:00:00", "end_date": "2016-01-01 23:00:00"}
+    load_shed = construct_load_shed(info, grid, {})
+    assert load_shed.shape == (24, len(grid.bus))
+    assert load_shed.sparse.density == 0
@@ -105,87 +105,200 @@ class Analyze(Ready):
                     )
                 )
 
-    def _get_data(self, field):
-        return self._output_data.get_data(self._scenario_info["id"], field)
+    def _get_data(
+        self,
+        field,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
+        """Returns an output of the scenario.
+
+        :param str field: output field, e.g. *'PG'*.
+        :param columns, start, end, readonly, dtype, sparse: see
+            :meth:`powersimdata.output.output_data.OutputData.get_data`.
+        :return: (*pandas.DataFrame*) -- data frame of the output.
+        """
+        return self._output_data.get_data(
+            self._scenario_info["id"],
+            field,
+            columns=columns,
+            start=start,
+            end=end,
+            readonly=readonly,
+            dtype=dtype,
+            sparse=sparse,
+        )
 
-    def get_pg(self):
+    def get_pg(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns PG data frame.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of power generated.
         """
-        return self._get_data("PG")
-
-    def get_pf(self):
+        return self._get_data("PG", columns, start, end, readonly, dtype, sparse)
+
+    def get_pf(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns PF data frame.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of power flow.
         """
-        return self._get_data("PF")
-
-    def get_dcline_pf(self):
+        return self._get_data("PF", columns, start, end, readonly, dtype, sparse)
+
+    def get_dcline_pf(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns PF_DCLINE data frame.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of power flow on DC line(s).
         """
-        return self._get_data("PF_DCLINE")
-
-    def get_lmp(self):
+        return self._get_data("PF_DCLINE", columns, start, end, readonly, dtype, sparse)
+
+    def get_lmp(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns LMP data frame. LMP = locational marginal price
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of nodal prices.
         """
-        return self._get_data("LMP")
-
-    def get_congu(self):
+        return self._get_data("LMP", columns, start, end, readonly, dtype, sparse)
+
+    def get_congu(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns CONGU data frame. CONGU = Congestion, Upper flow limit
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of branch flow mu (upper).
         """
-        return self._get_data("CONGU")
-
-    def get_congl(self):
+        return self._get_data("CONGU", columns, start, end, readonly, dtype, sparse)
+
+    def get_congl(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns CONGL data frame. CONGL = Congestion, Lower flow limit
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of branch flow mu (lower).
         """
-        return self._get_data("CONGL")
+        return self._get_data("CONGL", columns, start, end, readonly, dtype, sparse)
 
-    def get_averaged_cong(self):
+    def get_averaged_cong(self, readonly=False, dtype=None):
         """Returns averaged CONGL and CONGU.
 
+        :param readonly, dtype: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of averaged congestion with
             the branch id as indices an the averaged CONGL and CONGU as columns.
         """
-        return self._get_data("AVERAGED_CONG")
-
-    def get_storage_pg(self):
+        return self._get_data("AVERAGED_CONG", readonly=readonly, dtype=dtype)
+
+    def get_storage_pg(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns STORAGE_PG data frame.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of power generated by
             storage units.
         """
-        return self._get_data("STORAGE_PG")
+        return self._get_data(
+            "STORAGE_PG", columns, start, end, readonly, dtype, sparse
+        )
 
-    def get_storage_e(self):
+    def get_storage_e(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns STORAGE_E data frame. Energy state of charge.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of energy state of charge.
         """
-        return self._get_data("STORAGE_E")
-
-    def get_load_shed(self):
+        return self._get_data("STORAGE_E", columns, start, end, readonly, dtype, sparse)
+
+    def get_load_shed(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns LOAD_SHED data frame, either via loading or calculating.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of load shed (hour x bus).
         """
+        args = ("LOAD_SHED", columns, start, end, readonly, dtype, sparse)
         try:
             # It's either on the server or in our local ScenarioData folder
-            load_shed = self._get_data("LOAD_SHED")
+            load_shed = self._get_data(*args)
         except OSError:
             # The scenario was run without load_shed, and we must construct it
-            grid = self.get_grid()
+            grid = self.get_grid(readonly=True)
+            ct = self.get_ct(readonly=True)
             infeasibilities = self._parse_infeasibilities()
-            load_shed = construct_load_shed(self._scenario_info, grid, infeasibilities)
+            load_shed = construct_load_shed(
+                self._scenario_info, grid, ct, infeasibilities
+            )
 
             scenario_id = self._scenario_info["id"]
             filename = scenario_id + "_LOAD_SHED.pkl"
@@ -193,25 +306,48 @@ class Analyze(Ready):
             filepath = os.path.join(server_setup.LOCAL_DIR, *output_dir, filename)
             with open(filepath, "wb") as f:
                 pickle.dump(load_shed, f)
+            load_shed = self._get_data(*args)
 
         return load_shed
 
-    def get_load_shift_up(self):
+    def get_load_shift_up(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns LOAD_SHIFT_UP data frame. This is the amount that flexible demand
         deviates above (e.g., recovers) the base demand.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of load shifted up (hour x bus).
         """
-        return self._get_data("LOAD_SHIFT_UP")
+        return self._get_data(
+            "LOAD_SHIFT_UP", columns, start, end, readonly, dtype, sparse
+        )
 
-    def get_load_shift_dn(self):
+    def get_load_shift_dn(
+        self,
+        columns=None,
+        start=None,
+        end=None,
+        readonly=False,
+        dtype=None,
+        sparse=False,
+    ):
         """Returns LOAD_SHIFT_DN data frame. This is the amount that flexible demand
         deviates below (e.g., curtails) the base demand.
 
+        :param columns, start, end, readonly, dtype, sparse: see :meth:`_get_data`.
         :return: (*pandas.DataFrame*) -- data frame of load shifted down (hour x
             bus).
         """
-        return self._get_data("LOAD_SHIFT_DN")
+        return self._get_data(
+            "LOAD_SHIFT_DN", columns, start, end, readonly, dtype, sparse
+        )
 
     def get_demand(self, original=True):
         """Returns demand profiles.
@@ -220,7 +356,9 @@ class Analyze(Ready):
             potentially modified one be returned.
         :return: (*pandas.DataFrame*) -- data frame of demand (hour, zone).
         """
-        profile = TransformProfile(self._scenario_info, self.get_grid(), self.get_ct())
+        profile = TransformProfile(
+            self._scenario_info, self.grid, self.ct, readonly=True
+        )
         demand = profile.get_profile("demand")
 
         if original:
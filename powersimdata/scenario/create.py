@@ -78,15 +78,17 @@ class Create(State):
             self.builder.change_table.ct, self._scenario_info["id"]
         )
 
-    def get_bus_demand(self):
+    def get_bus_demand(self, dtype=None):
         """Returns demand profiles, by bus.
 
+        :param str dtype: data type of the demand, e.g. *'float32'*. Default to the
+            data type of the demand profile.
         :return: (*pandas.DataFrame*) -- data frame of demand (hour, bus).
         """
         self._update_scenario_info()
         demand = self.get_demand()
         grid = self.get_grid()
-        return distribute_demand_from_zones_to_buses(demand, grid.bus)
+        return distribute_demand_from_zones_to_buses(demand, grid.bus, dtype)
 
     def create_scenario(self):
         """Creates scenario."""
@@ -1,3 +1,4 @@
+from powersimdata.output.output_data import clear_cache
 from powersimdata.scenario.ready import Ready
 from powersimdata.utility import server_setup
 
@@ -40,6 +41,7 @@ class Delete(Ready):
         print("--> Deleting entries in scenario and execute list")
         self._scenario_list_manager.delete_entry(scenario_id)
         self._execute_list_manager.delete_entry(scenario_id)
+        clear_cache(scenario_id)
 
         # Delete attributes
         self._clean()
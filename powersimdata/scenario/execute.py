@@ -1,5 +1,13 @@
+import hashlib
+import json
 import pickle
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 
 from powersimdata.data_access.context import Context
@@ -7,8 +15,9 @@ from powersimdata.input.configure import adjust_pmin, adjust_ramp30, linearize_g
 from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import InputData
 from powersimdata.input.transform_grid import TransformGrid
-from powersimdata.input.transform_profile import TransformProfile
+from powersimdata.input.transform_profile import TransformProfile, write_profile
 from powersimdata.scenario.ready import Ready
+from powersimdata.utility import server_setup
 from powersimdata.utility.config import get_deployment_mode
 
 
@@ -101,10 +110,16 @@ class Execute(Ready):
         self._update_scenario_status()
         print(self._scenario_status)
 
-    def prepare_simulation_input(self, profiles_as=None):
-        """Prepares scenario for execution
+    def prepare_simulation_input(
+        self, profiles_as=None, max_workers=None, input_format="csv"
+    ):
+        """Prepares scenario for execution. The profiles are prepared concurrently.
 
         :param int/str/None profiles_as: if given, copy profiles from this scenario.
+        :param int max_workers: maximum number of profiles prepared at the same time.
+            Default to the *PREPARE_MAX_WORKERS* setting if any, otherwise to the
+            default of :class:`concurrent.futures.ThreadPoolExecutor`.
+        :param str input_format: format of the profiles, see :class:`SimulationInput`.
         :raises TypeError: if profiles_as parameter not a str or int.
         """
         if profiles_as is not None and not isinstance(profiles_as, (str, int)):
@@ -117,21 +132,36 @@ class Execute(Ready):
             print("---------------------------")
 
             si = SimulationInput(
-                self._data_access, self._scenario_info, self.grid, self.ct
+                self._data_access,
+                self._scenario_info,
+                self.grid,
+                self.ct,
+                input_format,
             )
-            for p in ["demand", "hydro", "solar", "wind"]:
-                si.prepare_profile(p, profiles_as)
-
-            si.prepare_grid()
-
+            kinds = ["demand", "hydro", "solar", "wind"]
             if "demand_flexibility" in self.ct:
                 # Prepare all specified demand flexibility profiles
-                for p in list(self.ct["demand_flexibility"]):
-                    if p != "demand_flexibility_duration":
-                        si.prepare_profile(p, profiles_as)
+                kinds += [
+                    p
+                    for p in self.ct["demand_flexibility"]
+                    if p != "demand_flexibility_duration"
+                ]
+            timing = si.prepare_profiles(kinds, profiles_as, max_workers)
+
+            start = time.perf_counter()
+            si.prepare_grid()
+            timing["grid"] = time.perf_counter() - start
 
+            if "demand_flexibility" in self.ct:
                 si.prepare_demand_flexibility_parameters()
 
+            if input_format != "csv":
+                si.prepare_manifest()
+
+            print("--> Time spent preparing each input")
+            for stage, elapsed in timing.items():
+                print(f"{stage}: {elapsed:.1f}s")
+
             prepared = "prepared"
             self._execute_list_manager.set_status(self.scenario_id, prepared)
             self._scenario_status = prepared
@@ -201,20 +231,35 @@ class Execute(Ready):
 class SimulationInput:
     """Prepares scenario for execution.
 
+    Profiles are written in csv format by default. With the *'npy'* input format, each
+    profile is written as a 2D NumPy array (timestamps x columns) in a *.npy* file,
+    which can be memory mapped by the engine, and a *manifest.json* file lists the
+    shape, the data type, the index, the columns and the sha256 checksum of each
+    profile along with the checksum of the grid.
+
     :param powersimdata.data_access.data_access.DataAccess data_access:
         data access object.
     :param dict scenario_info: scenario information.
     :param powersimdata.input.grid.Grid grid: a Grid object.
     :param dict ct: change table.
+    :param str input_format: format of the profiles, either *'csv'* or *'npy'*.
+    :raises ValueError: if input format is invalid.
     """
 
-    def __init__(self, data_access, scenario_info, grid, ct):
+    _input_formats = {"csv", "npy"}
+
+    def __init__(self, data_access, scenario_info, grid, ct, input_format="csv"):
         """Constructor."""
+        if input_format not in self._input_formats:
+            raise ValueError(f"input_format must be one of {self._input_formats}")
         self._data_access = data_access
         self._scenario_info = scenario_info
         self.grid = grid
         self.ct = ct
         self.scenario_id = scenario_info["id"]
+        self.input_format = input_format
+        self.manifest = {}
+        self._lock = threading.Lock()
 
         self.REL_TMP_DIR = self._data_access.tmp_folder(self.scenario_id)
 
@@ -231,7 +276,9 @@ class SimulationInput:
 
         dest_path = "/".join([self.REL_TMP_DIR, "grid.pkl"])
         with self._data_access.write(dest_path, save_local=False) as f:
-            pickle.dump(self.grid, f)
+            writer = _HashingWriter(f)
+            pickle.dump(self.grid, writer)
+        self.manifest["grid.pkl"] = {"sha256": writer.hexdigest()}
 
     def prepare_profile(self, kind, profile_as=None, slice=False):
         """Prepares profile for simulation.
@@ -241,18 +288,96 @@ class SimulationInput:
             *'demand_flexibility_cost_up'*, or *'demand_flexibility_cost_dn'*.
         :param int/str profile_as: if given, copy profile from this scenario.
         :param bool slice: whether to slice the profiles by the Scenario's time range.
+        :raises ValueError: if the input format is *'npy'* and the profile of the
+            ``profile_as`` scenario is not listed in its manifest.
         """
-        file_name = f"{kind}.csv"
+        file_name = f"{kind}.{self.input_format}"
         dest_path = "/".join([self.REL_TMP_DIR, file_name])
         if profile_as is None:
-            tp = TransformProfile(self._scenario_info, self.grid, self.ct, slice)
-            profile = tp.get_profile(kind)
-            with self._data_access.write(dest_path, save_local=False) as f:
-                profile.to_csv(f)
+            tp = TransformProfile(
+                self._scenario_info, self.grid, self.ct, slice, readonly=True
+            )
+            with tempfile.TemporaryFile() as tmp:
+                if self.input_format == "csv":
+                    write_profile(tp.iter_profile(kind), tmp)
+                else:
+                    self.manifest[file_name] = _write_array(tp.get_profile(kind), tmp)
+                tmp.seek(0)
+                with self._lock:
+                    with self._data_access.write(dest_path, save_local=False) as f:
+                        shutil.copyfileobj(tmp, f)
         else:
             from_dir = self._data_access.tmp_folder(profile_as)
             src = "/".join([from_dir, file_name])
-            self._data_access.fs.copy(src, dest_path)
+            with self._lock:
+                if self.input_format != "csv":
+                    entry = self._get_manifest_entry(from_dir, file_name)
+                    self.manifest[file_name] = entry
+                self._data_access.fs.copy(src, dest_path)
+
+    def _get_manifest_entry(self, from_dir, file_name):
+        """Get the entry of a profile in the manifest of another scenario.
+
+        :param str from_dir: input directory of the other scenario.
+        :param str file_name: file name of the profile.
+        :return: (*dict*) -- entry of the profile in the manifest.
+        :raises ValueError: if the other scenario has no manifest listing the
+            profile, e.g. if its input was prepared in csv format.
+        """
+        manifest_path = "/".join([from_dir, "manifest.json"])
+        files = {}
+        if self._data_access.fs.exists(manifest_path):
+            with self._data_access.fs.open(manifest_path) as f:
+                files = json.load(f)["files"]
+        if file_name not in files:
+            raise ValueError(
+                f"{file_name} is not listed in the manifest of {from_dir}, the input "
+                f"of profile_as must be prepared in {self.input_format} format"
+            )
+        return files[file_name]
+
+    def prepare_profiles(self, kinds, profile_as=None, max_workers=None):
+        """Prepares several profiles concurrently, see :meth:`prepare_profile`. The
+        download and the transformation of a profile overlap with the ones of the other
+        profiles and with the uploads.
+
+        The workers share the data access object, i.e. a single ssh connection whose
+        sftp channel does not support concurrent requests. Hence, each profile is
+        transformed into a local temporary file and the operations on the data store
+        are serialized. Each worker builds its own
+        :class:`powersimdata.input.transform_profile.TransformProfile`, the raw
+        profiles are downloaded from blob storage and the caches they go through are
+        guarded by locks.
+
+        :param list kinds: profiles to prepare.
+        :param int/str profile_as: if given, copy profiles from this scenario.
+        :param int max_workers: maximum number of profiles prepared at the same time.
+            Default to the *PREPARE_MAX_WORKERS* setting if any, otherwise to the
+            default of :class:`concurrent.futures.ThreadPoolExecutor`.
+        :return: (*dict*) -- time spent preparing each profile, in seconds.
+        """
+        if max_workers is None:
+            max_workers = server_setup.PREPARE_MAX_WORKERS
+        if max_workers is not None:
+            max_workers = int(max_workers)
+
+        def _prepare(kind):
+            start = time.perf_counter()
+            self.prepare_profile(kind, profile_as)
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {kind: executor.submit(_prepare, kind) for kind in kinds}
+        return {kind: future.result() for kind, future in futures.items()}
+
+    def prepare_manifest(self):
+        """Write the manifest of the binary simulation input. It must be called once
+        the profiles and the grid are prepared.
+        """
+        manifest = {"format": self.input_format, "version": 1, "files": self.manifest}
+        dest_path = "/".join([self.REL_TMP_DIR, "manifest.json"])
+        with self._data_access.write(dest_path, save_local=False) as f:
+            f.write(json.dumps(manifest, indent=2).encode())
 
     def prepare_demand_flexibility_parameters(self):
         """Prepares demand_flexibility parameters file for simulation."""
@@ -274,3 +399,42 @@ class SimulationInput:
         dest_path = "/".join([self.REL_TMP_DIR, "demand_flexibility_parameters.csv"])
         with self._data_access.write(dest_path, save_local=False) as f:
             params.to_csv(f)
+
+
+class _HashingWriter:
+    """Write to a file object while computing the sha256 checksum of the content.
+
+    :param io.IOBase f: an open file object.
+    """
+
+    def __init__(self, f):
+        """Constructor."""
+        self._f = f
+        self._hash = hashlib.sha256()
+
+    def write(self, data):
+        self._hash.update(data)
+        return self._f.write(data)
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def _write_array(profile, f):
+    """Write profile values as a NumPy array in *.npy* format.
+
+    :param pandas.DataFrame profile: profile to write.
+    :param io.IOBase f: an open file object.
+    :return: (*dict*) -- entry of the profile in the manifest.
+    """
+    values = np.ascontiguousarray(profile.to_numpy())
+    writer = _HashingWriter(f)
+    np.save(writer, values, allow_pickle=False)
+    return {
+        "shape": list(values.shape),
+        "dtype": values.dtype.str,
+        "index_name": profile.index.name,
+        "index": profile.index.strftime("%Y-%m-%d %H:%M:%S").tolist(),
+        "columns": profile.columns.tolist(),
+        "sha256": writer.hexdigest(),
+    }
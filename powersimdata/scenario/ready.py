@@ -4,6 +4,7 @@ from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import distribute_demand_from_zones_to_buses
 from powersimdata.input.transform_profile import TransformProfile
 from powersimdata.scenario.state import State
+from powersimdata.utility.helpers import readonly_view
 
 
 class Ready(State):
@@ -25,18 +26,27 @@ class Ready(State):
         """Constructor."""
         super().__init__(scenario)
 
-    def get_ct(self):
+    def get_ct(self, readonly=False):
         """Returns change table.
 
+        :param bool readonly: whether to return a read only view of the change table
+            instead of a deep copy.
         :return: (*dict*) -- change table.
         """
+        if readonly:
+            return readonly_view(self.ct)
         return copy.deepcopy(self.ct)
 
-    def get_grid(self):
+    def get_grid(self, readonly=False):
         """Returns Grid.
 
+        :param bool readonly: whether to return a read only view of the grid instead
+            of a deep copy. The data frames of the view share memory with the grid of
+            the scenario and cannot be modified in place.
         :return: (*powersimdata.input.grid.Grid*) -- a Grid object.
         """
+        if readonly:
+            return readonly_view(self.grid)
         return copy.deepcopy(self.grid)
 
     def get_base_grid(self):
@@ -55,7 +65,9 @@ class Ready(State):
         :param str kind: either *'demand'*, *'hydro'*, *'solar'*, *'wind'*.
         :return: (*pandas.DataFrame*) -- profile.
         """
-        profile = TransformProfile(self._scenario_info, self.get_grid(), self.get_ct())
+        profile = TransformProfile(
+            self._scenario_info, self.grid, self.ct, readonly=True
+        )
         return profile.get_profile(kind)
 
     def get_hydro(self):
@@ -86,7 +98,7 @@ class Ready(State):
         :return: (*pandas.DataFrame*) -- profile.
         :raises ValueError: if ``gentype`` is invalid or not in the grid.
         """
-        grid = self.get_grid()
+        grid = self.get_grid(readonly=True)
         profile2gen = grid.model_immutables.plants["group_profile_resources"]
         gen2profile = {g: p for p, gs in profile2gen.items() for g in gs}
         if gentype in set(gen2profile):
@@ -110,11 +122,13 @@ class Ready(State):
             print("Only original profile is accessible before scenario is complete")
         return self.get_profile("demand")
 
-    def get_bus_demand(self):
+    def get_bus_demand(self, dtype=None):
         """Returns demand profiles, by bus.
 
+        :param str dtype: data type of the demand, e.g. *'float32'*. Default to the
+            data type of the demand profile.
         :return: (*pandas.DataFrame*) -- data frame of demand (hour, bus).
         """
         zone_demand = self.get_demand()
-        grid = self.get_grid()
-        return distribute_demand_from_zones_to_buses(zone_demand, grid.bus)
+        grid = self.get_grid(readonly=True)
+        return distribute_demand_from_zones_to_buses(zone_demand, grid.bus, dtype)
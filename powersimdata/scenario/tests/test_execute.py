@@ -0,0 +1,132 @@
+import hashlib
+import io
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from powersimdata.data_access.data_access import TempDataAccess
+from powersimdata.scenario import execute
+from powersimdata.scenario.execute import SimulationInput, _write_array
+
+
+def test_prepare_profiles_as():
+    data_access = TempDataAccess()
+    kinds = ["demand", "hydro", "solar", "wind"]
+    src_dir = data_access.tmp_folder(1)
+    data_access.fs.makedirs(src_dir)
+    for kind in kinds:
+        data_access.fs.writetext(f"{src_dir}/{kind}.csv", kind)
+
+    si = SimulationInput(data_access, {"id": "2"}, None, {})
+    data_access.fs.makedirs(si.REL_TMP_DIR)
+    timing = si.prepare_profiles(kinds, profile_as=1, max_workers=2)
+    assert list(timing) == kinds
+    for kind in kinds:
+        assert data_access.fs.readtext(f"{si.REL_TMP_DIR}/{kind}.csv") == kind
+
+
+def test_prepare_profiles_serializes_writes(monkeypatch):
+    class FakeTransformProfile:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def iter_profile(self, kind):
+            for i in range(2):
+                time.sleep(0.01)
+                yield pd.DataFrame(
+                    {kind: [float(i)]},
+                    index=pd.date_range(f"2016-01-0{i + 1}", periods=1, name="UTC"),
+                )
+
+    data_access = TempDataAccess()
+    write = data_access.write
+    lock = threading.Lock()
+    active = []
+    overlaps = []
+
+    @contextmanager
+    def tracking_write(*args, **kwargs):
+        with lock:
+            active.append(1)
+            overlaps.append(len(active))
+        try:
+            with write(*args, **kwargs) as f:
+                time.sleep(0.01)
+                yield f
+        finally:
+            with lock:
+                active.pop()
+
+    monkeypatch.setattr(execute, "TransformProfile", FakeTransformProfile)
+    monkeypatch.setattr(data_access, "write", tracking_write)
+    kinds = ["demand", "hydro", "solar", "wind"]
+    si = SimulationInput(data_access, {"id": "1"}, None, {})
+    data_access.fs.makedirs(si.REL_TMP_DIR)
+    si.prepare_profiles(kinds, max_workers=4)
+    assert overlaps == [1] * len(kinds)
+    for kind in kinds:
+        text = data_access.fs.readtext(f"{si.REL_TMP_DIR}/{kind}.csv")
+        assert text.splitlines() == [
+            f"UTC,{kind}",
+            "2016-01-01 00:00:00,0.0",
+            "2016-01-02 00:00:00,1.0",
+        ]
+
+
+def test_write_array():
+    profile = pd.DataFrame(
+        np.arange(12, dtype=float).reshape(4, 3),
+        index=pd.date_range("2016-01-01", periods=4, freq="H", name="UTC"),
+        columns=[101, 102, 103],
+    )
+    f = io.BytesIO()
+    entry = _write_array(profile, f)
+
+    assert entry["sha256"] == hashlib.sha256(f.getvalue()).hexdigest()
+    assert entry["shape"] == [4, 3]
+    assert entry["columns"] == [101, 102, 103]
+    assert entry["index"][-1] == "2016-01-01 03:00:00"
+    f.seek(0)
+    np.testing.assert_array_equal(np.load(f), profile.to_numpy())
+
+
+def test_prepare_manifest_with_profiles_as():
+    data_access = TempDataAccess()
+    src = SimulationInput(data_access, {"id": "1"}, None, {}, "npy")
+    data_access.fs.makedirs(src.REL_TMP_DIR)
+    with data_access.fs.open(f"{src.REL_TMP_DIR}/demand.npy", "wb") as f:
+        profile = pd.DataFrame([[1.0]], index=pd.DatetimeIndex(["2016-01-01"]))
+        src.manifest["demand.npy"] = _write_array(profile, f)
+    src.prepare_manifest()
+
+    si = SimulationInput(data_access, {"id": "2"}, None, {}, "npy")
+    data_access.fs.makedirs(si.REL_TMP_DIR)
+    si.prepare_profile("demand", profile_as=1)
+    si.prepare_manifest()
+    with data_access.fs.open(f"{si.REL_TMP_DIR}/manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["format"] == "npy"
+    assert manifest["files"] == src.manifest
+
+
+def test_prepare_profile_as_without_manifest():
+    data_access = TempDataAccess()
+    src_dir = data_access.tmp_folder(1)
+    data_access.fs.makedirs(src_dir)
+    data_access.fs.writetext(f"{src_dir}/demand.csv", "demand")
+
+    si = SimulationInput(data_access, {"id": "2"}, None, {}, "npy")
+    data_access.fs.makedirs(si.REL_TMP_DIR)
+    with pytest.raises(ValueError, match="manifest"):
+        si.prepare_profile("demand", profile_as=1)
+    assert not data_access.fs.exists(f"{si.REL_TMP_DIR}/demand.npy")
+
+
+def test_simulation_input_format():
+    with pytest.raises(ValueError):
+        SimulationInput(TempDataAccess(), {"id": "1"}, None, {}, "parquet")
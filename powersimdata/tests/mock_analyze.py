@@ -94,20 +94,23 @@ class MockAnalyze:
         self.hydro = _ensure_ts_index(hydro)
         self.name = "analyze"
 
-    def get_congl(self):
+    def get_congl(self, readonly=False):
         """Get congl.
+        :param bool readonly: not used.
         :return: (pandas.DataFrame) -- dummy congl
         """
         return self.congl
 
-    def get_congu(self):
+    def get_congu(self, readonly=False):
         """Get congu.
+        :param bool readonly: not used.
         :return: (pandas.DataFrame) -- dummy congu
         """
         return self.congu
 
-    def get_ct(self):
+    def get_ct(self, readonly=False):
         """Get ct.
+        :param bool readonly: not used.
         :return: (Dict) -- dummy ct
         """
         return self.ct
@@ -124,8 +127,9 @@ class MockAnalyze:
         """
         return self.bus_demand
 
-    def get_grid(self):
+    def get_grid(self, readonly=False):
         """Get grid.
+        :param bool readonly: not used.
         :return: (MockGrid) -- mock grid
         """
         return self.grid
@@ -148,8 +152,9 @@ class MockAnalyze:
         """
         return self.dcline_pf
 
-    def get_pg(self):
+    def get_pg(self, readonly=False):
         """Get PG.
+        :param bool readonly: not used.
         :return: (pandas.DataFrame) -- dummy pg
         """
         return self.pg
@@ -1,7 +1,10 @@
+from contextlib import nullcontext
+
 import numpy as np
 import pandas as pd
 
 from powersimdata.input.grid import Grid
+from powersimdata.utility.helpers import readonly_view
 
 
 class MockProfileInput:
@@ -48,12 +51,26 @@ class MockProfileInput:
         }
         self._profiles.update(self._get_demand_flexibility())
 
-    def get_data(self, scenario_info, field_name):
+    def get_data(
+        self,
+        scenario_info,
+        field_name,
+        readonly=False,
+        columns=None,
+        start=None,
+        end=None,
+        cache=True,
+    ):
         """Returns fake profile data.
 
         :param dict scenario_info: not used.
         :param str field_name: Can be any of *'demand'*, *'hydro'*, *'solar'*, *'wind'*,
             *'demand_flexibility_up'*, or *'demand_flexibility_dn'*.
+        :param bool readonly: whether a read only view of the profile is returned.
+        :param list columns: columns of the profile to return. Default to all columns.
+        :param str start: first timestamp to return. Default to the first timestamp.
+        :param str end: last timestamp to return. Default to the last timestamp.
+        :param bool cache: not used.
         :return: (*pandas.DataFrame*) -- fake profile data
         """
         profile = self._profiles.get(field_name)
@@ -61,7 +78,18 @@ class MockProfileInput:
         if profile is None:
             raise ValueError(f"No profile specified for {field_name}!")
 
-        return profile
+        if start is not None or end is not None:
+            profile = profile.loc[start:end]
+        if columns is not None:
+            profile = profile[columns]
+        return readonly_view(profile) if readonly else profile
+
+    def streaming(self):
+        """Returns a context that does nothing.
+
+        :return: (*contextlib.nullcontext*) -- context manager.
+        """
+        return nullcontext()
 
     def _get_demand(self):
         """Returns fake demand data.
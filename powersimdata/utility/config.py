@@ -30,6 +30,14 @@ class Config:
     INPUT_DIR = ("data", "input")
     OUTPUT_DIR = ("data", "output")
     LOCAL_DIR = os.path.join(Path.home(), "ScenarioData", "")
+    MEMORY_CACHE_MAX_BYTES = os.getenv("MEMORY_CACHE_MAX_BYTES")
+    OUTPUT_CACHE_MAX_BYTES = os.getenv("OUTPUT_CACHE_MAX_BYTES", 2 * 1024**3)
+    PROFILE_STORE_DTYPE = os.getenv("PROFILE_STORE_DTYPE")
+    PREPARE_MAX_WORKERS = os.getenv("PREPARE_MAX_WORKERS")
+    TRANSFER_MAX_WORKERS = os.getenv("TRANSFER_MAX_WORKERS")
+    DOWNLOAD_CACHE_MAX_BYTES = os.getenv("DOWNLOAD_CACHE_MAX_BYTES")
+    DOWNLOAD_CACHE_TTL = os.getenv("DOWNLOAD_CACHE_TTL")
+    LISTING_CACHE_TTL = os.getenv("LISTING_CACHE_TTL")
 
 
 @dataclass(frozen=True)
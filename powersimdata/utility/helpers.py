@@ -1,44 +1,279 @@
 import copy
+import hashlib
 import importlib
 import os
 import sys
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
 
 
 class MemoryCache:
     """Wrapper around a dict object that exposes a cache interface. Users should
     create a separate instance for each distinct use case.
+
+    Cached values are copied when they are added. They are copied again when they
+    are retrieved, unless a read only view is requested, see :func:`readonly_view`.
+
+    When a budget is given, the least recently used values are evicted once the
+    estimated memory footprint of the cache exceeds it. The cache can be shared by
+    several threads.
+
+    :param int/float/str max_bytes: maximum size of the cache in bytes, e.g. *'1e9'*.
+        Default to None, i.e. unbounded.
+    :raises ValueError: if ``max_bytes`` is not a non negative number.
     """
 
-    def __init__(self):
+    def __init__(self, max_bytes=None):
         """Constructor"""
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._size = {}
+        self._lock = threading.RLock()
+        self.max_bytes = None if max_bytes is None else _parse_bytes(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self):
+        """Estimated memory footprint of the cached values.
 
-    def put(self, key, obj):
-        """Add or set the value for the given key.
+        :return: (*int*) -- size in bytes
+        """
+        with self._lock:
+            return sum(self._size.values())
+
+    def put(self, key, obj, copy_value=True):
+        """Add or set the value for the given key. If the cache is bounded, the least
+        recently used values are evicted to make room for the new one. A value larger
+        than the budget is not cached.
 
         :param tuple key: a tuple used to lookup the cached value
         :param Any obj: the object to cache
+        :param bool copy_value: whether to cache a copy of the object. Only disable it
+            if the object is not modified after it is cached.
         """
-        self._cache[key] = copy.deepcopy(obj)
+        size = get_size(obj)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self._remove(key)
+            return
+        value = copy.deepcopy(obj) if copy_value else obj
+        with self._lock:
+            self._remove(key)
+            self._cache[key] = value
+            self._size[key] = size
+            if self.max_bytes is not None:
+                while self.nbytes > self.max_bytes:
+                    self._remove(next(iter(self._cache)))
+                    self.evictions += 1
 
-    def get(self, key):
+    def get(self, key, readonly=False):
         """Retrieve the value associated with key if it exists.
 
         :param tuple key: the cache key
+        :param bool readonly: whether to return a read only view of the cached value
+            instead of a deep copy.
         :return: (*Any* or *NoneType*) -- the cached value if found, or None
         """
-        if key in self._cache.keys():
-            return copy.deepcopy(self._cache[key])
+        with self._lock:
+            if key not in self._cache:
+                self.misses += 1
+                return
+            self.hits += 1
+            self._cache.move_to_end(key)
+            value = self._cache[key]
+        if readonly:
+            return readonly_view(value)
+        return copy.deepcopy(value)
+
+    def _remove(self, key):
+        """Remove the value associated with key if it exists.
+
+        :param tuple key: the cache key
+        """
+        with self._lock:
+            self._cache.pop(key, None)
+            self._size.pop(key, None)
+
+    def remove(self, prefix):
+        """Remove the values whose key starts with the given elements, e.g. all the
+        values cached for a given scenario.
+
+        :param tuple prefix: first elements of the keys to remove.
+        """
+        prefix = tuple(prefix)
+        with self._lock:
+            for key in [k for k in self._cache if k[: len(prefix)] == prefix]:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all values and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._size.clear()
+            self.hits = self.misses = self.evictions = 0
 
     def list_keys(self):
-        """Return and print the current cache keys.
+        """Return and print the current cache keys, from least to most recently used.
 
         :return: (*list*) -- the list of cache keys
         """
-        keys = list(self._cache.keys())
+        with self._lock:
+            keys = list(self._cache.keys())
         print(keys)
         return keys
 
+    def stats(self):
+        """Return usage statistics of the cache.
+
+        :return: (*dict*) -- number of entries, estimated size in bytes, budget in
+            bytes and hit/miss/eviction counters.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _parse_bytes(value):
+    """Parse a number of bytes, e.g. a budget read from the environment.
+
+    :param int/float/str value: number of bytes, possibly in scientific notation,
+        e.g. *'1e9'*.
+    :return: (*int*) -- number of bytes.
+    :raises ValueError: if the value is not a non negative number.
+    """
+    try:
+        nbytes = int(float(value))
+    except (TypeError, ValueError):
+        nbytes = -1
+    if nbytes < 0:
+        raise ValueError(
+            f"budget must be a non negative number of bytes, got {value!r}"
+        )
+    return nbytes
+
+
+def get_size(obj):
+    """Estimate the memory footprint of an object. Data frames and series are measured
+    with ``memory_usage(deep=True)``, or ``memory_usage(deep=False)`` if some of their
+    objects cannot be measured (e.g. types), arrays with ``nbytes``. Containers and
+    instances with a ``__dict__`` are measured recursively. Objects referenced several
+    times are only counted once.
+
+    :param Any obj: object to measure.
+    :return: (*int*) -- size in bytes.
+    """
+    return _get_size(obj, set())
+
+
+def _get_size(obj, seen):
+    """Recursively estimate the memory footprint of an object.
+
+    :param Any obj: object to measure.
+    :param set seen: ids of the objects already measured.
+    :return: (*int*) -- size in bytes.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        try:
+            usage = obj.memory_usage(index=True, deep=True)
+        except TypeError:
+            # Objects such as types cannot report their own size
+            usage = obj.memory_usage(index=True, deep=False)
+        return int(np.sum(usage))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_get_size(k, seen) + _get_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_get_size(v, seen) for v in obj)
+    elif hasattr(obj, "__dict__") and not isinstance(
+        obj, (type, types.ModuleType, types.FunctionType, types.MethodType)
+    ):
+        size += _get_size(obj.__dict__, seen)
+    return size
+
+
+def readonly_view(obj):
+    """Create a read only view of an object. Containers (dict, list, tuple, set and
+    instances with a ``__dict__``) are copied, such that adding, removing or
+    reassigning items/attributes of the view does not affect the original object.
+    Numerical data in data frames, series and arrays is not copied, it shares its
+    underlying buffers with the original object, with the difference that the buffers
+    of the view are flagged as read only. Any in place modification of the data through
+    the view will raise a ValueError, use ``copy()`` to get a writable copy of a data
+    frame. Columns of object dtype (e.g. strings) are shallow copied.
+
+    :param Any obj: object to create a view of.
+    :return: (*Any*) -- the read only view.
+    """
+    return _readonly_view(obj, {})
+
+
+def _readonly_view(obj, memo):
+    """Recursively create a read only view of an object.
+
+    :param Any obj: object to create a view of.
+    :param dict memo: views already created, keyed by the id of the original object.
+        Used to preserve aliasing between members of the original object.
+    :return: (*Any*) -- the read only view.
+    """
+    if id(obj) in memo:
+        return memo[id(obj)]
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        view = obj.copy(deep=False)
+        for block in view._mgr.blocks:
+            if not isinstance(block.values, np.ndarray):
+                continue
+            if block.values.dtype == object:
+                # Some pandas routines require writable object buffers. Copying an
+                # object array only copies references to the underlying objects.
+                block.values = block.values.copy()
+            else:
+                values = block.values.view()
+                values.flags.writeable = False
+                block.values = values
+    elif isinstance(obj, np.ndarray):
+        view = obj.view()
+        view.flags.writeable = False
+    elif isinstance(obj, dict):
+        view = copy.copy(obj)
+        memo[id(obj)] = view
+        for k, v in obj.items():
+            view[k] = _readonly_view(v, memo)
+    elif isinstance(obj, list):
+        view = copy.copy(obj)
+        memo[id(obj)] = view
+        view[:] = [_readonly_view(v, memo) for v in obj]
+    elif isinstance(obj, tuple):
+        items = [_readonly_view(v, memo) for v in obj]
+        view = obj._make(items) if hasattr(obj, "_make") else tuple(items)
+    elif isinstance(obj, set):
+        view = copy.copy(obj)
+    elif hasattr(obj, "__dict__") and not isinstance(
+        obj, (type, types.ModuleType, types.FunctionType, types.MethodType)
+    ):
+        view = copy.copy(obj)
+        memo[id(obj)] = view
+        for k, v in obj.__dict__.items():
+            view.__dict__[k] = _readonly_view(v, memo)
+    else:
+        return obj
+    memo[id(obj)] = view
+    return view
+
 
 def cache_key(*args, **kwargs):
     """Creates a cache key from the given args. The user should ensure that the
@@ -114,3 +349,18 @@ def _check_import(package_name):
             "It may be an optional powersimdata requirement."
         )
         raise ImportError(err_msg)
+
+
+def get_checksum(*paths, chunk_size=2**22):
+    """Compute the sha256 checksum of the content of one or several files.
+
+    :param str \\*paths: path to file(s).
+    :param int chunk_size: number of bytes read at once.
+    :return: (*str*) -- checksum.
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+    return h.hexdigest()
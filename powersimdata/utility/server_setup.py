@@ -13,6 +13,14 @@ OUTPUT_DIR = config.OUTPUT_DIR
 LOCAL_DIR = config.LOCAL_DIR
 MODEL_DIR = config.MODEL_DIR
 ENGINE_DIR = config.ENGINE_DIR
+MEMORY_CACHE_MAX_BYTES = config.MEMORY_CACHE_MAX_BYTES
+OUTPUT_CACHE_MAX_BYTES = config.OUTPUT_CACHE_MAX_BYTES
+PROFILE_STORE_DTYPE = config.PROFILE_STORE_DTYPE
+PREPARE_MAX_WORKERS = config.PREPARE_MAX_WORKERS
+TRANSFER_MAX_WORKERS = config.TRANSFER_MAX_WORKERS
+DOWNLOAD_CACHE_MAX_BYTES = config.DOWNLOAD_CACHE_MAX_BYTES
+DOWNLOAD_CACHE_TTL = config.DOWNLOAD_CACHE_TTL
+LISTING_CACHE_TTL = config.LISTING_CACHE_TTL
 DEPLOYMENT_MODE = get_deployment_mode()
 BLOB_TOKEN_RO = "?sv=2021-06-08&ss=b&srt=co&sp=rl&se=2050-08-06T01:31:08Z&st=2022-08-05T17:31:08Z&spr=https&sig=ORHiRQQCocyaHXV2phhSN92GFhRnaHuGOecskxsmG3U%3D"
 BLOB_KEY_NAME = "BLOB_ACCOUNT_KEY_V2"
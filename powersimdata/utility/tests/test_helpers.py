@@ -1,4 +1,16 @@
-from powersimdata.utility.helpers import MemoryCache, PrintManager, cache_key
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from powersimdata.utility.helpers import (
+    MemoryCache,
+    PrintManager,
+    cache_key,
+    get_size,
+    readonly_view,
+)
 
 
 def test_print_is_disabled(capsys):
@@ -68,3 +80,99 @@ def test_mem_cache_put_version_never_changes():
     assert "key1" in cache.get(key)
     assert "key2" not in cache.get(key)
     assert "key2" in obj
+
+
+def test_mem_cache_get_readonly_shares_data():
+    cache = MemoryCache()
+    key = cache_key("foo", 4)
+    cache.put(key, {"df": pd.DataFrame({"a": [1.0, 2.0]}), "ids": [1, 2]})
+    view1 = cache.get(key, readonly=True)
+    view2 = cache.get(key, readonly=True)
+    assert np.shares_memory(view1["df"]["a"].values, view2["df"]["a"].values)
+    with pytest.raises(ValueError):
+        view1["df"].loc[0, "a"] = 42
+    view1["ids"].append(3)
+    view1["df"] = view1["df"].copy()
+    view1["df"].loc[0, "a"] = 42
+    assert cache.get(key)["ids"] == [1, 2]
+    assert cache.get(key)["df"].loc[0, "a"] == 1
+
+
+def test_readonly_view_preserves_aliasing():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    obj = SimpleNamespace(before=df, after=df, table={"before": df})
+    view = readonly_view(obj)
+    assert view is not obj
+    assert view.before is view.after
+    assert view.table["before"] is view.before
+    with pytest.raises(ValueError):
+        view.before.loc[0, "a"] = 42
+    df.loc[0, "a"] = 42
+    assert view.before.loc[0, "a"] == 42
+
+
+def test_mem_cache_evicts_least_recently_used():
+    df = pd.DataFrame({"a": np.zeros(1000)})
+    size = get_size(df)
+    cache = MemoryCache(max_bytes=2.5 * size)
+    cache.put(cache_key("foo"), df)
+    cache.put(cache_key("bar"), df)
+    cache.get(cache_key("foo"))
+    cache.put(cache_key("baz"), df)
+    assert cache.list_keys() == [("foo",), ("baz",)]
+    assert cache.get(cache_key("bar")) is None
+    assert cache.stats() == {
+        "entries": 2,
+        "nbytes": 2 * size,
+        "max_bytes": int(2.5 * size),
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_mem_cache_skips_value_larger_than_budget():
+    df = pd.DataFrame({"a": np.zeros(1000)})
+    cache = MemoryCache(max_bytes=get_size(df) - 1)
+    cache.put(cache_key("foo"), df)
+    assert cache.get(cache_key("foo")) is None
+    assert cache.nbytes == 0
+
+
+def test_mem_cache_budget_from_string():
+    assert MemoryCache(max_bytes="1e9").max_bytes == 10**9
+    assert MemoryCache(max_bytes="2048").max_bytes == 2048
+    for max_bytes in ("2GiB", "-1"):
+        with pytest.raises(ValueError, match="number of bytes"):
+            MemoryCache(max_bytes=max_bytes)
+
+
+def test_get_size_counts_shared_objects_once():
+    df = pd.DataFrame({"a": np.zeros(1000)})
+    assert get_size({"before": df, "after": df}) < 2 * get_size(df)
+
+
+def test_mem_cache_put_frame_of_types():
+    df = pd.DataFrame({"typ": [str, float]})
+    assert get_size(df) >= get_size(df["typ"]) > 0
+    cache = MemoryCache()
+    cache.put(cache_key("foo"), {"types": df})
+    assert cache.get(cache_key("foo"))["types"].equals(df)
+
+
+def test_mem_cache_remove_prefix():
+    cache = MemoryCache()
+    for key in (("1", "PG"), ("1", "PF"), ("2", "PG")):
+        cache.put(key, 0)
+    cache.remove(("1",))
+    assert cache.list_keys() == [("2", "PG")]
+
+
+def test_mem_cache_put_without_copy():
+    df = pd.DataFrame({"a": [1, 2]})
+    cache = MemoryCache()
+    cache.put(cache_key("foo"), df, copy_value=False)
+    cache.put(cache_key("bar"), df)
+    df.loc[0, "a"] = 42
+    assert cache.get(cache_key("foo")).loc[0, "a"] == 42
+    assert cache.get(cache_key("bar")).loc[0, "a"] == 1